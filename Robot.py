@@ -5,6 +5,8 @@ import sys
 import os
 from string import Template
 from .commands import *
+from .command_helper.worker_client import stop_worker_client
+from .command_helper.job_scheduler import stop_job_scheduler
 
 if sys.version_info < (3, 3):
     raise RuntimeError('Plugin only works with Sublime Text 3')
@@ -24,3 +26,8 @@ def plugin_loaded():
             menu.write(template.safe_substitute({
                 'package_folder': os.path.basename(package_folder)
             }))
+
+
+def plugin_unloaded():
+    stop_job_scheduler()
+    stop_worker_client()
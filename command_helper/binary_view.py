@@ -0,0 +1,191 @@
+import mmap
+import re
+import struct
+from os import path, stat, remove
+try:
+    from keyword_search import is_searchable
+    from metrics import get_metrics
+    from parser_utils.util import write_file
+except:
+    from .keyword_search import is_searchable
+    from .metrics import get_metrics
+    from ..dataparser.parser_utils.util import write_file
+
+VIEW_BINARY_NAME = 'current_view.bin'
+MAGIC = b'RFCV'
+VERSION = 1
+# Magic, version, keyword count and offsets of: records, search block and
+# string pool.
+HEADER = struct.Struct('<4sIIIII')
+# Offset and length of: keyword name, arguments and object name.
+RECORD = struct.Struct('<IIIIII')
+ARG_SEPARATOR = u'\x1f'
+ID_WIDTH = 8
+# Opened binary views by path. Value is tuple of: (mtime, size, inode) and
+# view. File is replaced by renaming, which changes the inode.
+_BINARY_VIEW_CACHE = {}
+
+
+def binary_view_path(view_path):
+    """Returns path to the binary view next to the current_view.json"""
+    return path.join(path.dirname(view_path), VIEW_BINARY_NAME)
+
+
+def write_binary_view(bin_path, completions):
+    """Writes the keyword completions in binary format to the bin_path
+
+    ``completions`` -- List of keyword name, arguments and object name.
+
+    File starts with a header, which is followed by fixed width records
+    and a search block. Records contain the offset and length of the
+    keyword name, arguments and object name in the string pool, which
+    is at the end of the file. Search block contains a line for each
+    keyword: the keyword position as hex and the keyword name in lower
+    case. Keywords can therefore be searched and read from the file
+    without reading the whole file.
+
+    File is written to a temporary file and renamed to the bin_path, so
+    that the view, which may be in use in other thread, is not closed.
+    `get_binary_view` opens the new file when it is asked next time.
+    """
+    count = len(completions)
+    records_offset = HEADER.size
+    search_offset = records_offset + RECORD.size * count
+    search_block = []
+    for kw_id, completion in enumerate(completions):
+        search_block.append(u'{0:0{1}x}\t{2}\n'.format(
+            kw_id, ID_WIDTH, completion[0].lower()).encode('utf-8'))
+    search_block = b''.join(search_block)
+    pool = []
+    pool_offset = search_offset + len(search_block)
+    offset = pool_offset
+    records = []
+    for kw, args, object_name in completions:
+        record = []
+        for string in (kw, ARG_SEPARATOR.join(args), object_name):
+            string = string.encode('utf-8')
+            record.extend([offset, len(string)])
+            pool.append(string)
+            offset += len(string)
+        records.append(RECORD.pack(*record))
+    content = b''.join([
+        HEADER.pack(MAGIC, VERSION, count, records_offset, search_offset,
+                    pool_offset),
+        b''.join(records),
+        search_block,
+        b''.join(pool)
+    ])
+    try:
+        write_file(bin_path, content, 'wb')
+    except OSError:
+        # Windows does not allow replacing a memory mapped file
+        close_binary_view(bin_path)
+        write_file(bin_path, content, 'wb')
+
+
+def remove_binary_view(bin_path):
+    """Removes the binary view without closing the view in use"""
+    cached = _BINARY_VIEW_CACHE.pop(bin_path, None)
+    if not path.exists(bin_path):
+        return
+    try:
+        remove(bin_path)
+    except OSError:
+        # Windows does not allow removing a memory mapped file
+        if cached:
+            cached[1].close()
+        remove(bin_path)
+
+
+def get_binary_view(view_path):
+    """Returns the BinaryView next to the view_path or None
+
+    Binary view is opened again only if the file is changed. The old
+    view is not closed, because it may be in use in other thread, it is
+    closed when it is garbage collected.
+    """
+    bin_path = binary_view_path(view_path)
+    try:
+        b_stat = stat(bin_path)
+    except OSError:
+        _BINARY_VIEW_CACHE.pop(bin_path, None)
+        return None
+    key = (b_stat.st_mtime, b_stat.st_size, b_stat.st_ino)
+    cached = _BINARY_VIEW_CACHE.get(bin_path)
+    if cached and cached[0] == key:
+        get_metrics().hit('binary_view')
+        return cached[1]
+    get_metrics().hit('binary_view', False)
+    binary_view = BinaryView(bin_path)
+    _BINARY_VIEW_CACHE[bin_path] = (key, binary_view)
+    return binary_view
+
+
+def close_binary_view(bin_path):
+    """Closes the cached binary view, so that the file can be replaced"""
+    cached = _BINARY_VIEW_CACHE.pop(bin_path, None)
+    if cached:
+        cached[1].close()
+
+
+class BinaryView(object):
+    """Keyword completions of the current view from the binary file
+
+    The file is memory mapped and keywords are read from the file only
+    when they are accessed. Can be used like the list of keyword
+    completions: ``view[kw_id]`` returns list of keyword name, arguments
+    and object name.
+    """
+
+    def __init__(self, bin_path):
+        with open(bin_path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, self.records_offset, \
+            self.search_offset, self.pool_offset = HEADER.unpack_from(
+                self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError('Not a binary view: {0}'.format(bin_path))
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, kw_id):
+        if not 0 <= kw_id < self.count:
+            raise IndexError(kw_id)
+        record = RECORD.unpack_from(
+            self.map, self.records_offset + RECORD.size * kw_id)
+        kw, args, object_name = [
+            self.map[offset:offset + length].decode('utf-8')
+            for offset, length in zip(record[::2], record[1::2])
+        ]
+        return [kw, args.split(ARG_SEPARATOR) if args else [], object_name]
+
+    def keywords(self):
+        return [self[kw_id] for kw_id in range(self.count)]
+
+    def search(self, prefix):
+        """Returns the positions of the keywords matching to the prefix.
+
+        Matches in the same way as the ``search_keywords``, but the
+        search block is searched directly from the memory mapped file.
+        Returns None if prefix must be searched with the regular
+        expression.
+        """
+        if not prefix:
+            return list(range(self.count))
+        if not is_searchable(prefix):
+            return None
+        pattern = b'(?m)^[0-9a-f]{' + str(ID_WIDTH).encode('ascii') + b'}\t'
+        for character in prefix.lower():
+            pattern += b'[^\n]*?' + re.escape(character.encode('ascii'))
+        return [
+            int(match.group(0)[:ID_WIDTH], 16) for match in
+            re.compile(pattern).finditer(
+                self.map, self.search_offset, self.pool_offset)
+        ]
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
@@ -1,10 +1,19 @@
 import re
-from json import load as json_load
 try:
-    from current_view import KW_COMPLETION
+    from current_view import KW_COMPLETION, get_view_data
+    from current_view import get_view_keywords
+    from binary_view import BinaryView
+    from keyword_search import SEARCH_INDEX, create_search_index
+    from keyword_search import search_keywords, rank_keywords
+    from keyword_search import OBJECT_RANK
     from db_json_settings import DBJsonSetting
 except:
-    from .current_view import KW_COMPLETION
+    from .current_view import KW_COMPLETION, get_view_data
+    from .current_view import get_view_keywords
+    from .binary_view import BinaryView
+    from .keyword_search import SEARCH_INDEX, create_search_index
+    from .keyword_search import search_keywords, rank_keywords
+    from .keyword_search import OBJECT_RANK
     from ..setting.db_json_settings import DBJsonSetting
 
 VAR_RE_STRING = '[\$\@\&]\{?\w*$'
@@ -21,7 +30,7 @@ class VarMode(object):
 
 
 def get_completion_list(view_index, prefix, text_cursor_rigt,
-                        rf_cell, object_name, one_line):
+                        rf_cell, object_name, one_line, limit=None):
     """Returns completion list for variables and keywords
 
     ``view_index`` -- Path to current_view.json in database.
@@ -29,6 +38,8 @@ def get_completion_list(view_index, prefix, text_cursor_rigt,
     ``text_cursor_rigt`` -- Text from cursor right side.
     ``rf_cell`` -- RF_CELL value from .tmPreferences
     ``object_name`` -- Library or resource object name
+    ``limit`` -- Maximum number of ranked keyword completions, all
+    matching keywords are returned in index order if not set.
 
     Entry point for getting Robot Framework completion in using
     on_query_completions API from Sublime Text 3."""
@@ -36,7 +47,7 @@ def get_completion_list(view_index, prefix, text_cursor_rigt,
         return get_var_completion_list(view_index, prefix, text_cursor_rigt)
     else:
         return get_kw_completion_list(
-            view_index, prefix, rf_cell, object_name, one_line)
+            view_index, prefix, rf_cell, object_name, one_line, limit)
 
 
 def get_kw_re_string(prefix):
@@ -52,31 +63,33 @@ def get_kw_re_string(prefix):
 
 
 def get_kw_completion_list(view_index, prefix, rf_cell,
-                           object_name, one_line):
-    def get_kw(kw, args, rf_cell, lib, match_keywords):
-        if pattern.search(kw):
-            kw = create_kw_completion_item(kw, args, rf_cell, lib, one_line)
-            match_keywords.append(kw)
-            return match_keywords
-
-    pattern = re.compile(get_kw_re_string(prefix))
+                           object_name, one_line, limit=None):
+    keywords = get_keywords(view_index)
+    if isinstance(keywords, BinaryView):
+        kw_ids = keywords.search(prefix)
+    else:
+        kw_ids = search_keywords(
+            keywords, get_search_index(view_index), prefix)
+    if kw_ids is None:
+        pattern = re.compile(get_kw_re_string(prefix))
+        kw_ids = [kw_id for kw_id, keyword in enumerate(keywords)
+                  if pattern.search(keyword[0])]
+    if object_name:
+        kw_ids = [kw_id for kw_id in kw_ids
+                  if keywords[kw_id][2] == object_name and
+                  keywords[kw_id][2] != keywords[kw_id][0]]
+    if limit:
+        kw_ids = rank_keywords(
+            keywords, kw_ids, prefix, get_object_ranks(view_index), limit)
     match_keywords = []
-    for keyword in get_keywords(view_index):
-        kw = keyword[0]
-        args = keyword[1]
-        lib = keyword[2]
-        if not object_name:
-            if pattern.search(kw):
-                kw = create_kw_completion_item(
-                    kw, args, rf_cell, lib, one_line
-                )
-                match_keywords.append(kw)
-        elif lib == object_name and lib != kw:
-            if pattern.search(kw):
-                kw = create_kw_completion_item(
-                    kw, args, rf_cell, lib, one_line
-                )
-                match_keywords.append(kw)
+    for kw_id in kw_ids:
+        kw = keywords[kw_id][0]
+        args = keywords[kw_id][1]
+        lib = keywords[kw_id][2]
+        kw = create_kw_completion_item(
+            kw, args, rf_cell, lib, one_line
+        )
+        match_keywords.append(kw)
     return match_keywords
 
 
@@ -177,12 +190,27 @@ def create_var_completion_item(var, mode):
 
 
 def _get_data(view_index):
-    with open(view_index) as f:
-        return json_load(f)
+    return get_view_data(view_index)
 
 
 def get_keywords(view_index):
-    return _get_data(view_index)[KW_COMPLETION]
+    return get_view_keywords(view_index)
+
+
+def get_search_index(view_index):
+    """Returns the keyword search index of the view.
+
+    If the view is created before the search index was added to the view,
+    search index is created and kept with the cached view data.
+    """
+    data = _get_data(view_index)
+    if SEARCH_INDEX not in data:
+        data[SEARCH_INDEX] = create_search_index(data[KW_COMPLETION])
+    return data[SEARCH_INDEX]
+
+
+def get_object_ranks(view_index):
+    return _get_data(view_index).get(OBJECT_RANK, {})
 
 
 def get_variables(view_index):
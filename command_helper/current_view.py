@@ -1,52 +1,128 @@
 import hashlib
-from os import path, listdir, mkdir
-from json import load as json_load
-from json import dump as json_dump
+from os import path, mkdir, stat
+from json import dumps as json_dumps
 try:
     from parser_utils.file_formatter import rf_table_name
-    from parser_utils.util import normalise_path
+    from parser_utils.sqlite_store import read_table, table_exists
+    from parser_utils.symbol_table import read_index
+    from parser_utils.util import normalise_path, get_index_name
+    from parser_utils.util import write_file
     from db_json_settings import DBJsonSetting
+    from keyword_search import create_search_index, SEARCH_INDEX
+    from keyword_search import get_object_rank, OBJECT_RANK
+    from binary_view import binary_view_path, write_binary_view
+    from binary_view import remove_binary_view, get_binary_view
+    from metrics import get_metrics
 except:
     from ..dataparser.parser_utils.file_formatter import rf_table_name
-    from ..dataparser.parser_utils.util import normalise_path
+    from ..dataparser.parser_utils.sqlite_store import read_table
+    from ..dataparser.parser_utils.sqlite_store import table_exists
+    from ..dataparser.parser_utils.symbol_table import read_index
+    from ..dataparser.parser_utils.util import normalise_path, get_index_name
+    from ..dataparser.parser_utils.util import write_file
     from ..setting.db_json_settings import DBJsonSetting
+    from .keyword_search import create_search_index, SEARCH_INDEX
+    from .keyword_search import get_object_rank, OBJECT_RANK
+    from .binary_view import binary_view_path, write_binary_view
+    from .binary_view import remove_binary_view, get_binary_view
+    from .metrics import get_metrics
 
 VIEW_FILE_NAME = 'current_view.json'
 VIEW_MD5 = 'view_md5'
 KW_COMPLETION = 'completion'
 VIEW_NAME = 'view_name'
+# Parsed view files by path. Value is tuple of: (mtime, size) and data.
+_VIEW_DATA_CACHE = {}
+
+
+def get_view_data(view_path):
+    """Returns the data of the current_view.json in the view_path
+
+    The data is read from the disk only when the file is changed after
+    it was last read, which is detected from the file modification time
+    and size. Completions, which are requested after every keystroke,
+    therefore do not need to read and parse the file every time.
+    """
+    try:
+        v_stat = stat(view_path)
+    except OSError:
+        _VIEW_DATA_CACHE.pop(view_path, None)
+        return CurrentView.get_data(view_path)
+    key = (v_stat.st_mtime, v_stat.st_size)
+    cached = _VIEW_DATA_CACHE.get(view_path)
+    if cached and cached[0] == key:
+        get_metrics().hit('view_data')
+        return cached[1]
+    get_metrics().hit('view_data', False)
+    data = CurrentView.get_data(view_path)
+    _VIEW_DATA_CACHE[view_path] = (key, data)
+    return data
+
+
+def get_view_keywords(view_path):
+    """Returns the keyword completions of the view in the view_path
+
+    Keyword completions are in the current_view.json or, if the view is
+    created in binary format, in the binary view.
+    """
+    data = get_view_data(view_path)
+    if KW_COMPLETION in data:
+        return data[KW_COMPLETION]
+    binary_view = get_binary_view(view_path)
+    if binary_view is None:
+        return []
+    return binary_view
+
+
+def _cache_view_data(view_path, data):
+    v_stat = stat(view_path)
+    _VIEW_DATA_CACHE[view_path] = ((v_stat.st_mtime, v_stat.st_size), data)
 
 
 class CurrentView(object):
 
-    def create_view(self, new_view, view_db, index_db):
+    def create_view(self, new_view, view_db, index_db, binary=False):
         """Changes the content of database/view_db/current_view.json
 
         ``new_view`` -- Path to the open tab in sublime.
         ``view_db``  -- Path to folder where current_view.json is.
         ``index_db`` -- Path in index database folder.
+        ``binary``   -- Save keyword completions in the binary view.
 
         When user changes between different robot framework data
         tabs, this function changes the context of the
         database/view_db/current_view.json. The current_view.json.
         is used to provide the completions for the Sublime
         on_query_completions API call.
+
+        With ``binary`` the keyword completions are saved in the
+        current_view.bin file and current_view.json contains only the
+        variables and the view details.
         """
         view_path = path.join(view_db, VIEW_FILE_NAME)
         new_view = normalise_path(new_view)
-        index_table = 'index-{0}'.format(rf_table_name(new_view))
+        own_table = rf_table_name(new_view)
+        index_table = 'index-{0}'.format(own_table)
         index_table = path.join(index_db, index_table)
-        index_data = self.get_data(index_table)
+        index_data = read_index(index_table)
         data = {}
         data[DBJsonSetting.variable] = index_data[DBJsonSetting.variable]
         data[VIEW_NAME] = new_view
         data[VIEW_MD5] = hashlib.md5(new_view.encode('utf-8')).hexdigest()
-        data[KW_COMPLETION] = self.get_keyword_completions(index_data)
+        data[OBJECT_RANK] = self.get_object_ranks(index_data, own_table)
+        data[DBJsonSetting.fingerprint] = index_data.get(
+            DBJsonSetting.fingerprint)
+        completions = self.get_keyword_completions(index_data)
         if not path.exists(path.dirname(view_path)):
             mkdir(path.dirname(view_path))
-        f = open(view_path, 'w')
-        json_dump(data, f, indent=4)
-        f.close()
+        if binary:
+            write_binary_view(binary_view_path(view_path), completions)
+        else:
+            remove_binary_view(binary_view_path(view_path))
+            data[KW_COMPLETION] = completions
+            data[SEARCH_INDEX] = create_search_index(completions)
+        write_file(view_path, json_dumps(data))
+        _cache_view_data(view_path, data)
 
     def view_in_db(self, workspace, open_tab, index_db, extension):
         workspace = path.normcase(str(workspace))
@@ -65,14 +141,7 @@ class CurrentView(object):
     def is_in_index(self, view_path, index_db):
         view_path_norm_path = normalise_path(view_path)
         index_table = 'index-{0:s}'.format(rf_table_name(view_path_norm_path))
-        try:
-            files = listdir(index_db)
-        except:
-            return False
-        if index_table in files:
-            return True
-        else:
-            return False
+        return table_exists(path.join(index_db, index_table))
 
     def get_keyword_completions(self, index_data):
         completions = []
@@ -87,11 +156,21 @@ class CurrentView(object):
                 added_object_name.append(object_name)
         return completions
 
+    def get_object_ranks(self, index_data, own_table):
+        """Returns dictionary of object name to object rank"""
+        object_ranks = {}
+        for i in index_data[DBJsonSetting.keyword]:
+            object_name = i[2]
+            rank = get_object_rank(i[3], own_table)
+            if rank < object_ranks.get(object_name, rank + 1):
+                object_ranks[object_name] = rank
+        return object_ranks
+
     def view_same(self, new_view, view_db):
         view_path = path.join(view_db, VIEW_FILE_NAME)
         if path.exists(view_path):
             new_view_md5 = hashlib.md5(new_view).hexdigest()
-            data = self.get_data(view_path)
+            data = get_view_data(view_path)
             if data[VIEW_MD5] == new_view_md5:
                 return True
             else:
@@ -99,9 +178,30 @@ class CurrentView(object):
         else:
             return False
 
+    def view_up_to_date(self, new_view, view_db, index_db):
+        """Returns True if current view is created from the new_view index
+
+        Current view is up to date when it is created for the new_view and
+        the index of the new_view has not been created again after that.
+        """
+        view_path = path.join(view_db, VIEW_FILE_NAME)
+        if not path.exists(view_path):
+            return False
+        new_view = normalise_path(new_view)
+        data = get_view_data(view_path)
+        view_md5 = hashlib.md5(new_view.encode('utf-8')).hexdigest()
+        if data.get(VIEW_MD5) != view_md5:
+            return False
+        index_table = path.join(
+            index_db, get_index_name(rf_table_name(new_view)))
+        try:
+            index_data = read_table(index_table)
+        except (IOError, ValueError):
+            return False
+        fingerprint = data.get(DBJsonSetting.fingerprint)
+        return (fingerprint is not None and
+                fingerprint == index_data.get(DBJsonSetting.fingerprint))
+
     @staticmethod
     def get_data(view_path):
-        f = open(view_path, 'r')
-        data = json_load(f)
-        f.close()
-        return data
+        return read_table(view_path)
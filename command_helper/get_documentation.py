@@ -2,16 +2,60 @@ from os import path
 try:
     from parser_utils.file_formatter import rf_table_name
     from parser_utils.util import get_index_name, normalise_path
+    from parser_utils.util import normalise_kw
+    from parser_utils.doc_store import get_documentation
+    from parser_utils.sqlite_store import table_key, find_keywords
+    from parser_utils.symbol_table import read_index
     from noralize_cell import get_data_from_json
     from db_json_settings import DBJsonSetting
     from utils.util import kw_equals_kw_candite
 except:
     from ..dataparser.parser_utils.file_formatter import rf_table_name
     from ..dataparser.parser_utils.util import get_index_name, normalise_path
+    from ..dataparser.parser_utils.util import normalise_kw
+    from ..dataparser.parser_utils.doc_store import get_documentation
+    from ..dataparser.parser_utils.sqlite_store import table_key
+    from ..dataparser.parser_utils.sqlite_store import find_keywords
+    from ..dataparser.parser_utils.symbol_table import read_index
     from ..command_helper.noralize_cell import get_data_from_json
     from ..setting.db_json_settings import DBJsonSetting
     from ..command_helper.utils.util import kw_equals_kw_candite
 
+# Keyword lookup of the last used index. Value is tuple of: index path,
+# table key and the keyword lookup.
+_KEYWORD_LOOKUP_CACHE = [None, None, None]
+
+
+def get_keyword_lookup(index_path):
+    """Returns the keyword lookup from the index in the index_path
+
+    Keyword lookup maps the normalised keyword name to the list of keyword
+    locations: object name, table name and keyword name. The lookup is
+    read from the disk only when the index is changed or other index is
+    used, because documentation and jump to keyword are used many times
+    in the same open tab.
+    """
+    key = table_key(index_path)
+    if _KEYWORD_LOOKUP_CACHE[0] == index_path and \
+            _KEYWORD_LOOKUP_CACHE[1] == key:
+        return _KEYWORD_LOOKUP_CACHE[2]
+    index_data = read_index(index_path)
+    if DBJsonSetting.keyword_lookup in index_data:
+        lookup = index_data[DBJsonSetting.keyword_lookup]
+    else:
+        lookup = create_keyword_lookup(index_data[DBJsonSetting.keyword])
+    _KEYWORD_LOOKUP_CACHE[:] = [index_path, key, lookup]
+    return lookup
+
+
+def create_keyword_lookup(keywords):
+    """Returns keyword lookup for the index created without it"""
+    lookup = {}
+    for kw, _, object_name, table_name in keywords:
+        key = normalise_kw(kw).lstrip('.')
+        lookup.setdefault(key, []).append([object_name, table_name, kw])
+    return lookup
+
 
 class GetKeywordDocumentation(object):
     """Returns the keyword documentation from the database file"""
@@ -36,13 +80,13 @@ class GetKeywordDocumentation(object):
         the database.
         """
         documentation = None
-        table_name = self.get_table_name_from_index(object_name, keyword)
-        if table_name:
-            table_path = path.join(self.table_dir, table_name)
+        location = self.get_keyword_location(object_name, keyword)
+        if location:
+            table_path = path.join(self.table_dir, location[1])
             documentation = self.get_keyword_documentation(
                 table_path,
                 object_name,
-                keyword
+                location[2]
             )
         return documentation
 
@@ -52,21 +96,33 @@ class GetKeywordDocumentation(object):
         ``keyword``     -- Keyword documentation to search from database.
         ``object_name`` -- Library or resource object name.
         """
+        location = self.get_keyword_location(object_name, keyword)
+        if location:
+            return location[1]
+
+    def get_keyword_location(self, object_name, keyword):
+        """Returns the keyword location from the index table
+
+        ``keyword``     -- Keyword documentation to search from database.
+        ``object_name`` -- Library or resource object name.
+
+        Location is list of: object name, table name and keyword name.
+        With the SQLite store, only the matching keywords are read from
+        the index.
+        """
         open_tab = normalise_path(self.open_tab)
         index_name = get_index_name(rf_table_name(open_tab))
-        index_data = get_data_from_json(
-            path.join(self.index_dir, index_name)
-        )
-        for keyword_ in index_data[DBJsonSetting.keyword]:
-            kw = keyword_[0]
-            kw_object_name = keyword_[2]
-            kw_table_name = keyword_[3]
-            if object_name and object_name == kw_object_name:
-                if kw_equals_kw_candite(keyword, kw):
-                    return kw_table_name
-            elif not object_name:
-                if kw_equals_kw_candite(keyword, kw):
-                    return kw_table_name
+        index_path = path.join(self.index_dir, index_name)
+        records = find_keywords(index_path, keyword)
+        if records is not None:
+            for kw, kw_object_name, table_name, _ in records:
+                if not object_name or object_name == kw_object_name:
+                    return [kw_object_name, table_name, kw]
+            return None
+        lookup = get_keyword_lookup(index_path)
+        for location in lookup.get(normalise_kw(keyword), []):
+            if not object_name or object_name == location[0]:
+                return location
 
     def get_keyword_documentation(self, table_path, object_name, keyword):
         """Returns the keyword documentation from the table
@@ -75,8 +131,17 @@ class GetKeywordDocumentation(object):
         ``keyword``     -- Keyword documentation to search from database.
         ``object_name`` -- Library or resource object name.
 
+        With the SQLite store, only the keyword is read from the table.
         """
+        records = find_keywords(table_path, keyword)
+        if records is not None:
+            for record in records:
+                return get_documentation(table_path, record[3])
+            return None
         keywords = get_data_from_json(table_path)[DBJsonSetting.keywords]
+        kw_key = keyword.lower().replace(' ', '_')
+        if kw_key in keywords:
+            return get_documentation(table_path, keywords[kw_key])
         for keyword_ in keywords:
             if kw_equals_kw_candite(keyword, keyword_):
-                return keywords[keyword_][DBJsonSetting.documentation]
+                return get_documentation(table_path, keywords[keyword_])
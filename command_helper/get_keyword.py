@@ -6,11 +6,13 @@ try:
     from db_json_settings import DBJsonSetting
     from noralize_cell import get_data_from_json
     from utils.util import kw_equals_kw_candite
+    from parser_utils.sqlite_store import find_keywords
 except:
     from .get_documentation import GetKeywordDocumentation
     from ..setting.db_json_settings import DBJsonSetting
     from ..command_helper.noralize_cell import get_data_from_json
     from ..command_helper.utils.util import kw_equals_kw_candite
+    from ..dataparser.parser_utils.sqlite_store import find_keywords
 
 
 class GetKeyword(object):
@@ -44,11 +46,10 @@ class GetKeyword(object):
         """
         regex = None
         file_path = None
-        table_name = self.get_doc.get_table_name_from_index(object_name,
-                                                            keyword)
-        if not table_name:
+        location = self.get_doc.get_keyword_location(object_name, keyword)
+        if not location:
             return regex, file_path
-        table_path = path.join(self.table_dir, table_name)
+        table_path = path.join(self.table_dir, location[1])
         data = get_data_from_json(table_path)
         if DBJsonSetting.file_path in data:
             file_path_table = data[DBJsonSetting.file_path]
@@ -62,23 +63,35 @@ class GetKeyword(object):
             return self.get_lib_keyword(
                 table_path,
                 object_name,
-                keyword
+                keyword,
+                location[2]
             )
 
-    def get_lib_keyword(self, table_path, object_name, keyword):
+    def get_lib_keyword(self, table_path, object_name, keyword,
+                        kw_name=None):
         regex = self.get_regex_library(keyword)
         file_path = self.get_lib_keyword_file(
             table_path,
             object_name,
-            keyword
+            kw_name or keyword
         )
         return regex, file_path
 
     def get_lib_keyword_file(self, table_path, object_name, keyword):
         """Returns file path from db where library keyword is defined"""
+        records = find_keywords(table_path, keyword)
+        if records is not None:
+            for _, kw_object_name, _, kw_data in records:
+                if not object_name or object_name == kw_object_name:
+                    return kw_data[DBJsonSetting.keyword_file]
+            return None
         data = get_data_from_json(table_path)
         table_keywords = data[DBJsonSetting.keywords]
         table_kw_object = data[DBJsonSetting.library_module]
+        kw_key = keyword.lower().replace(' ', '_')
+        if kw_key in table_keywords:
+            if not object_name or object_name == table_kw_object:
+                return table_keywords[kw_key][DBJsonSetting.keyword_file]
         for table_kw_data in table_keywords:
             if kw_equals_kw_candite(keyword, table_kw_data):
                 if not object_name or object_name == table_kw_object:
@@ -0,0 +1,163 @@
+import threading
+import traceback
+from time import time
+
+
+class Job(object):
+    """Scheduled job of the JobScheduler.
+
+    ``key``      -- Identifies the work, example the scanned file. Job
+                    scheduled with the same key replaces the pending job.
+    ``function`` -- Function called without arguments.
+    ``due``      -- Time when the job is run.
+    ``group``    -- Job scheduled in the same group replaces the pending
+                    jobs of the group, which have a different key.
+    """
+    def __init__(self, key, function, due, group, order):
+        self.key = key
+        self.function = function
+        self.due = due
+        self.group = group
+        self.order = order
+        self.cancelled = False
+
+    def sort_key(self):
+        return self.due, self.order
+
+
+class JobScheduler(object):
+    """Runs the scan and index jobs one at a time in a background thread.
+
+    Jobs are debounced: the job is run only after ``delay`` seconds and
+    scheduling the same key again before that postpones the job. Jobs with
+    the same key are coalesced, only the latest scheduled job is run, and
+    jobs superseded by a newer job in the same group are cancelled. A job
+    which is already running is not stopped, but if the same key is
+    scheduled again, it is run again after the running job.
+
+    Jobs are run in the order they are due, which is the order they are
+    scheduled when the delay is same. Exceptions raised by the jobs are
+    printed and do not stop the scheduler.
+    """
+    def __init__(self, delay=0.5):
+        self.delay = delay
+        self.condition = threading.Condition()
+        self.pending = {}
+        self.running = None
+        self.thread = None
+        self.order = 0
+        self.stopped = False
+
+    def schedule(self, key, function, delay=None, group=None):
+        """Schedules the function to be run after the delay.
+
+        Returns the scheduled Job.
+        """
+        if delay is None:
+            delay = self.delay
+        with self.condition:
+            if group is not None:
+                for job in list(self.pending.values()):
+                    if job.group == group and job.key != key:
+                        self._cancel(job)
+            if key in self.pending:
+                self._cancel(self.pending[key])
+            self.order += 1
+            job = Job(key, function, time() + delay, group, self.order)
+            self.pending[key] = job
+            self.stopped = False
+            self._start()
+            self.condition.notify_all()
+        return job
+
+    def cancel(self, key):
+        """Cancels the pending job of the key"""
+        with self.condition:
+            if key in self.pending:
+                self._cancel(self.pending[key])
+                self.condition.notify_all()
+
+    def is_idle(self):
+        with self.condition:
+            return not self.pending and self.running is None
+
+    def wait(self, timeout=None):
+        """Waits until all jobs are run. Returns True if scheduler is idle"""
+        end = None if timeout is None else time() + timeout
+        with self.condition:
+            while self.pending or self.running is not None:
+                remaining = None if end is None else end - time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+            return True
+
+    def stop(self):
+        """Cancels the pending jobs and stops the thread after running job"""
+        with self.condition:
+            for job in list(self.pending.values()):
+                self._cancel(job)
+            self.stopped = True
+            self.condition.notify_all()
+            thread = self.thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _cancel(self, job):
+        job.cancelled = True
+        del self.pending[job.key]
+
+    def _start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run)
+            self.thread.daemon = True
+            self.thread.start()
+
+    def _next_job(self):
+        with self.condition:
+            while not self.stopped:
+                if self.pending:
+                    job = min(self.pending.values(), key=Job.sort_key)
+                    wait_time = job.due - time()
+                    if wait_time <= 0:
+                        del self.pending[job.key]
+                        self.running = job
+                        return job
+                else:
+                    wait_time = None
+                self.condition.wait(wait_time)
+            self.thread = None
+            self.condition.notify_all()
+            return None
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            try:
+                job.function()
+            except Exception:
+                print(traceback.format_exc())
+            with self.condition:
+                self.running = None
+                self.condition.notify_all()
+
+
+_SCHEDULER = None
+
+
+def get_job_scheduler(delay):
+    """Returns the shared JobScheduler with the delay in seconds"""
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        _SCHEDULER = JobScheduler(delay)
+    _SCHEDULER.delay = delay
+    return _SCHEDULER
+
+
+def stop_job_scheduler():
+    global _SCHEDULER
+    if _SCHEDULER is not None:
+        _SCHEDULER.stop()
+        _SCHEDULER = None
@@ -0,0 +1,143 @@
+import heapq
+from os import path
+
+SEARCH_INDEX = 'search_index'
+OBJECT_RANK = 'object_rank'
+# Prefixes containing these characters are searched with regular expression
+REGEX_CHARACTERS = frozenset('.^$*+?{}[]\\|()')
+WORD_SEPARATORS = frozenset(' _.')
+# Object ranks: keywords from the open tab, from the resource files and
+# from the libraries.
+OWN_FILE = 0
+RESOURCE = 1
+LIBRARY = 2
+RF_DATA_EXTENSIONS = frozenset(
+    ['.robot', '.txt', '.tsv', '.resource', '.html', '.htm', '.xhtml',
+     '.rest', '.rst'])
+PREFIX_SCORE = 100
+WORD_START_SCORE = 10
+OBJECT_RANK_PENALTY = 20
+
+
+def create_search_index(keywords):
+    """Returns the search index for the keyword completions.
+
+    ``keywords`` -- List of keyword completions, where first item is the
+    keyword name.
+
+    The search index maps each lower case character to the list of
+    keyword positions, in the ``keywords``, where keyword name
+    contains the character.
+    """
+    search_index = {}
+    for kw_id, keyword in enumerate(keywords):
+        for character in set(keyword[0].lower()):
+            search_index.setdefault(character, []).append(kw_id)
+    return search_index
+
+
+def search_keywords(keywords, search_index, prefix):
+    """Returns the positions of the keywords matching to the prefix.
+
+    Keyword matches when all characters of the prefix are found from the
+    keyword name in the same order, ignoring the case. This is same as
+    matching with the regular expression: (?i)(.*p.*r.*e), but instead of
+    searching all keywords, only the keywords containing the least common
+    character of the prefix are checked. Positions are returned in the
+    same order as keywords are in the ``keywords``.
+
+    Returns None if prefix contains regular expression or non ASCII
+    characters and must be searched with the regular expression.
+    """
+    if not prefix:
+        return list(range(len(keywords)))
+    if not is_searchable(prefix):
+        return None
+    prefix = prefix.lower()
+    candidates = None
+    for character in set(prefix):
+        kw_ids = search_index.get(character, [])
+        if candidates is None or len(kw_ids) < len(candidates):
+            candidates = kw_ids
+    return [
+        kw_id for kw_id in candidates
+        if is_subsequence(prefix, keywords[kw_id][0].lower())
+    ]
+
+
+def is_searchable(prefix):
+    for character in prefix:
+        if character in REGEX_CHARACTERS or ord(character) > 127:
+            return False
+    return True
+
+
+def is_subsequence(prefix, text):
+    """Returns True if characters of prefix are found in text in order"""
+    position = 0
+    for character in prefix:
+        position = text.find(character, position)
+        if position == -1:
+            return False
+        position += 1
+    return True
+
+
+def get_object_rank(table_name, own_table):
+    """Returns the object rank of the keywords in the table_name
+
+    ``own_table`` -- Table name of the open tab.
+
+    Tables created from Robot Framework data files contain the file
+    extension in the table name, other tables are libraries.
+    """
+    if table_name == own_table:
+        return OWN_FILE
+    name = table_name.rsplit('-', 1)[0]
+    if path.splitext(name)[1].lower() in RF_DATA_EXTENSIONS:
+        return RESOURCE
+    return LIBRARY
+
+
+def score_keyword(prefix, keyword, object_rank):
+    """Returns the score of the keyword matching to the prefix.
+
+    ``prefix`` and ``keyword`` must be in lower case and the keyword must
+    match to the prefix. Keyword is scored higher when it starts with the
+    prefix, when the prefix characters match to the start of the words in
+    the keyword and when matched characters are close to each other.
+    Keywords from the open tab are scored higher than keywords from the
+    resource files, which are scored higher than library keywords.
+    """
+    score = -OBJECT_RANK_PENALTY * object_rank
+    if keyword.startswith(prefix):
+        score += PREFIX_SCORE
+    position = -1
+    for character in prefix:
+        new_position = keyword.find(character, position + 1)
+        if new_position == 0 or keyword[new_position - 1] in WORD_SEPARATORS:
+            score += WORD_START_SCORE
+        score -= new_position - position - 1
+        position = new_position
+    return score
+
+
+def rank_keywords(keywords, kw_ids, prefix, object_ranks, limit):
+    """Returns the ``limit`` best scored keyword positions from the kw_ids
+
+    ``object_ranks`` -- Dictionary of object name to object rank.
+
+    Positions are returned in score order. Keywords with same score are
+    in the same order as in the kw_ids. Uses a bounded heap and therefore
+    all matching keywords are not sorted.
+    """
+    prefix = prefix.lower()
+
+    def score(kw_id):
+        keyword = keywords[kw_id]
+        return score_keyword(
+            prefix,
+            keyword[0].lower(),
+            object_ranks.get(keyword[2], LIBRARY)
+        )
+    return heapq.nlargest(limit, kw_ids, key=score)
@@ -0,0 +1,196 @@
+import json
+import threading
+from collections import deque
+from os import path, makedirs
+from time import time
+from timeit import default_timer
+
+METRICS_FILE_NAME = 'metrics.json'
+PERCENTILES = (50, 95, 99)
+
+
+class Histogram(object):
+    """Latency histogram of the latest ``max_samples`` samples.
+
+    Percentiles are calculated from the latest samples, so that they
+    follow the current performance, count, mean and max from all samples.
+    """
+    def __init__(self, max_samples=1000):
+        self.samples = deque(maxlen=max_samples)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percent):
+        """Returns the percentile of the samples or None"""
+        if not self.samples:
+            return None
+        samples = sorted(self.samples)
+        index = int(round(percent / 100.0 * (len(samples) - 1)))
+        return samples[index]
+
+    def snapshot(self):
+        data = {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'max': self.max
+        }
+        for percent in PERCENTILES:
+            data['p{0}'.format(percent)] = self.percentile(percent)
+        return data
+
+
+class _Timer(object):
+    """Context manager which records the elapsed milliseconds"""
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.metrics.record(
+            self.name, (default_timer() - self.start) * 1000.0)
+        return False
+
+
+class Metrics(object):
+    """Records latencies and cache hit rates of the plugin.
+
+    Latencies are recorded in milliseconds to histograms by name, example
+    the completions or the subprocess launches, and cache hits and misses
+    are counted by the cache name. Metrics are kept in the memory of the
+    plugin process and, when ``configure`` is called with the snapshot
+    path, snapshot is written as JSON to the path after every
+    ``interval`` seconds when new values are recorded.
+
+    Example:
+        metrics = get_metrics()
+        with metrics.timer('completions'):
+            get_completions()
+        metrics.hit('view_data', cached)
+    """
+    def __init__(self, max_samples=1000):
+        self.max_samples = max_samples
+        self.lock = threading.Lock()
+        self.snapshot_path = None
+        self.interval = 0
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.latency = {}
+            self.cache = {}
+            self.started = time()
+            self.saved = time()
+
+    def configure(self, snapshot_path, interval):
+        """Sets where and how often, in seconds, snapshots are written.
+
+        Snapshots are not written when interval is zero or snapshot_path
+        is None.
+        """
+        self.snapshot_path = snapshot_path
+        self.interval = interval or 0
+
+    def timer(self, name):
+        """Returns context manager which records the latency of the name"""
+        return _Timer(self, name)
+
+    def record(self, name, elapsed):
+        """Records the elapsed milliseconds to the histogram of the name"""
+        with self.lock:
+            if name not in self.latency:
+                self.latency[name] = Histogram(self.max_samples)
+            self.latency[name].add(elapsed)
+        self.save_if_due()
+
+    def hit(self, name, hit=True):
+        """Counts cache hit, or miss when ``hit`` is False, of the name"""
+        with self.lock:
+            hits, misses = self.cache.get(name, (0, 0))
+            if hit:
+                hits += 1
+            else:
+                misses += 1
+            self.cache[name] = (hits, misses)
+
+    def snapshot(self):
+        """Returns the metrics as dictionary"""
+        with self.lock:
+            latency = dict(
+                (name, histogram.snapshot())
+                for name, histogram in self.latency.items())
+            cache = {}
+            for name, (hits, misses) in self.cache.items():
+                cache[name] = {
+                    'hits': hits,
+                    'misses': misses,
+                    'hit_rate': float(hits) / (hits + misses)
+                }
+        return {
+            'time': time(),
+            'started': self.started,
+            'latency_ms': latency,
+            'cache': cache
+        }
+
+    def save_if_due(self):
+        with self.lock:
+            if (not self.snapshot_path or not self.interval or
+                    time() - self.saved < self.interval):
+                return
+            self.saved = time()
+        try:
+            self.save(self.snapshot_path)
+        except (IOError, OSError) as error:
+            print('Could not write metrics: {0}'.format(error))
+
+    def save(self, snapshot_path):
+        """Writes the snapshot as JSON to the snapshot_path"""
+        snapshot_dir = path.dirname(snapshot_path)
+        if snapshot_dir and not path.exists(snapshot_dir):
+            makedirs(snapshot_dir)
+        with open(snapshot_path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=4, sort_keys=True)
+
+    def report(self):
+        """Returns the latency and the cache report as list of lines"""
+        snapshot = self.snapshot()
+        lines = ['{0:<28}{1:>8}{2:>10}{3:>10}{4:>10}{5:>10}'.format(
+            'Latency (ms)', 'count', 'p50', 'p95', 'p99', 'max')]
+        row = '{0:<28}{1:>8}{2:>10.1f}{3:>10.1f}{4:>10.1f}{5:>10.1f}'
+        for name in sorted(snapshot['latency_ms']):
+            data = snapshot['latency_ms'][name]
+            lines.append(row.format(
+                name, data['count'], data['p50'], data['p95'], data['p99'],
+                data['max']))
+        lines.append('')
+        lines.append('{0:<28}{1:>8}{2:>10}{3:>10}'.format(
+            'Cache', 'hits', 'misses', 'hit rate'))
+        for name in sorted(snapshot['cache']):
+            data = snapshot['cache'][name]
+            lines.append('{0:<28}{1:>8}{2:>10}{3:>10.0%}'.format(
+                name, data['hits'], data['misses'], data['hit_rate']))
+        return lines
+
+
+_METRICS = None
+
+
+def get_metrics():
+    """Returns the shared Metrics of the plugin process"""
+    global _METRICS
+    if _METRICS is None:
+        _METRICS = Metrics()
+    return _METRICS
@@ -1,9 +1,9 @@
 import re
 try:
-    from current_view import KW_COMPLETION
+    from current_view import get_view_data, get_view_keywords
     from utils.util import get_data_from_json, kw_equals_kw_candite
 except:
-    from .current_view import KW_COMPLETION
+    from .current_view import get_view_data, get_view_keywords
     from .utils.util import get_data_from_json, kw_equals_kw_candite
 
 
@@ -63,8 +63,7 @@ class ReturnKeywordAndObject(object):
         current_view.json file. If object and/or keyword can not be
         found from the rf_cell, empty values are returned.
         """
-        self._get_data()
-        completions = self.data[KW_COMPLETION]
+        completions = get_view_keywords(self.current_view)
         object_best_match = ''
         keyword_best_match = ''
         for kw_completion in completions:
@@ -86,4 +85,4 @@ class ReturnKeywordAndObject(object):
         return object_best_match, keyword_best_match
 
     def _get_data(self):
-        self.data = get_data_from_json(self.current_view)
+        self.data = get_view_data(self.current_view)
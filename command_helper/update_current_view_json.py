@@ -1,9 +1,15 @@
 from ..setting.setting import get_setting
 from ..setting.setting import SettingObject
 from ..command_helper.current_view import CurrentView
+from ..command_helper.metrics import get_metrics
 
 
 def update_current_view_index(view):
+    with get_metrics().timer('current_view'):
+        return _update_current_view_index(view)
+
+
+def _update_current_view_index(view):
     file_name = view.file_name()
     message = None
     if file_name:
@@ -11,9 +17,16 @@ def update_current_view_index(view):
         workspace = get_setting(SettingObject.workspace)
         index_dir = get_setting(SettingObject.index_dir)
         extension = get_setting(SettingObject.extension)
+        view_path = get_setting(SettingObject.view_path)
+        up_to_date = cv.view_up_to_date(file_name, view_path, index_dir)
+        get_metrics().hit('current_view', up_to_date)
+        if up_to_date:
+            return message
         if cv.view_in_db(workspace, file_name, index_dir, extension):
-            view_path = get_setting(SettingObject.view_path)
-            cv.create_view(file_name, view_path, index_dir)
+            cv.create_view(
+                file_name, view_path, index_dir,
+                get_setting(SettingObject.binary_view)
+            )
             message = 'Updating current view is done for file: {0} '.format(
                 file_name
             )
@@ -1,11 +1,94 @@
-from json import load as json_load
+import json
+import threading
+from collections import OrderedDict
+try:
+    from parser_utils.sqlite_store import read_table, table_key, SQLITE_BACKEND
+    from metrics import get_metrics
+except:
+    from ...dataparser.parser_utils.sqlite_store import read_table
+    from ...dataparser.parser_utils.sqlite_store import table_key
+    from ...dataparser.parser_utils.sqlite_store import SQLITE_BACKEND
+    from ..metrics import get_metrics
+
+# Maximum size, in bytes, of the tables kept in the table cache.
+TABLE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class TableCache(object):
+    """Least recently used cache of the parsed database tables.
+
+    Cached table is returned only if the table is not changed after it
+    was read, which is detected from the modification time and size of
+    the JSON file or from the revision of the table in the SQLite store.
+    Size of the table is the size of the JSON file, or the size of the
+    data as JSON for the SQLite store, and the least recently used tables
+    are removed when the size of the cached tables exceeds ``max_bytes``.
+
+    Cached data is shared by all callers and must not be modified.
+    """
+    def __init__(self, max_bytes=TABLE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.tables = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def get(self, t_path):
+        """Returns the data of the table in the t_path
+
+        Raises IOError if the table is not found.
+        """
+        key = table_key(t_path)
+        with self.lock:
+            cached = self.tables.pop(t_path, None)
+            if cached:
+                self.size -= cached[1]
+                if key is not None and cached[0] == key:
+                    self._add(t_path, cached)
+                    get_metrics().hit('table_cache')
+                    return cached[2]
+        get_metrics().hit('table_cache', False)
+        data = read_table(t_path)
+        if key is not None:
+            if key[0] == SQLITE_BACKEND:
+                size = len(json.dumps(data))
+            else:
+                size = key[1]
+            with self.lock:
+                if t_path not in self.tables:
+                    self._add(t_path, (key, size, data))
+        return data
+
+    def _add(self, t_path, cached):
+        if cached[1] > self.max_bytes:
+            return
+        self.tables[t_path] = cached
+        self.size += cached[1]
+        while self.size > self.max_bytes:
+            _, removed = self.tables.popitem(last=False)
+            self.size -= removed[1]
+
+    def clear(self):
+        with self.lock:
+            self.tables.clear()
+            self.size = 0
+
+
+_TABLE_CACHE = TableCache()
+
+
+def get_table_cache():
+    """Returns the table cache shared by the command helpers"""
+    return _TABLE_CACHE
 
 
 def get_data_from_json(json_file):
-    f = open(json_file)
-    data = json_load(f)
-    f.close()
-    return data
+    """Returns data from the json_file
+
+    If the json_file does not exist, data is read from the SQLite store
+    in the same folder. Data is cached in the shared table cache and it
+    must not be modified.
+    """
+    return _TABLE_CACHE.get(json_file)
 
 
 def kw_equals_kw_candite(kw, kw_candite):
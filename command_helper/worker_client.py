@@ -0,0 +1,113 @@
+import json
+import subprocess
+import threading
+from platform import system
+
+
+class WorkerClient(object):
+    """Client for the long running scan and index worker.
+
+    The worker, dataparser/run_worker.py, is started when the first
+    request is sent and it is kept running between the requests. If the
+    worker process has died, it is started again on the next request.
+    Worker output is appended to the ``log_file``.
+    """
+    def __init__(self, python_binary, worker_runner, log_file):
+        self.python_binary = python_binary
+        self.worker_runner = worker_runner
+        self.log_file = log_file
+        self.process = None
+        self.lock = threading.Lock()
+
+    def request(self, command, args=None, restart=False):
+        """Sends command to the worker and returns the response.
+
+        ``args`` is dictionary of the command arguments. If ``restart``
+        is True, running worker is stopped and started again before the
+        command. Returns the response dictionary, which contains the
+        result code in the `rc` key and the error message in the `error`
+        key.
+        """
+        message = dict(args or {})
+        message['command'] = command
+        with self.lock:
+            if restart:
+                self._stop()
+            if not self.is_running():
+                self.start()
+            try:
+                self.process.stdin.write(json.dumps(message) + '\n')
+                self.process.stdin.flush()
+                response = self.process.stdout.readline()
+            except (IOError, OSError):
+                response = None
+            if not response:
+                self._stop()
+                return {'rc': 255, 'error': 'Worker process died'}
+            return json.loads(response)
+
+    def is_running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        startupinfo = None
+        if system() == 'Windows':
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        log_file = open(self.log_file, 'a')
+        try:
+            self.process = subprocess.Popen(
+                [self.python_binary, '-u', self.worker_runner],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=log_file,
+                startupinfo=startupinfo,
+                universal_newlines=True
+            )
+        finally:
+            log_file.close()
+
+    def stop(self):
+        """Stops the worker by closing the worker stdin
+
+        Waits until the request, which is being sent, is completed.
+        """
+        with self.lock:
+            self._stop()
+
+    def _stop(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.stdout.close()
+        except (IOError, OSError):
+            pass
+        self.process.wait()
+        self.process = None
+
+
+_CLIENT = None
+
+
+def get_worker_client(python_binary, worker_runner, log_file):
+    """Returns the shared WorkerClient.
+
+    New client is created, and the old worker is stopped, if the python
+    binary or the worker runner is changed.
+    """
+    global _CLIENT
+    if (_CLIENT is None or
+            _CLIENT.python_binary != python_binary or
+            _CLIENT.worker_runner != worker_runner):
+        stop_worker_client()
+        _CLIENT = WorkerClient(python_binary, worker_runner, log_file)
+    _CLIENT.log_file = log_file
+    return _CLIENT
+
+
+def stop_worker_client():
+    global _CLIENT
+    if _CLIENT is not None:
+        _CLIENT.stop()
+        _CLIENT = None
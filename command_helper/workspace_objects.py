@@ -1,10 +1,14 @@
-from os import listdir, path
+from os import path
 try:
     from noralize_cell import get_data_from_json
     from db_json_settings import DBJsonSetting
+    from parser_utils.util import list_tables
+    from parser_utils.import_catalog import ImportCatalog
 except:
     from ..command_helper.noralize_cell import get_data_from_json
     from ..setting.db_json_settings import DBJsonSetting
+    from ..dataparser.parser_utils.util import list_tables
+    from ..dataparser.parser_utils.import_catalog import ImportCatalog
 
 
 class WorkSpaceObjects(object):
@@ -12,10 +16,22 @@ class WorkSpaceObjects(object):
     """Searches the available resources, libraries or variable files
     from the database. The Purpose is to ease the resource, library
     and variable file imports.
+
+    Imports are read from the import catalog created by the scanner.
+    If the database is created before the import catalog was added,
+    imports are searched from the tables.
     """
     def __init__(self, view_db):
         self.view_db = view_db
 
+    def get_catalog(self):
+        """Returns the loaded ImportCatalog or None if there is none"""
+        catalog = ImportCatalog(self.view_db)
+        if not catalog.exists():
+            return None
+        catalog.load()
+        return catalog
+
     def get_imports(self, import_type):
         """Returns the available objects based on the import_type
 
@@ -39,8 +55,15 @@ class WorkSpaceObjects(object):
         return imports
 
     def get_libraries(self):
+        catalog = self.get_catalog()
+        if catalog is not None:
+            return [
+                import_ for import_ in catalog.get_imports(
+                    DBJsonSetting.library)
+                if 'BuiltIn' not in import_[0]
+            ]
         libraries = []
-        for file in listdir(self.view_db):
+        for file in list_tables(self.view_db):
             data = get_data_from_json(path.join(self.view_db, file))
             if self.is_library(data):
                 if 'BuiltIn' not in data[DBJsonSetting.library_module]:
@@ -65,8 +88,11 @@ class WorkSpaceObjects(object):
         return import_
 
     def get_resources(self):
+        catalog = self.get_catalog()
+        if catalog is not None:
+            return catalog.get_imports(DBJsonSetting.resource_file)
         resources = []
-        for file in listdir(self.view_db):
+        for file in list_tables(self.view_db):
             data = get_data_from_json(path.join(self.view_db, file))
             if self.is_resource(data):
                 resources.append(self.get_resource_or_variable_import(data))
@@ -86,8 +112,11 @@ class WorkSpaceObjects(object):
         return import_
 
     def get_variables(self):
+        catalog = self.get_catalog()
+        if catalog is not None:
+            return catalog.get_imports(DBJsonSetting.variable_file)
         variables = []
-        for file in listdir(self.view_db):
+        for file in list_tables(self.view_db):
             data = get_data_from_json(path.join(self.view_db, file))
             if self.is_variable_file(data):
                 variables.append(self.get_resource_or_variable_import(data))
@@ -10,6 +10,7 @@ from .setting_import_helper import SettingImporter
 from .setting_import_helper import InsertImport
 from .command_logging import LogCommands
 from .on_save_create_table import OnSaveCreateTable
+from .metrics_report import ShowPerformanceMetrics
 
 __all__ = [
     'ScanIndexCommand',
@@ -23,5 +24,6 @@ __all__ = [
     'SettingImporter',
     'InsertImport',
     'LogCommands',
-    'OnSaveCreateTable'
+    'OnSaveCreateTable',
+    'ShowPerformanceMetrics'
 ]
@@ -1,16 +1,20 @@
 import sublime_plugin
-import sublime
-from ..command_helper.update_current_view_json import update_current_view_index
 from ..setting.setting import get_setting
 from ..setting.setting import SettingObject
+from .index_open_tab import ACTIVATION_GROUP, update_active_view
+from .scan import schedule_job
 
 
 class DetectViewChange(sublime_plugin.EventListener):
 
     def on_activated(self, view):
+        """Updates the current view, and the index, in the background.
+
+        When tabs are changed quickly, only the tab which is active after
+        the job delay is indexed.
+        """
         if get_setting(SettingObject.automatic_index_creation):
-                view.run_command('index_open_tab')
+            view.run_command('index_open_tab', {'activated': True})
         else:
-            message = update_current_view_index(view)
-            if message:
-                sublime.status_message(message)
+            schedule_job(
+                'current_view', update_active_view, ACTIVATION_GROUP)
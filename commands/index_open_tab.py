@@ -1,68 +1,115 @@
 import sublime_plugin
 import sublime
 import subprocess
+from functools import partial
 from platform import system
 from os import path, makedirs
 from ..setting.setting import get_setting
 from ..setting.setting import SettingObject
 from ..dataparser.parser_utils.file_formatter import rf_table_name
 from ..dataparser.parser_utils.util import normalise_path
+from ..dataparser.parser_utils.util import get_index_name, index_up_to_date
 from ..command_helper.update_current_view_json import update_current_view_index
+from ..command_helper.current_view import CurrentView
+from ..command_helper.metrics import get_metrics
 from .scan_and_index import index_popen_arg_parser
 from .scan_and_index import add_builtin_vars
+from .scan_and_index import index_worker_args
+from .scan import run_in_worker
+from .scan import schedule_job
+from .metrics_report import measure
+
+ACTIVATION_GROUP = 'activation'
+
+
+def update_active_view():
+    """Updates the current view from the active tab.
+
+    Tab may have been changed while the job was waiting or running, so
+    the current view is created from the tab which is active now.
+    """
+    view = sublime.active_window().active_view()
+    if view is None:
+        return
+    message = update_current_view_index(view)
+    if message:
+        sublime.status_message(message)
 
 
 class IndexOpenTabCommand(sublime_plugin.TextCommand):
 
-    def run(self, edit):
+    def run(self, edit, dependents=False, activated=False):
         """Command to index open tab RF file and create db index table.
 
         Purpose of the command is create index, from the open tab.
         Index should contain all the resource and library imports and
         all global variables from variable tables and imported variable
         files.
+
+        If ``dependents`` is True, index is also created for the files
+        which import the open tab directly or through other imports.
+
+        Indexing is done in the background. If ``activated`` is True, the
+        command is run because the tab was activated and the indexing is
+        cancelled if other tab is activated before the indexing starts.
+        Open tab is not indexed if none of the tables in the index
+        has changed after the index was created, only the current view
+        is updated. If also the current view is created from the index,
+        nothing is done. These checks read the tables and they are done
+        in the background job, not when the command is run.
         """
-        log_file = get_setting(SettingObject.log_file)
-        makedirs(path.dirname(log_file), exist_ok=True)
         open_tab = self.view.file_name()
         if not open_tab:
             message = 'Not able to index because no tabs are active'
             sublime.status_message(message)
             return
         db_table_name = self.get_table_name(open_tab)
-        db_dir = get_setting(SettingObject.table_dir)
-        sublime.set_timeout_async(add_builtin_vars(db_dir))
         if db_table_name:
-            file_ = open(log_file, 'a')
-            sublime.set_timeout_async(
-                self.run_single_index(
-                    db_table_name,
-                    file_
-                ),
-                0
+            mode = 'dependents' if dependents else 'single'
+            schedule_job(
+                ('index_{0}'.format(mode), db_table_name),
+                partial(
+                    self.index_open_tab, open_tab, db_table_name, dependents),
+                ACTIVATION_GROUP if activated else None
             )
-            file_.close()
-            message = update_current_view_index(self.view)
-            sublime.status_message(message)
         else:
             message = 'Not able to index file: {0}'.format(open_tab)
             sublime.status_message(message)
 
-    def run_single_index(self, db_table_name, log_file):
-        startupinfo = None
-        if system() == 'Windows':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        p_args = index_popen_arg_parser('single')
-        p_args.append('--db_table')
-        p_args.append(db_table_name)
-        p = subprocess.Popen(
-            p_args,
-            stderr=subprocess.STDOUT,
-            stdout=log_file,
-            startupinfo=startupinfo
+    def index_open_tab(self, open_tab, db_table_name, dependents):
+        add_builtin_vars(get_setting(SettingObject.table_dir))
+        if not dependents:
+            up_to_date = self.index_up_to_date(db_table_name)
+            get_metrics().hit('index', up_to_date)
+            if up_to_date:
+                if not CurrentView().view_up_to_date(
+                        open_tab,
+                        get_setting(SettingObject.view_path),
+                        get_setting(SettingObject.index_dir)):
+                    update_active_view()
+                return
+        log_file = get_setting(SettingObject.log_file)
+        makedirs(path.dirname(log_file), exist_ok=True)
+        with open(log_file, 'a') as file_:
+            self.run_single_index(db_table_name, file_, dependents)
+        update_active_view()
+
+    def index_up_to_date(self, db_table_name):
+        index_table = path.join(
+            get_setting(SettingObject.index_dir),
+            get_index_name(db_table_name)
         )
-        rc = p.wait()
+        return index_up_to_date(
+            get_setting(SettingObject.table_dir), index_table)
+
+    def run_single_index(self, db_table_name, log_file, dependents=False):
+        mode = 'dependents' if dependents else 'single'
+        if get_setting(SettingObject.persistent_worker):
+            args = index_worker_args()
+            args['db_table'] = db_table_name
+            rc = run_in_worker('index_{0}'.format(mode), args)
+        else:
+            rc = self.popen_single_index(db_table_name, log_file, mode)
         if not rc == 0:
             print('See log file from database directory for details')
             message = 'Error in indexing, result code: {0}'.format(rc)
@@ -72,6 +119,23 @@ class IndexOpenTabCommand(sublime_plugin.TextCommand):
         sublime.status_message(message)
         print(message)
 
+    def popen_single_index(self, db_table_name, log_file, mode):
+        startupinfo = None
+        if system() == 'Windows':
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        p_args = index_popen_arg_parser(mode)
+        p_args.append('--db_table')
+        p_args.append(db_table_name)
+        with measure('popen.index_{0}'.format(mode)):
+            p = subprocess.Popen(
+                p_args,
+                stderr=subprocess.STDOUT,
+                stdout=log_file,
+                startupinfo=startupinfo
+            )
+            return p.wait()
+
     def get_table_name(self, open_tab):
         workspace = get_setting(SettingObject.workspace)
         workspace_norm = path.normcase(workspace)
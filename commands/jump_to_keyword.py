@@ -8,11 +8,16 @@ from ..command_helper.utils.get_text import get_line
 from ..command_helper.noralize_cell import ReturnKeywordAndObject
 from ..command_helper.get_metadata import get_rf_table_separator
 from ..command_helper.get_keyword import GetKeyword
+from .metrics_report import measure
 
 
 class JumpToKeyword(sublime_plugin.TextCommand):
 
     def run(self, edit):
+        with measure('jump_to_keyword'):
+            self.jump_to_keyword()
+
+    def jump_to_keyword(self):
         open_tab = self.view.file_name()
         db_dir = get_setting(SettingObject.table_dir)
         index_db = get_setting(SettingObject.index_dir)
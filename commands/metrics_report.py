@@ -0,0 +1,49 @@
+import sublime_plugin
+from os import path
+from ..setting.setting import get_setting
+from ..setting.setting import SettingObject
+from ..command_helper.metrics import get_metrics, METRICS_FILE_NAME
+
+METRICS_PANEL = 'robot_framework_metrics'
+
+
+def get_metrics_path():
+    return path.join(
+        path.dirname(get_setting(SettingObject.log_file)), METRICS_FILE_NAME)
+
+
+def measure(name):
+    """Returns context manager which records the latency of the name.
+
+    Snapshot of the metrics is written in the database folder after
+    every robot_framework_metrics_interval seconds.
+    """
+    metrics = get_metrics()
+    metrics.configure(
+        get_metrics_path(), get_setting(SettingObject.metrics_interval))
+    return metrics.timer(name)
+
+
+class ShowPerformanceMetrics(sublime_plugin.TextCommand):
+
+    def run(self, edit):
+        """Prints the latency and the cache hit rate report.
+
+        Report is shown in the output panel and printed in the console.
+        Also the snapshot of the metrics is written to the database
+        folder.
+        """
+        metrics = get_metrics()
+        report = '\n'.join(metrics.report())
+        print(report)
+        metrics_path = get_metrics_path()
+        try:
+            metrics.save(metrics_path)
+            report += '\n\nSnapshot written to: {0}\n'.format(metrics_path)
+        except (IOError, OSError) as error:
+            report += '\n\nCould not write snapshot: {0}\n'.format(error)
+        window = self.view.window()
+        panel = window.create_output_panel(METRICS_PANEL)
+        panel.run_command('append', {'characters': report})
+        window.run_command(
+            'show_panel', {'panel': 'output.{0}'.format(METRICS_PANEL)})
@@ -11,4 +11,4 @@ class OnSaveCreateTable(sublime_plugin.EventListener):
         if get_setting(SettingObject.automatic_table_creation):
             view.run_command('scan_open_tab')
             if get_setting(SettingObject.automatic_index_creation):
-                view.run_command('index_open_tab')
+                view.run_command('index_open_tab', {'dependents': True})
@@ -9,6 +9,7 @@ from ..command_helper.utils.get_text import get_line
 from ..command_helper.utils.get_text import get_prefix
 from ..command_helper.utils.get_text import get_object_from_line
 from ..command_helper.get_metadata import get_rf_table_separator
+from .metrics_report import measure
 
 
 class RobotCompletion(sublime_plugin.EventListener):
@@ -22,7 +23,8 @@ class RobotCompletion(sublime_plugin.EventListener):
             elif view.score_selector(selection.a - 1, 'keyword.control.robot'):
                 return None
             else:
-                return self.return_completions(view, prefix, locations)
+                with measure('completions'):
+                    return self.return_completions(view, prefix, locations)
         else:
             return None
 
@@ -47,13 +49,15 @@ class RobotCompletion(sublime_plugin.EventListener):
         if view_in_db:
             object_name = get_object_from_line(line, prefix, column)
             arg_format = get_setting(SettingObject.arg_format)
+            limit = get_setting(SettingObject.completion_limit)
             return get_completion_list(
                 view_completions,
                 prefix,
                 text_cursor_rigt,
                 rc_cell,
                 object_name,
-                arg_format
+                arg_format,
+                limit
             )
         else:
             return None
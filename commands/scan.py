@@ -5,6 +5,11 @@ from platform import system
 from os import path, makedirs
 from ..setting.setting import get_setting
 from ..setting.setting import SettingObject
+from ..command_helper.worker_client import get_worker_client
+from ..command_helper.job_scheduler import get_job_scheduler
+from .metrics_report import measure
+
+WORKSPACE_GROUP = 'workspace'
 
 
 def scan_popen_arg_parser(mode):
@@ -18,12 +23,98 @@ def scan_popen_arg_parser(mode):
     arg_list.append(get_setting(SettingObject.extension))
     arg_list.append('--path_to_lib_in_xml')
     arg_list.append(get_setting(SettingObject.lib_in_xml))
+    arg_list.append('--processes')
+    arg_list.append(str(get_setting(SettingObject.scanner_processes)))
+    arg_list.append('--backend')
+    arg_list.append(get_setting(SettingObject.database_backend))
+    ignore = get_setting(SettingObject.workspace_ignore)
+    if ignore is not None:
+        arg_list.append('--ignore')
+        arg_list.extend(ignore)
+    if get_setting(SettingObject.profile):
+        arg_list.append('--profile')
     arg_list.append('--module_search_path')
     for module in get_setting(SettingObject.module_search_path):
         arg_list.append(module)
     return arg_list
 
 
+def scan_worker_args():
+    return {
+        'db_path': get_setting(SettingObject.table_dir),
+        'extension': get_setting(SettingObject.extension),
+        'path_to_lib_in_xml': get_setting(SettingObject.lib_in_xml),
+        'processes': get_setting(SettingObject.scanner_processes),
+        'backend': get_setting(SettingObject.database_backend),
+        'ignore': get_setting(SettingObject.workspace_ignore),
+        'profile': get_setting(SettingObject.profile),
+        'module_search_path': get_setting(SettingObject.module_search_path)
+    }
+
+
+def run_in_worker(command, args, restart=False):
+    """Runs the command in the persistent worker and returns the rc.
+
+    With ``restart`` the worker is started again before the command,
+    so that changes in the libraries, already imported by the worker,
+    are seen.
+    """
+    client = get_worker_client(
+        get_setting(SettingObject.python_binary),
+        get_setting(SettingObject.worker_runner),
+        get_setting(SettingObject.log_file)
+    )
+    with measure('worker.{0}'.format(command)):
+        response = client.request(command, args, restart)
+    if 'error' in response:
+        print(response['error'])
+    return response['rc']
+
+
+def schedule_job(key, function, group=None):
+    """Runs the function in the background after the job delay.
+
+    Pending job with the same ``key`` is replaced and pending jobs in the
+    same ``group`` are cancelled, see JobScheduler.
+    """
+    delay = get_setting(SettingObject.job_delay) / 1000.0
+    return get_job_scheduler(delay).schedule(key, function, group=group)
+
+
+def run_scan(log_file):
+    """Scans the workspace, in the worker or in a subprocess"""
+    if get_setting(SettingObject.persistent_worker):
+        args = scan_worker_args()
+        args['workspace'] = get_setting(SettingObject.workspace)
+        rc = run_in_worker('scan_all', args, restart=True)
+    else:
+        rc = popen_scan(log_file)
+    if not rc == 0:
+        print('See log file from database directory for details')
+        raise ValueError('Error in scanning result code: {0}'.format(rc))
+    message = 'Scaning done with rc: {0}'.format(rc)
+    sublime.status_message(message)
+    print(message)
+
+
+def popen_scan(log_file):
+    startupinfo = None
+    if system() == 'Windows':
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    p_args = scan_popen_arg_parser('all')
+    p_args.append('--workspace')
+    p_args.append(get_setting(SettingObject.workspace))
+    with measure('popen.scan_all'):
+        p = subprocess.Popen(
+            p_args,
+            stderr=subprocess.STDOUT,
+            stdout=log_file,
+            startupinfo=startupinfo
+        )
+        return p.wait()
+
+
 class ScanCommand(sublime_plugin.TextCommand):
 
     def run(self, edit):
@@ -33,31 +124,14 @@ class ScanCommand(sublime_plugin.TextCommand):
         the robot_framework_workspace and create database tables.
         Also all imports, from found files, will be iterated and
         table is created also from imports.
+
+        Scanning is done in the background. Pending scan of the
+        workspace, or scan and index, is replaced.
         """
+        schedule_job('scan_all', self.scan_all, WORKSPACE_GROUP)
+
+    def scan_all(self):
         log_file = get_setting(SettingObject.log_file)
         makedirs(path.dirname(log_file), exist_ok=True)
-        file_ = open(log_file, 'w')
-        sublime.set_timeout_async(self.run_scan(file_), 0)
-        file_.close()
-
-    def run_scan(self, log_file):
-        startupinfo = None
-        if system() == 'Windows':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        p_args = scan_popen_arg_parser('all')
-        p_args.append('--workspace')
-        p_args.append(get_setting(SettingObject.workspace))
-        p = subprocess.Popen(
-            p_args,
-            stderr=subprocess.STDOUT,
-            stdout=log_file,
-            startupinfo=startupinfo
-        )
-        rc = p.wait()
-        if not rc == 0:
-            print('See log file from database directory for details')
-            raise ValueError('Error in scanning result code: {0}'.format(rc))
-        message = 'Scaning done with rc: {0}'.format(rc)
-        sublime.status_message(message)
-        print(message)
+        with open(log_file, 'w') as file_:
+            run_scan(file_)
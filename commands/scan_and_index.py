@@ -9,6 +9,12 @@ from ..command_helper.update_current_view_json import update_current_view_index
 from ..setting.setting import get_setting
 from ..setting.setting import SettingObject
 from ..setting.db_json_settings import DBJsonSetting
+from ..dataparser.parser_utils.sqlite_store import read_table, get_store
+from .scan import run_in_worker
+from .scan import run_scan
+from .scan import schedule_job
+from .scan import WORKSPACE_GROUP
+from .metrics_report import measure
 
 
 def index_popen_arg_parser(mode):
@@ -22,22 +28,39 @@ def index_popen_arg_parser(mode):
     arg_list.append(get_setting(SettingObject.index_dir))
     arg_list.append('--path_to_lib_in_xml')
     arg_list.append(get_setting(SettingObject.lib_in_xml))
+    if get_setting(SettingObject.profile):
+        arg_list.append('--profile')
     arg_list.append('--module_search_path')
     for module in get_setting(SettingObject.module_search_path):
         arg_list.append(module)
     return arg_list
 
 
+def index_worker_args():
+    return {
+        'db_path': get_setting(SettingObject.table_dir),
+        'index_path': get_setting(SettingObject.index_dir),
+        'path_to_lib_in_xml': get_setting(SettingObject.lib_in_xml),
+        'profile': get_setting(SettingObject.profile),
+        'module_search_path': get_setting(SettingObject.module_search_path)
+    }
+
+
 def add_builtin_vars(db_path):
     builtin = 'BuiltIn'
     table_name = '{0}-{1}.json'.format(
         builtin, md5(builtin.encode('utf-8')).hexdigest())
     table_path = path.join(db_path, table_name)
-    f_table = open(table_path, 'r')
-    data = json.load(f_table)
-    f_table.close()
+    data = read_table(table_path)
     builtin_variables = get_setting(SettingObject.builtin_variables)
+    if data.get(DBJsonSetting.variables) == builtin_variables:
+        # Table is not written, so that the indexes are not out of date.
+        return
     data[DBJsonSetting.variables] = builtin_variables
+    store = get_store(db_path)
+    if store and not path.isfile(table_path):
+        store.put(table_name, data)
+        return
     f_table = open(table_path, 'w')
     json.dump(data, f_table, indent=4)
     f_table.close()
@@ -46,30 +69,29 @@ def add_builtin_vars(db_path):
 class ScanIndexCommand(sublime_plugin.TextCommand):
 
     def run(self, edit):
+        """Command to scan the workspace and create the indexes.
+
+        Scanning and indexing is done in the background. Pending scan of
+        the workspace, or scan and index, is replaced.
+        """
+        schedule_job('scan_and_index', self.scan_and_index, WORKSPACE_GROUP)
+
+    def scan_and_index(self):
         log_file = get_setting(SettingObject.log_file)
-        db_dir = get_setting(SettingObject.table_dir)
         makedirs(path.dirname(log_file), exist_ok=True)
-        self.view.run_command('scan')
-        file_ = open(log_file, 'a')
-        sublime.set_timeout_async(add_builtin_vars(db_dir))
-        sublime.set_timeout_async(self.run_index(file_), 0)
-        file_.close()
+        with open(log_file, 'w') as file_:
+            run_scan(file_)
+            add_builtin_vars(get_setting(SettingObject.table_dir))
+            self.run_index(file_)
         message = update_current_view_index(self.view)
         if message:
             sublime.status_message(message)
 
     def run_index(self, log_file):
-        startupinfo = None
-        if system() == 'Windows':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        p = subprocess.Popen(
-            index_popen_arg_parser('all'),
-            stderr=subprocess.STDOUT,
-            stdout=log_file,
-            startupinfo=startupinfo
-        )
-        rc = p.wait()
+        if get_setting(SettingObject.persistent_worker):
+            rc = run_in_worker('index_all', index_worker_args())
+        else:
+            rc = self.popen_index(log_file)
         if not rc == 0:
             print('See log file from database directory for details')
             raise ValueError(
@@ -78,3 +100,17 @@ class ScanIndexCommand(sublime_plugin.TextCommand):
         message = 'Indexing done with rc: {0}'.format(rc)
         sublime.status_message(message)
         print(message)
+
+    def popen_index(self, log_file):
+        startupinfo = None
+        if system() == 'Windows':
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        with measure('popen.index_all'):
+            p = subprocess.Popen(
+                index_popen_arg_parser('all'),
+                stderr=subprocess.STDOUT,
+                stdout=log_file,
+                startupinfo=startupinfo
+            )
+            return p.wait()
@@ -1,11 +1,16 @@
 import sublime_plugin
 import sublime
 import subprocess
+from functools import partial
 from platform import system
 from os import path, makedirs
 from ..setting.setting import get_setting
 from ..setting.setting import SettingObject
 from .scan import scan_popen_arg_parser
+from .scan import scan_worker_args
+from .scan import run_in_worker
+from .scan import schedule_job
+from .metrics_report import measure
 
 
 class ScanOpenTabCommand(sublime_plugin.TextCommand):
@@ -14,26 +19,39 @@ class ScanOpenTabCommand(sublime_plugin.TextCommand):
         """Command to scan open tab RF file and create db table
 
         Purpose of the command is scan and create the db table
-        from the currently open tab.
+        from the currently open tab. Scanning is done in the background.
         """
-        log_file = get_setting(SettingObject.log_file)
-        makedirs(path.dirname(log_file), exist_ok=True)
         open_tab = self.view.file_name()
         if self.file_in_workspace(open_tab):
-            file_ = open(log_file, 'w')
-            sublime.set_timeout_async(
-                self.run_single_scan(
-                    open_tab,
-                    file_
-                ),
-                0
+            schedule_job(
+                ('scan_single', open_tab),
+                partial(self.scan_open_tab, open_tab)
             )
-            file_.close()
         else:
             message = 'Not able to scan file: {0}'.format(open_tab)
             sublime.status_message(message)
 
+    def scan_open_tab(self, open_tab):
+        log_file = get_setting(SettingObject.log_file)
+        makedirs(path.dirname(log_file), exist_ok=True)
+        with open(log_file, 'w') as file_:
+            self.run_single_scan(open_tab, file_)
+
     def run_single_scan(self, open_tab, log_file):
+        if get_setting(SettingObject.persistent_worker):
+            args = scan_worker_args()
+            args['path_to_file'] = open_tab
+            rc = run_in_worker('scan_single', args)
+        else:
+            rc = self.popen_single_scan(open_tab, log_file)
+        if not rc == 0:
+            print('See log file from database directory for details')
+            raise ValueError('Error in scanning result code: {0}'.format(rc))
+        message = 'Scaning done with rc: {0}'.format(rc)
+        sublime.status_message(message)
+        print(message)
+
+    def popen_single_scan(self, open_tab, log_file):
         startupinfo = None
         if system() == 'Windows':
             startupinfo = subprocess.STARTUPINFO()
@@ -41,19 +59,14 @@ class ScanOpenTabCommand(sublime_plugin.TextCommand):
         p_args = scan_popen_arg_parser('single')
         p_args.append('--path_to_file')
         p_args.append(open_tab)
-        p = subprocess.Popen(
-            p_args,
-            stderr=subprocess.STDOUT,
-            stdout=log_file,
-            startupinfo=startupinfo
-        )
-        rc = p.wait()
-        if not rc == 0:
-            print('See log file from database directory for details')
-            raise ValueError('Error in scanning result code: {0}'.format(rc))
-        message = 'Scaning done with rc: {0}'.format(rc)
-        sublime.status_message(message)
-        print(message)
+        with measure('popen.scan_single'):
+            p = subprocess.Popen(
+                p_args,
+                stderr=subprocess.STDOUT,
+                stdout=log_file,
+                startupinfo=startupinfo
+            )
+            return p.wait()
 
     def file_in_workspace(self, open_tab):
         workspace = get_setting(SettingObject.workspace)
@@ -13,6 +13,8 @@ from tempfile import mkdtemp
 import logging
 import inspect
 from parser_utils.util import normalise_path
+from parser_utils.profiler import Profiler, RF_PARSE, LIBDOC, VARIABLE_FILE
+from libdoc_cache import unload_library
 from db_json_settings import DBJsonSetting
 
 logging.basicConfig(
@@ -30,23 +32,34 @@ class DataParser():
     Class will return the the test data as in json format. Can parse
     Python libraries, library xml documentation generated by the libdoc
     resource and test suite files.
+
+    If ``libdoc_cache`` is given, keywords of the Python libraries are
+    read from the cache when library is not changed and libraries are
+    imported only when the cache is not valid.
+
+    If ``profiler`` is given, time spent in parsing the Robot Framework
+    data, libraries and variable files is recorded in the profiler.
     """
     # Public
-    def __init__(self):
+    def __init__(self, libdoc_cache=None, profiler=None):
         self.file_path = None
         self.rf_variables = Variables()
         self.rf_var_storage = VariableStore(self.rf_variables)
         self.libdoc = LibraryDocBuilder()
+        self.libdoc_cache = libdoc_cache
+        self.profiler = profiler or Profiler()
 
     def parse_resource(self, file_path):
         self.file_path = file_path
         if path.exists(file_path):
-            if '__init__.' in file_path:
-                folder = path.dirname(file_path)
-                model = parsing.TestDataDirectory(source=folder).populate()
-            else:
-                model = parsing.ResourceFile(file_path).populate()
-            return self._parse_robot_data(file_path, model)
+            with self.profiler.phase(RF_PARSE, file_path):
+                if '__init__.' in file_path:
+                    folder = path.dirname(file_path)
+                    model = parsing.TestDataDirectory(
+                        source=folder).populate()
+                else:
+                    model = parsing.ResourceFile(file_path).populate()
+                return self._parse_robot_data(file_path, model)
         else:
             logging.error('File %s could not be found', file_path)
             raise ValueError(
@@ -55,8 +68,9 @@ class DataParser():
     def parse_suite(self, file_path):
         self.file_path = file_path
         if path.exists(file_path):
-            model = parsing.TestCaseFile(source=file_path).populate()
-            return self._parse_robot_data(file_path, model)
+            with self.profiler.phase(RF_PARSE, file_path):
+                model = parsing.TestCaseFile(source=file_path).populate()
+                return self._parse_robot_data(file_path, model)
         else:
             logging.error('File %s could not be found', file_path)
             raise ValueError(
@@ -72,7 +86,8 @@ class DataParser():
         setter = VariableFileSetter(self.rf_var_storage)
         var_list = []
         try:
-            variables = setter.set(file_path, args)
+            with self.profiler.phase(VARIABLE_FILE, file_path):
+                variables = setter.set(file_path, args)
         except DataError:
             variables = []
         for variable in variables:
@@ -129,6 +144,21 @@ class DataParser():
 
     # Private
     def _parse_python_lib(self, library, args):
+        with self.profiler.phase(LIBDOC, library):
+            if self.libdoc_cache:
+                kws = self.libdoc_cache.get(library, args)
+                if kws is not None:
+                    return kws
+                # Cached keywords are saved with the fingerprint of the
+                # current source files, so library must not be parsed
+                # from the module imported before the change.
+                unload_library(library)
+            kws = self._build_python_lib(library, args)
+            if self.libdoc_cache:
+                self.libdoc_cache.put(library, args, kws)
+            return kws
+
+    def _build_python_lib(self, library, args):
         lib_with_args = self._lib_arg_formatter(library, args)
         kws = {}
         try:
@@ -213,7 +243,8 @@ class DataParser():
         return arguments
 
     def _parse_xml_doc(self, library):
-        root = ET.parse(library).getroot()
+        with self.profiler.phase(LIBDOC, library):
+            root = ET.parse(library).getroot()
         if ('type', DBJsonSetting.library) in root.items():
             return root.attrib['name'], self._parse_xml_lib(root)
         else:
@@ -0,0 +1,176 @@
+import imp
+import json
+import logging
+import sys
+from hashlib import md5
+from os import path, makedirs, remove, rename, stat, walk, fdopen
+from tempfile import mkstemp
+from robot.libraries import STDLIBS
+from robot.version import get_version
+from parser_utils.util import file_md5
+
+LIBDOC_CACHE_DIR = 'libdoc_cache'
+
+
+def library_sources(library):
+    """Returns the source files of the library without importing it.
+
+    ``library`` is path to the library file or the library name, as
+    used in the library import. If library is a package, all Python
+    files in the package are returned. Returns empty list, if source
+    files are not found.
+    """
+    if path.isfile(library):
+        return [library]
+    if library in STDLIBS:
+        library = 'robot.libraries.' + library
+    search_path = None
+    module = None
+    for part in library.split('.'):
+        try:
+            file_, pathname, description = imp.find_module(part, search_path)
+        except ImportError:
+            break
+        if file_:
+            file_.close()
+        module = (pathname, description[2])
+        if description[2] != imp.PKG_DIRECTORY:
+            break
+        search_path = [pathname]
+    if not module:
+        return []
+    pathname, module_type = module
+    if module_type == imp.PKG_DIRECTORY:
+        sources = []
+        for root, dirs, files in walk(pathname):
+            for file_ in files:
+                if file_.endswith('.py'):
+                    sources.append(path.join(root, file_))
+        return sources
+    elif path.isfile(pathname):
+        return [pathname]
+    else:
+        return []
+
+
+def unload_library(library):
+    """Removes the modules of the library from the sys.modules.
+
+    Process, which is kept running, may have imported the library
+    before it was changed and libdoc would use the old module. Modules
+    imported from the library source files are removed, so that the
+    library is imported again. Standard libraries are not removed.
+    """
+    if library in STDLIBS:
+        return
+    sources = set(
+        _module_key(source) for source in library_sources(library))
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, '__file__', None)
+        if module_file and _module_key(module_file) in sources:
+            del sys.modules[name]
+
+
+def _module_key(module_file):
+    return path.normcase(path.abspath(path.splitext(module_file)[0]))
+
+
+class LibdocCache(object):
+    """Persistent cache of the Python library keywords.
+
+    Parsing a Python library requires importing the library and running
+    libdoc, which is slow for large libraries. The cache stores the
+    parsed keywords in the ``libdoc_cache`` folder in the database
+    folder. Entry is keyed by the library name, library arguments and
+    Robot Framework version. Entry is valid as long as the modification
+    time and content of the library source files are not changed.
+
+    Changes in the modules, which the library imports from outside
+    of the library package, are not detected.
+    """
+    def __init__(self, db_path):
+        self.cache_path = path.join(db_path, LIBDOC_CACHE_DIR)
+        self.rf_version = get_version()
+
+    def get(self, library, args):
+        """Returns the cached keywords or None if cache is not valid"""
+        entry_path = self.entry_path(library, args)
+        if not path.isfile(entry_path):
+            return None
+        try:
+            with open(entry_path) as f:
+                entry = json.load(f)
+        except (IOError, ValueError):
+            logging.warning('Ignoring corrupted libdoc cache: %s',
+                            entry_path)
+            return None
+        if entry['fingerprint'] != self.fingerprint(library):
+            return None
+        logging.info('Libdoc cache is up to date for: {0}'.format(library))
+        return entry['keywords']
+
+    def put(self, library, args, keywords):
+        """Saves the library keywords in the cache.
+
+        Keywords are not saved, if library source files are not found.
+        """
+        fingerprint = self.fingerprint(library)
+        if not fingerprint:
+            return
+        if not path.exists(self.cache_path):
+            try:
+                makedirs(self.cache_path)
+            except OSError:
+                pass
+        entry = {
+            'library': library,
+            'args': self._args(args),
+            'rf_version': self.rf_version,
+            'fingerprint': fingerprint,
+            'keywords': keywords
+        }
+        # Other scanner processes may write the same entry at the same
+        # time, therefore entry is written to temporary file first.
+        fd, tmp_path = mkstemp(dir=self.cache_path, suffix='.tmp')
+        with fdopen(fd, 'w') as f:
+            json.dump(entry, f)
+        entry_path = self.entry_path(library, args)
+        try:
+            rename(tmp_path, entry_path)
+        except OSError:
+            # Windows does not allow renaming over an existing file
+            try:
+                remove(entry_path)
+                rename(tmp_path, entry_path)
+            except OSError:
+                logging.warning('Could not write libdoc cache: %s',
+                                entry_path)
+                if path.exists(tmp_path):
+                    remove(tmp_path)
+
+    def fingerprint(self, library):
+        """Returns hash of the library source files or None if the
+        source files are not found.
+
+        Hash is calculated from the source file paths, modification
+        times and contents.
+        """
+        sources = library_sources(library)
+        if not sources:
+            return None
+        md5sum = md5()
+        for source in sorted(sources):
+            source_info = json.dumps(
+                [source, stat(source).st_mtime, file_md5(source)])
+            md5sum.update(source_info.encode('utf-8'))
+        return md5sum.hexdigest()
+
+    def entry_path(self, library, args):
+        key = json.dumps([library, self._args(args), self.rf_version])
+        return path.join(
+            self.cache_path,
+            '{0}.json'.format(md5(key.encode('utf-8')).hexdigest())
+        )
+
+    def _args(self, args):
+        return list(args) if args else []
@@ -2,14 +2,20 @@ import logging
 import re
 import multiprocessing
 import xml.etree.ElementTree as ET
-from os import path, listdir
-from json import load as json_load
+from os import path
 from json import dump as json_dump
 from collections import namedtuple
 from parser_utils.file_formatter import rf_table_name, lib_table_name
-from parser_utils.util import get_index_name
+from parser_utils.util import get_index_name, list_tables, normalise_kw
+from parser_utils.util import get_table_keys, get_fingerprint
+from parser_utils.sqlite_store import get_store
+from parser_utils.sqlite_store import read_table, table_key, table_exists
+from parser_utils.symbol_table import create_symbols, write_symbols
+from parser_utils.symbol_table import symbol_path
+from parser_utils.profiler import Profiler, INDEX_READ, INDEX_RESOLVE
+from parser_utils.profiler import INDEX_WRITE
 from queue.queue import ParsingQueue
-from data_parser.data_parser import DataParser
+from queue.manifest import LibraryTables
 from db_json_settings import DBJsonSetting
 from queue.finder import finder
 
@@ -17,31 +23,80 @@ logging.basicConfig(
     format='%(levelname)s:%(asctime)s: %(message)s',
     level=logging.DEBUG)
 
+TableData = namedtuple(
+    'TableData',
+    'variables keywords arguments object_name imports library_alias')
+_worker_index = None
+
 
 def index_a_table(params):
     """Index a table found from db_path.
-    `params` - Tuple of: db_dir, table_name and index_dir
+    `params` - Tuple of: db_dir, table_name, index_dir, xml_libraries
+    and optionally profile
 
     This is a wrapper function for multiprocessing.Pool
-    to create index for tables in multiple processes.
+    to create index for tables in multiple processes. The Index
+    is reused for all tables indexed in the same process, so that
+    the tables imported by many tables are read only once. If profile
+    is true, returns the profiler statistics of the table, otherwise
+    returns None.
     """
+    global _worker_index
     name = multiprocessing.current_process().name
     logging.info('Starting name: %s', name)
-    db_path, table_name, index_path, xml_libraries = params
-    index = Index(db_path, index_path, xml_libraries)
-    index.index_consturctor(table_name)
+    db_path, table_name, index_path, xml_libraries = params[:4]
+    profile = len(params) > 4 and params[4]
+    if (_worker_index is None or
+            _worker_index.db_path != db_path or
+            _worker_index.index_path != index_path or
+            _worker_index.xml_libraries != xml_libraries):
+        _worker_index = Index(db_path, index_path, xml_libraries)
+    _worker_index.profiler.enabled = profile
+    _worker_index.index_consturctor(table_name)
+    if profile:
+        return _worker_index.profiler.stats()
+    return None
 
 
 class Index(object):
-    """Reads the database and returns index's of keywords and variables"""
+    """Reads the database and returns index's of keywords and variables
+
+    Library tables are found by using the library table mapping created
+    by the scanner, therefore libraries are not imported when index
+    is created.
+
+    Data read from the tables is cached, so that when the same Index
+    is used to create index for many tables, the tables imported by
+    many tables, like BuiltIn and common resources, are read and
+    parsed only once. Cached data is read again if the table size
+    or modification time changes.
 
-    def __init__(self, db_path, index_path, xml_libraries=None):
+    The index file lists only the tables which are imported and the
+    object name used for the keywords of each table. Keywords and
+    variables of the tables are saved once in the symbol tables, which
+    are shared by all indexes in the index_path. If the tables are saved
+    in the SQLite store of the db_path, the index, with all keywords and
+    variables, is saved in the SQLite store of the index_path.
+
+    If ``profiler`` is given, wall time of reading the tables, resolving
+    the imports and writing the index is recorded in the profiler.
+    """
+
+    def __init__(self, db_path, index_path, xml_libraries=None,
+                 profiler=None):
         self.queue = ParsingQueue()
-        self.data_parser = DataParser()
+        self.library_tables = LibraryTables(db_path)
+        self.library_tables.load()
         self.index_path = index_path
         self.db_path = db_path
         self.xml_libraries = xml_libraries
         self.library_alias = []
+        self.table_cache = {}
+        self.builtin_table = None
+        self.xml_tables = None
+        self.table_symbols = {}
+        self.written_symbols = {}
+        self.profiler = profiler or Profiler()
 
     def index_consturctor(self, table):
         """Creates a single table index.
@@ -53,19 +108,45 @@ class Index(object):
         """
         logging.info('Creating index for: {0}'.format(table))
         index_table_path = self.get_index_path(table)
-        data = self.create_index_for_table(self.db_path, table)
-        self.write_data(index_table_path, data)
+        with self.profiler.phase(INDEX_RESOLVE, table):
+            data = self.create_index_for_table(self.db_path, table)
+        with self.profiler.phase(INDEX_WRITE, table):
+            self.write_data(index_table_path, data)
         self.library_alias = []
 
     def write_data(self, index_table_path, data):
+        if get_store(self.db_path):
+            index_path, index_name = path.split(index_table_path)
+            get_store(index_path, create=True).put(index_name, data)
+            return
+        for t_name, object_name in data[DBJsonSetting.tables]:
+            self.write_table_symbols(t_name)
         f = open(index_table_path, 'w')
-        json_dump(data, f)
+        json_dump({
+            DBJsonSetting.tables: data[DBJsonSetting.tables],
+            DBJsonSetting.fingerprint: data[DBJsonSetting.fingerprint]
+        }, f)
         f.close()
 
+    def write_table_symbols(self, t_name):
+        """Writes the symbol table of the t_name, if it is changed after
+        it was written by this Index."""
+        t_key = table_key(path.join(self.db_path, t_name))
+        if (t_key and self.written_symbols.get(t_name) == t_key and
+                path.isfile(symbol_path(self.index_path, t_name))):
+            return
+        keywords, variables = self.table_symbols[t_name]
+        write_symbols(
+            self.index_path, t_name, create_symbols(keywords, variables))
+        self.written_symbols[t_name] = t_key
+
     def create_index_for_table(self, db_path, table_name):
         """Creates index for a single table.
 
-        Index contains all imported kw and variables
+        Index contains all imported kw and variables. Index also
+        contains the fingerprint of the tables, taken before the tables
+        are read, so that it is known when the index must be created
+        again.
         """
         self.queue.clear_queue()
         self.queue.add(table_name, None, None)
@@ -74,11 +155,15 @@ class Index(object):
             self.add_xml_libraries(self.xml_libraries)
         keywords = []
         variables = []
+        tables = []
+        table_keys = []
+        self.table_symbols = {}
         while True:
             item = self.get_item_from_queue()
             if not item:
                 break
             t_name = item[0]
+            table_keys.extend(get_table_keys(db_path, [t_name]))
             kws, vars_ = self.create_index(
                 db_path,
                 t_name,
@@ -88,9 +173,14 @@ class Index(object):
                 keywords.extend(kws)
             if vars_:
                 variables.extend(vars_)
+            tables.append([t_name, kws[0].object_name if kws else None])
+            self.table_symbols[t_name] = (kws, vars_)
         return {
             DBJsonSetting.keyword: keywords,
-            DBJsonSetting.variable: variables
+            DBJsonSetting.variable: variables,
+            DBJsonSetting.tables: tables,
+            DBJsonSetting.fingerprint: get_fingerprint(table_keys),
+            DBJsonSetting.keyword_lookup: self.get_keyword_lookup(keywords)
         }
 
     def create_index(self, db_path, t_name, table_name):
@@ -102,10 +192,12 @@ class Index(object):
         """
         variables = []
         keywords = []
-        data = None
+        table_data = None
         try:
-            data, read_status = self.read_table(path.join(db_path, t_name))
-            variables, keywords = self.parse_table_data(data, t_name)
+            with self.profiler.phase(INDEX_READ, t_name):
+                table_data, read_status = self.read_table_data(
+                    path.join(db_path, t_name))
+            variables, keywords = self.add_table_data(table_data, t_name)
         except ValueError:
                 read_status = 2
         if read_status == 1:
@@ -113,37 +205,110 @@ class Index(object):
             logging.debug('When creating index for: %s', table_name)
         elif read_status == 2:
             logging.error('Unknow ValueError on %s', t_name)
-            if data:
-                logging.debug(data)
+            if table_data:
+                logging.debug(table_data)
             else:
                 logging.debug('Looks like read_table error')
         return keywords, variables
 
     def add_builtin_to_queue(self, db_path):
-        for table in listdir(db_path):
-            if table.lower().startswith('builtin'):
-                self.queue.add(table, None, None)
-                return
+        builtin_table = self.builtin_table
+        if (not builtin_table or
+                not table_exists(path.join(db_path, builtin_table))):
+            builtin_table = None
+            for table in list_tables(db_path):
+                if table.lower().startswith('builtin'):
+                    builtin_table = table
+                    break
+            self.builtin_table = builtin_table
+        if builtin_table:
+            self.queue.add(builtin_table, None, None)
 
     def add_xml_libraries(self, path_to_xml):
-        """Adds the found xml libraries to the queue"""
-        for file_ in finder(path_to_xml, 'xml'):
-            root = ET.parse(file_).getroot()
-            if root.attrib['type'] == DBJsonSetting.library:
-                self.queue.add(lib_table_name(root.attrib['name']), None, None)
+        """Adds the found xml libraries to the queue
 
-    def parse_table_data(self, data, t_name):
-        var = self.get_variables(data)
+        The xml libraries are searched only once for the Index.
+        """
+        if self.xml_tables is None:
+            self.xml_tables = []
+            for file_ in finder(path_to_xml, 'xml'):
+                root = ET.parse(file_).getroot()
+                if root.attrib['type'] == DBJsonSetting.library:
+                    self.xml_tables.append(
+                        lib_table_name(root.attrib['name']))
+        for table in self.xml_tables:
+            self.queue.add(table, None, None)
+
+    def read_table_data(self, t_path):
+        """Returns the TableData and the read status of the t_path.
+
+        TableData is read from the cache if the table is not changed
+        after it was cached. Library imports are not cached but resolved
+        on every read, because the library tables may change without
+        changes in the table itself.
+        """
+        t_key = table_key(t_path)
+        cached = self.table_cache.get(t_path)
+        if t_key and cached and cached[0] == t_key:
+            t_key, table_data, libraries = cached
+            return self.resolve_libraries(table_data, libraries), 0
+        data, read_status = self.read_table(t_path)
+        table_data = self.get_file_table_data(data)
+        libraries = data.get(DBJsonSetting.libraries, [])
+        if t_key and read_status == 0:
+            self.table_cache[t_path] = (t_key, table_data, libraries)
+        return self.resolve_libraries(table_data, libraries), read_status
+
+    def get_table_data(self, data):
+        """Returns the data needed for indexing from the table data"""
+        return self.resolve_libraries(
+            self.get_file_table_data(data),
+            data.get(DBJsonSetting.libraries, []))
+
+    def get_file_table_data(self, data):
+        """Returns the TableData without the library imports"""
         kw, args = self.get_keywords(data)
         if kw:
             object_name = self.get_object_name(data)
+        else:
+            object_name = None
+        return TableData(
+            variables=self.get_variables(data),
+            keywords=kw,
+            arguments=args,
+            object_name=object_name,
+            imports=self.get_file_imports(data),
+            library_alias=[]
+        )
+
+    def resolve_libraries(self, table_data, libraries):
+        """Returns the table_data with the library imports resolved"""
+        library_alias = self.get_library_tables(
+            {DBJsonSetting.libraries: libraries})
+        imports = [table_name for table_name, alias in library_alias]
+        return table_data._replace(
+            imports=imports + table_data.imports,
+            library_alias=library_alias)
+
+    def parse_table_data(self, data, t_name):
+        return self.add_table_data(self.get_table_data(data), t_name)
+
+    def add_table_data(self, table_data, t_name):
+        """Adds table imports to the queue and returns the variables
+        and keywords for the index."""
+        if table_data.keywords:
             kw_index = self.get_kw_for_index(
-                kw, args, t_name, object_name)
+                table_data.keywords,
+                table_data.arguments,
+                t_name,
+                table_data.object_name
+            )
         else:
             kw_index = []
-        self.add_imports_to_queue(self.get_imports(data))
+        self.library_alias.extend(table_data.library_alias)
+        self.add_imports_to_queue(table_data.imports)
         self.queue.set(t_name)
-        return var, kw_index
+        return list(table_data.variables), kw_index
 
     def add_imports_to_queue(self, imports):
         for import_ in imports:
@@ -170,9 +335,14 @@ class Index(object):
             return object_name
 
     def get_imports(self, data):
+        library_alias = self.get_library_tables(data)
+        self.library_alias.extend(library_alias)
+        result = [table_name for table_name, alias in library_alias]
+        return result + self.get_file_imports(data)
+
+    def get_file_imports(self, data):
+        """Returns the tables of the resource and variable file imports"""
         result = []
-        if DBJsonSetting.libraries in data:
-            result += self.get_library_imports(data)
         if DBJsonSetting.variable_files in data:
             for var in data[DBJsonSetting.variable_files]:
                 result.append(rf_table_name(var.keys()[0]))
@@ -181,34 +351,34 @@ class Index(object):
                 result.append(rf_table_name(resource))
         return result
 
-    def get_library_imports(self, data):
+    def get_library_tables(self, data):
+        """Returns list of library table name and library alias pairs"""
         l = []
-        for lib in data[DBJsonSetting.libraries]:
+        for lib in data.get(DBJsonSetting.libraries, []):
             if lib[DBJsonSetting.library_path]:
                 lib_import = lib[DBJsonSetting.library_path]
             else:
                 lib_import = lib[DBJsonSetting.library_name]
-            lib_args = lib[DBJsonSetting.library_arguments]
-            lib_data = None
-            try:
-                lib_data = self.data_parser.parse_library(
-                    lib_import,
-                    lib_args
-                )
-            except ValueError:
-                message = ('Unable to parse library "{0}"'
-                           ', with args: "{1}"'.format(lib_import, lib_args))
+            table_name = self.get_library_table_name(lib_import)
+            if not table_name:
+                message = ('Unable to find table for library "{0}"'
+                           ', with args: "{1}"'.format(
+                               lib_import,
+                               lib[DBJsonSetting.library_arguments]))
                 logging.error(message)
-            if lib_data:
-                table_name = lib_table_name(
-                    lib_data[DBJsonSetting.library_module]
-                )
-                l.append(table_name)
-                self.library_alias.append(
-                    (table_name, lib[DBJsonSetting.library_alias])
-                )
+            else:
+                l.append((table_name, lib[DBJsonSetting.library_alias]))
         return l
 
+    def get_library_table_name(self, lib_import):
+        """Returns the table name of the library import.
+
+        If the library is not found from the library table mapping, table
+        name is created from the library module name, if such table exists
+        in the database. Otherwise returns None.
+        """
+        return self.library_tables.find(lib_import)
+
     def get_variables(self, data):
         result = []
         if DBJsonSetting.variables in data:
@@ -266,6 +436,19 @@ class Index(object):
             )
         return kw_index
 
+    def get_keyword_lookup(self, keywords):
+        """Returns the normalised keyword name to keyword locations map
+
+        Location is list of: object name, table name and keyword name.
+        Locations are in the same order as the keywords in the index.
+        """
+        lookup = {}
+        for kw in keywords:
+            key = normalise_kw(kw.keyword).lstrip('.')
+            lookup.setdefault(key, []).append(
+                [kw.object_name, kw.table_name, kw.keyword])
+        return lookup
+
     def get_library_alias(self, table_name):
         for library_alias in self.library_alias:
             if library_alias[0] == table_name and library_alias[1]:
@@ -273,16 +456,14 @@ class Index(object):
 
     def read_table(self, t_path):
         try:
-            f = open(t_path)
+            data = read_table(t_path)
             status = 0
         except IOError:
             logging.warning('Could not open table: %s', t_path)
             similar = self.find_similar_table(t_path)
             logging.info('Instead of %s using: %s', t_path, similar)
-            f = open(similar)
+            data = read_table(similar)
             status = 1
-        data = json_load(f)
-        f.close()
         return data, status
 
     def find_similar_table(self, t_path):
@@ -290,7 +471,7 @@ class Index(object):
         name = path.basename(t_path).split('-', 1)[0]
         similar_table = None
         if path.exists(path_):
-            dir_list = listdir(path_)
+            dir_list = list_tables(path_)
         else:
             dir_list = []
         for f_name in dir_list:
@@ -0,0 +1,70 @@
+from os import path, makedirs, remove
+try:
+    from db_json_settings import DBJsonSetting
+except:
+    from ...setting.db_json_settings import DBJsonSetting
+
+DOC_STORE_DIR = 'doc_store'
+
+
+def doc_store_path(table_path):
+    """Returns path to the doc store of the table in the table_path"""
+    db_path, table_name = path.split(table_path)
+    return path.join(
+        db_path,
+        DOC_STORE_DIR,
+        '{0}.docs'.format(path.splitext(table_name)[0])
+    )
+
+
+def split_documentation(data, table_path):
+    """Writes the keyword documentation to the doc store of the table
+
+    ``data``       -- Table data created by the data parser.
+    ``table_path`` -- Path to the table where data is written.
+
+    Returns copy of the data where documentation of each keyword is
+    replaced with the offset and length of the documentation in the doc
+    store. Documentation is most of the table data for the libraries and
+    it is only needed when the keyword documentation is shown.
+    """
+    doc_path = doc_store_path(table_path)
+    keywords = data.get(DBJsonSetting.keywords)
+    if not keywords:
+        if path.exists(doc_path):
+            remove(doc_path)
+        return data
+    if not path.exists(path.dirname(doc_path)):
+        makedirs(path.dirname(doc_path))
+    table_keywords = {}
+    offset = 0
+    with open(doc_path, 'wb') as f:
+        for kw_key in sorted(keywords):
+            kw = dict(keywords[kw_key])
+            documentation = kw.pop(DBJsonSetting.documentation, None) or ''
+            if not isinstance(documentation, bytes):
+                documentation = documentation.encode('utf-8')
+            f.write(documentation)
+            kw[DBJsonSetting.documentation_offset] = [
+                offset, len(documentation)]
+            offset += len(documentation)
+            table_keywords[kw_key] = kw
+    data = dict(data)
+    data[DBJsonSetting.keywords] = table_keywords
+    return data
+
+
+def get_documentation(table_path, keyword):
+    """Returns the documentation of the keyword in the table_path
+
+    ``keyword`` -- Keyword data from the table.
+
+    Only the documentation of the keyword is read from the doc store.
+    Tables created before the doc store contain the documentation.
+    """
+    if DBJsonSetting.documentation in keyword:
+        return keyword[DBJsonSetting.documentation]
+    offset, length = keyword[DBJsonSetting.documentation_offset]
+    with open(doc_store_path(table_path), 'rb') as f:
+        f.seek(offset)
+        return f.read(length).decode('utf-8')
@@ -1,6 +1,9 @@
+import re
 from hashlib import md5
 from os import path
 
+TABLE_NAME_RE = re.compile(r'-[0-9a-f]{32}\.json$')
+
 
 def rf_table_name(f_path):
     md5sum = md5(f_path.encode('utf-8')).hexdigest()
@@ -15,3 +18,16 @@ def lib_table_name(library):
                 realname=library,
                 md5=md5(library).hexdigest()
             )
+
+
+def is_table_name(f_name):
+    """Returns True if f_name is a table created by the scanner"""
+    return TABLE_NAME_RE.search(f_name) is not None
+
+
+def normalise_kw(keyword):
+    """Returns the keyword name in the form used to compare keywords
+
+    Case, spaces and under scores are ignored in the keyword names.
+    """
+    return keyword.lower().replace(' ', '').replace('_', '')
@@ -0,0 +1,96 @@
+import json
+import logging
+from os import path
+try:
+    from db_json_settings import DBJsonSetting
+except:
+    from ...setting.db_json_settings import DBJsonSetting
+
+IMPORT_CATALOG_NAME = 'import_catalog.json'
+IMPORT_CATALOG_VERSION = 1
+
+
+def get_catalog_entry(data):
+    """Returns the import catalog entry of the table data or None
+
+    Entry is list of: import kind, name and path. Kind is library,
+    resource_file or variable_file. Test suites are resource_file
+    like the resource files, because they are not separated in the
+    tables. Returns None if the table can not be imported.
+    """
+    if DBJsonSetting.library_module in data:
+        library_module = data[DBJsonSetting.library_module]
+        return [
+            DBJsonSetting.library,
+            library_module,
+            data.get(DBJsonSetting.file_path, library_module)
+        ]
+    elif DBJsonSetting.file_path not in data:
+        return None
+    elif DBJsonSetting.variable_files in data:
+        kind = DBJsonSetting.resource_file
+    elif DBJsonSetting.keywords not in data:
+        kind = DBJsonSetting.variable_file
+    else:
+        return None
+    return [
+        kind,
+        data[DBJsonSetting.file_name],
+        data[DBJsonSetting.file_path]
+    ]
+
+
+class ImportCatalog(object):
+    """Catalog of the libraries, resources and variable files in the
+    database.
+
+    The catalog is created by the scanner and saved in the database
+    folder. It records the import kind, name and path of each table, so
+    that the available imports are found without reading the tables.
+    """
+    def __init__(self, db_path):
+        self.path = path.join(db_path, IMPORT_CATALOG_NAME)
+        self.tables = {}
+
+    def exists(self):
+        return path.isfile(self.path)
+
+    def load(self):
+        self.tables = {}
+        if not self.exists():
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except ValueError:
+            logging.warning('Ignoring corrupted import catalog: %s',
+                            self.path)
+            return
+        if data.get('version') == IMPORT_CATALOG_VERSION:
+            self.tables = data['tables']
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump(
+                {'version': IMPORT_CATALOG_VERSION, 'tables': self.tables}, f)
+
+    def set_entry(self, table_name, entry):
+        """Sets the entry, returned by `get_catalog_entry`, of the table"""
+        if entry:
+            self.tables[table_name] = list(entry)
+        else:
+            self.tables.pop(table_name, None)
+
+    def retain(self, tables):
+        """Removes tables which are not in the tables"""
+        for table_name in list(self.tables):
+            if table_name not in tables:
+                del self.tables[table_name]
+
+    def get_imports(self, kind):
+        """Returns list of name and path of the imports of the kind"""
+        imports = [
+            [entry[1], entry[2]] for entry in self.tables.values()
+            if entry[0] == kind
+        ]
+        return sorted(imports)
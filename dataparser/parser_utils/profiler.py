@@ -0,0 +1,172 @@
+import cProfile
+import logging
+from timeit import default_timer
+
+# Phases recorded by the Scanner, DataParser and Index.
+DISCOVERY = 'discovery'
+QUEUE = 'queue'
+RF_PARSE = 'rf_parse'
+LIBDOC = 'libdoc'
+VARIABLE_FILE = 'variable_file'
+TABLE_READ = 'table_read'
+JSON_WRITE = 'json_write'
+INDEX_READ = 'index_read'
+INDEX_RESOLVE = 'index_resolve'
+INDEX_WRITE = 'index_write'
+
+
+class _Timer(object):
+    """Context manager which adds the elapsed time to the profiler"""
+
+    def __init__(self, profiler, name, item):
+        self.profiler = profiler
+        self.name = name
+        self.item = item
+        self.start = None
+
+    def __enter__(self):
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.add(self.name, default_timer() - self.start, self.item)
+        return False
+
+
+class _NullTimer(object):
+    """Context manager used when the profiler is not enabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class Profiler(object):
+    """Records the wall time and the count of the scan and index phases.
+
+    Time is recorded for each phase and, when the ``item`` is given, for
+    each file, library or table of the phase, so that the slowest items
+    can be listed in the summary. Phases can be nested, example the
+    ``index_read`` is part of the ``index_resolve``. Profiler which is
+    not enabled does not record anything and the ``phase`` returns a
+    shared null context manager, so the instrumentation has no cost when
+    profiling is not used.
+
+    If ``profile_dump`` is given, the profiler is enabled and the run is
+    also profiled with cProfile between ``start`` and ``finish`` and the
+    cProfile statistics are written to the ``profile_dump`` file. Only
+    the current process is profiled with cProfile, phases recorded in
+    the worker processes are merged with ``merge``.
+
+    Example:
+        profiler = Profiler(enabled=True)
+        with profiler.phase(RF_PARSE, file_path):
+            parse(file_path)
+        profiler.log_summary()
+    """
+
+    def __init__(self, enabled=False, profile_dump=None):
+        self.enabled = enabled or bool(profile_dump)
+        self.profile_dump = profile_dump
+        self.phases = {}
+        self.items = {}
+        self._cprofile = None
+
+    def phase(self, name, item=None):
+        """Returns context manager which records the time of the phase"""
+        if not self.enabled:
+            return NULL_TIMER
+        return _Timer(self, name, item)
+
+    def iterate(self, name, iterable):
+        """Returns iterator which records the time of getting each item
+        from the iterable in the phase"""
+        if not self.enabled:
+            return iterable
+        return self._iterate(name, iter(iterable))
+
+    def _iterate(self, name, iterator):
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def add(self, name, elapsed, item=None, count=1):
+        """Adds the elapsed seconds to the phase and to the item"""
+        calls, total = self.phases.get(name, (0, 0.0))
+        self.phases[name] = (calls + count, total + elapsed)
+        if item is not None:
+            key = (name, item)
+            self.items[key] = self.items.get(key, 0.0) + elapsed
+
+    def stats(self):
+        """Returns the recorded phases and items and resets them.
+
+        Used to send the statistics from the worker process to the
+        profiler of the main process, see ``merge``.
+        """
+        stats = (self.phases, self.items)
+        self.phases = {}
+        self.items = {}
+        return stats
+
+    def merge(self, stats):
+        """Adds the statistics returned by the ``stats`` to the profiler"""
+        if not stats:
+            return
+        phases, items = stats
+        for name, (calls, total) in phases.items():
+            self.add(name, total, count=calls)
+        for key, elapsed in items.items():
+            self.items[key] = self.items.get(key, 0.0) + elapsed
+
+    def start(self):
+        """Starts the cProfile, if profile_dump is given"""
+        if self.profile_dump and self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def finish(self, count=10):
+        """Stops the cProfile, writes the profile_dump, logs the
+        summary of the run and clears the recorded phases"""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.profile_dump)
+            self._cprofile = None
+            logging.info('cProfile statistics written to: %s',
+                         self.profile_dump)
+        self.log_summary(count)
+        self.stats()
+
+    def summary(self, count=10):
+        """Returns the summary of the phases and the ``count`` slowest
+        items of each phase as list of lines"""
+        lines = ['Profile summary:']
+        phases = sorted(
+            self.phases.items(), key=lambda phase: phase[1][1], reverse=True)
+        for name, (calls, total) in phases:
+            lines.append('{0}: {1:.3f} s, {2} calls'.format(
+                name, total, calls))
+        for name, _ in phases:
+            items = sorted(
+                [(elapsed, key[1]) for key, elapsed in self.items.items()
+                 if key[0] == name],
+                reverse=True)
+            if not items:
+                continue
+            lines.append('Slowest in {0}:'.format(name))
+            for elapsed, item in items[:count]:
+                lines.append('    {0:.3f} s: {1}'.format(elapsed, item))
+        return lines
+
+    def log_summary(self, count=10):
+        if self.enabled:
+            logging.info('\n'.join(self.summary(count)))
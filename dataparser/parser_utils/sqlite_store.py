@@ -0,0 +1,349 @@
+import json
+import threading
+from os import path, stat, getpid
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+try:
+    from file_formatter import normalise_kw
+    from db_json_settings import DBJsonSetting
+except:
+    from .file_formatter import normalise_kw
+    from ...setting.db_json_settings import DBJsonSetting
+
+SQLITE_DB_NAME = 'database.sqlite'
+JSON_BACKEND = 'json'
+SQLITE_BACKEND = 'sqlite'
+# Stores with older schema version do not have the records of all tables.
+SCHEMA_VERSION = 1
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS files '
+    '(revision INTEGER PRIMARY KEY AUTOINCREMENT, '
+    'name TEXT UNIQUE NOT NULL, data TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS keywords '
+    '(file TEXT, keyword TEXT, normalised TEXT, object_name TEXT, '
+    'source TEXT, data TEXT)',
+    'CREATE INDEX IF NOT EXISTS keywords_normalised '
+    'ON keywords (normalised, file)',
+    'CREATE INDEX IF NOT EXISTS keywords_file ON keywords (file)',
+    'CREATE TABLE IF NOT EXISTS variables (file TEXT, variable TEXT)',
+    'CREATE INDEX IF NOT EXISTS variables_file ON variables (file)',
+    'CREATE TABLE IF NOT EXISTS imports '
+    '(file TEXT, import_type TEXT, import TEXT)',
+    'CREATE INDEX IF NOT EXISTS imports_file ON imports (file)'
+)
+RECORD_TABLES = ('keywords', 'variables', 'imports')
+
+
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+_STORES_PID = None
+# Connections must not be used, or closed, in the forked processes, so
+# the stores of the parent are kept here and not garbage collected.
+_INHERITED_STORES = []
+
+
+def sqlite_available():
+    """Returns True if the sqlite3 module can be imported"""
+    return sqlite3 is not None
+
+
+def _file_identity(db_file):
+    """Returns the identity of db_file, which changes when it is replaced
+
+    Windows may not report the inode, so creation time is used instead.
+    """
+    try:
+        db_stat = stat(db_file)
+    except OSError:
+        return None
+    return db_stat.st_dev, db_stat.st_ino or db_stat.st_ctime
+
+
+def get_store(db_path, create=False):
+    """Returns the SQLite store of the db_path or None if there is none
+
+    Store is opened once and shared until the database.sqlite is replaced
+    or removed. If ``create`` is True, store is returned also when the
+    database.sqlite does not exist, and it is created on the first write.
+    """
+    global _STORES_PID
+    if not sqlite3:
+        return None
+    identity = _file_identity(path.join(db_path, SQLITE_DB_NAME))
+    with _STORES_LOCK:
+        if _STORES_PID != getpid():
+            _INHERITED_STORES.extend(_STORES.values())
+            _STORES.clear()
+            _STORES_PID = getpid()
+        store, store_identity = _STORES.get(db_path, (None, None))
+        if store is not None and store_identity == identity:
+            return store
+        if store is not None:
+            store.close()
+            del _STORES[db_path]
+        if identity is None and not create:
+            return None
+        store = SQLiteStore(db_path)
+        _STORES[db_path] = store, identity
+        return store
+
+
+def read_table(t_path):
+    """Returns the data of the table in t_path
+
+    Table is read from the JSON file. If the JSON file does not exist,
+    table is read from the SQLite store in the same folder. Raises
+    IOError if the table is not found.
+    """
+    try:
+        with open(t_path) as f:
+            return json.load(f)
+    except IOError:
+        db_path, table_name = path.split(t_path)
+        store = get_store(db_path)
+        data = store.get(table_name) if store else None
+        if data is None:
+            raise
+        return data
+
+
+def table_exists(t_path):
+    """Returns True if table is found from the JSON file or SQLite store"""
+    if path.isfile(t_path):
+        return True
+    db_path, table_name = path.split(t_path)
+    store = get_store(db_path)
+    return store is not None and store.has(table_name)
+
+
+def table_key(t_path):
+    """Returns the key which changes when the table in t_path changes
+
+    Key is the modification time and size of the JSON file, or the
+    revision of the table in the SQLite store. Returns None if the table
+    is not found.
+    """
+    try:
+        t_stat = stat(t_path)
+        return t_stat.st_mtime, t_stat.st_size
+    except OSError:
+        db_path, table_name = path.split(t_path)
+        store = get_store(db_path)
+        revision = store.revision(table_name) if store else None
+        if revision is None:
+            return None
+        return SQLITE_BACKEND, revision
+
+
+def find_keywords(t_path, keyword):
+    """Returns the keywords of the table in t_path matching to keyword
+
+    Keywords are searched by the normalised keyword name from the
+    keywords table of the SQLite store, without reading the table data.
+    See `SQLiteStore.find_keywords` for the returned records. Returns
+    None if the table is not in the SQLite store or the store does not
+    have the records, then the whole table must be read.
+    """
+    if path.isfile(t_path):
+        return None
+    db_path, table_name = path.split(t_path)
+    store = get_store(db_path)
+    if store is None:
+        return None
+    return store.find_keywords(table_name, keyword)
+
+
+def get_records(name, data):
+    """Returns keywords, variables and imports of the table or index data
+
+    Records are tuples which are saved in the keywords, variables and
+    imports tables of the SQLite store.
+    """
+    keywords = []
+    for kw in data.get(DBJsonSetting.keyword, []):
+        keywords.append(
+            (name, kw[0], normalise_kw(kw[0]).lstrip('.'), kw[2], kw[3],
+             None))
+    if data.get(DBJsonSetting.keywords):
+        if DBJsonSetting.library_module in data:
+            object_name = data[DBJsonSetting.library_module]
+        else:
+            object_name = data[DBJsonSetting.file_name].split('.')[0]
+        for kw in data[DBJsonSetting.keywords].values():
+            kw_name = kw[DBJsonSetting.keyword_name]
+            keywords.append((name, kw_name, normalise_kw(kw_name).lstrip('.'),
+                             object_name, name, json.dumps(kw)))
+    variables = []
+    for key in (DBJsonSetting.variables, DBJsonSetting.variable):
+        for var in data.get(key, []):
+            variables.append((name, var))
+    imports = []
+    for lib in data.get(DBJsonSetting.libraries, []):
+        imports.append(
+            (name, DBJsonSetting.library, lib[DBJsonSetting.library_name]))
+    for var in data.get(DBJsonSetting.variable_files, []):
+        imports.append(
+            (name, DBJsonSetting.variable_file, list(var.keys())[0]))
+    for resource in data.get(DBJsonSetting.resources, []):
+        imports.append((name, DBJsonSetting.resource_file, resource))
+    return keywords, variables, imports
+
+
+class SQLiteStore(object):
+    """Saves the tables, or the indexes, of a folder in a single file
+
+    Data of each table is saved as JSON in the files table, and it is
+    returned in the same format as from the JSON files. Keywords,
+    variables and imports of each table are saved also in their own
+    tables, so that they can be queried without reading the table
+    data. Keywords are indexed by the normalised keyword name.
+
+    Tables are written in a transaction and the database uses the
+    write-ahead log, so readers are not blocked by a writing process.
+    Each write gives the table a new revision, which is used to detect
+    the changed tables. The write-ahead log and the schema are set up on
+    the first write, reading uses the connection as it is.
+
+    Store can be shared between threads, use of the connection is
+    serialised with a lock.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.db_file = path.join(db_path, SQLITE_DB_NAME)
+        self._connection = None
+        self._schema_created = False
+        self._has_records = False
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.db_file, timeout=60, check_same_thread=False)
+        return self._connection
+
+    def put(self, name, data):
+        """Saves the table data with the name"""
+        with self._lock:
+            with self._writer() as connection:
+                self._delete(connection, name)
+                self._insert(connection, name, data)
+
+    def get(self, name):
+        """Returns the table data or None if table is not found"""
+        rows = self._select(
+            'SELECT data FROM files WHERE name = ?', (name,))
+        if rows:
+            return json.loads(rows[0][0])
+        return None
+
+    def has(self, name):
+        return self.revision(name) is not None
+
+    def revision(self, name):
+        """Returns the revision of the table or None if it is not found"""
+        rows = self._select(
+            'SELECT revision FROM files WHERE name = ?', (name,))
+        if rows:
+            return rows[0][0]
+        return None
+
+    def find_keywords(self, name, keyword):
+        """Returns the keywords of the table matching to the keyword
+
+        Keyword names are compared in the normalised form. Returns list
+        of: keyword name, object name, the table name where keyword is
+        defined and the keyword data of the table, which is None for the
+        keywords of an index. Returns None if the table is not found or
+        store does not have the records of the tables.
+        """
+        if not self.has_records():
+            return None
+        rows = self._select(
+            'SELECT keyword, object_name, source, data FROM keywords '
+            'WHERE normalised = ? AND file = ? ORDER BY rowid',
+            (normalise_kw(keyword), name))
+        if not rows and not self.has(name):
+            return None
+        return [
+            (kw, object_name, source, json.loads(data) if data else None)
+            for kw, object_name, source, data in rows
+        ]
+
+    def has_records(self):
+        """Returns True if the records of all tables are in the store"""
+        if not self._has_records:
+            rows = self._select('PRAGMA user_version')
+            self._has_records = bool(rows) and rows[0][0] >= SCHEMA_VERSION
+        return self._has_records
+
+    def names(self):
+        return [row[0] for row in self._select('SELECT name FROM files')]
+
+    def remove(self, name):
+        with self._lock:
+            with self._writer() as connection:
+                self._delete(connection, name)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+                self._schema_created = False
+                self._has_records = False
+
+    def _select(self, query, params=()):
+        with self._lock:
+            if self._connection is None and not path.isfile(self.db_file):
+                return []
+            return self.connection.execute(query, params).fetchall()
+
+    def _writer(self):
+        """Returns the connection, with the schema created, for writing"""
+        connection = self.connection
+        if not self._schema_created:
+            connection.execute('PRAGMA journal_mode=WAL')
+            with connection:
+                for statement in SCHEMA:
+                    connection.execute(statement)
+                version = connection.execute(
+                    'PRAGMA user_version').fetchone()[0]
+                if version < SCHEMA_VERSION:
+                    self._add_records(connection)
+                    connection.execute(
+                        'PRAGMA user_version = {0}'.format(SCHEMA_VERSION))
+            self._schema_created = True
+        return connection
+
+    def _add_records(self, connection):
+        """Adds the records of the tables saved without the records"""
+        for table in RECORD_TABLES:
+            connection.execute('DELETE FROM {0}'.format(table))
+        rows = connection.execute('SELECT name, data FROM files').fetchall()
+        for name, data in rows:
+            self._insert_records(connection, name, json.loads(data))
+
+    def _insert(self, connection, name, data):
+        connection.execute(
+            'INSERT INTO files (name, data) VALUES (?, ?)',
+            (name, json.dumps(data)))
+        self._insert_records(connection, name, data)
+
+    def _insert_records(self, connection, name, data):
+        keywords, variables, imports = get_records(name, data)
+        connection.executemany(
+            'INSERT INTO keywords VALUES (?, ?, ?, ?, ?, ?)', keywords)
+        connection.executemany(
+            'INSERT INTO variables VALUES (?, ?)', variables)
+        connection.executemany(
+            'INSERT INTO imports VALUES (?, ?, ?)', imports)
+
+    def _delete(self, connection, name):
+        connection.execute('DELETE FROM files WHERE name = ?', (name,))
+        for table in RECORD_TABLES:
+            connection.execute(
+                'DELETE FROM {0} WHERE file = ?'.format(table), (name,))
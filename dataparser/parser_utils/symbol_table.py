@@ -0,0 +1,108 @@
+import json
+from os import path, makedirs, stat
+try:
+    from file_formatter import normalise_kw
+    from sqlite_store import read_table
+    from util import write_file
+    from db_json_settings import DBJsonSetting
+except:
+    from .file_formatter import normalise_kw
+    from .sqlite_store import read_table
+    from .util import write_file
+    from ...setting.db_json_settings import DBJsonSetting
+
+SYMBOLS_DIR = 'symbols'
+# Parsed symbol tables by path. Value is tuple of: (mtime, size) and data.
+_SYMBOL_CACHE = {}
+
+
+def symbol_path(index_path, table_name):
+    """Returns path to the symbol table of the table_name"""
+    return path.join(index_path, SYMBOLS_DIR, table_name)
+
+
+def create_symbols(keywords, variables):
+    """Returns the symbol table data of a database table
+
+    ``keywords``  -- Keyword records of the table in the index.
+    ``variables`` -- Variables of the table.
+
+    Symbol table contains the keywords and variables of the table, which
+    are same in every index importing the table. Keyword is list of:
+    keyword name, arguments and normalised keyword name.
+    """
+    return {
+        DBJsonSetting.keyword: [
+            [kw.keyword, kw.argument, normalise_kw(kw.keyword).lstrip('.')]
+            for kw in keywords
+        ],
+        DBJsonSetting.variable: list(variables)
+    }
+
+
+def write_symbols(index_path, table_name, symbols):
+    """Writes the symbol table of the table_name to the index_path
+
+    Index is created in multiple processes, which may write the same
+    symbol table at the same time, therefore symbol table is written to
+    temporary file first.
+    """
+    s_path = symbol_path(index_path, table_name)
+    s_dir = path.dirname(s_path)
+    if not path.exists(s_dir):
+        try:
+            makedirs(s_dir)
+        except OSError:
+            pass
+    write_file(s_path, json.dumps(symbols))
+
+
+def read_symbols(index_path, table_name):
+    """Returns the symbol table of the table_name
+
+    Symbol tables are shared by many indexes, so they are cached and read
+    again only when the file changes.
+    """
+    s_path = symbol_path(index_path, table_name)
+    s_stat = stat(s_path)
+    key = (s_stat.st_mtime, s_stat.st_size)
+    cached = _SYMBOL_CACHE.get(s_path)
+    if cached and cached[0] == key:
+        return cached[1]
+    with open(s_path) as f:
+        symbols = json.load(f)
+    _SYMBOL_CACHE[s_path] = (key, symbols)
+    return symbols
+
+
+def read_index(index_table_path):
+    """Returns the index data of the index_table_path
+
+    The index only lists the tables it imports, with the object name used
+    for the keywords of the table, and the keywords and variables of the
+    tables are read from the symbol tables. Returned data contains the
+    keyword records, variables and the keyword lookup in the same format
+    as they are created by the Index. Index in the old format, which
+    contains the keyword records, is returned as it is.
+    """
+    data = read_table(index_table_path)
+    if DBJsonSetting.keyword in data:
+        return data
+    index_path = path.dirname(index_table_path)
+    keywords = []
+    variables = []
+    lookup = {}
+    for table_name, object_name in data[DBJsonSetting.tables]:
+        symbols = read_symbols(index_path, table_name)
+        for kw, args, normalised in symbols[DBJsonSetting.keyword]:
+            keywords.append([kw, args, object_name, table_name])
+            lookup.setdefault(normalised, []).append(
+                [object_name, table_name, kw])
+        variables.extend(symbols[DBJsonSetting.variable])
+    return {
+        DBJsonSetting.keyword: keywords,
+        DBJsonSetting.variable: variables,
+        DBJsonSetting.keyword_lookup: lookup,
+        DBJsonSetting.tables: data[DBJsonSetting.tables],
+        DBJsonSetting.fingerprint: data.get(DBJsonSetting.fingerprint)
+    }
@@ -1,4 +1,15 @@
-from os import path
+import json
+from hashlib import md5
+from os import path, listdir, fdopen, remove, rename
+from tempfile import mkstemp
+try:
+    from file_formatter import is_table_name, normalise_kw
+    from sqlite_store import get_store, read_table, table_key
+    from db_json_settings import DBJsonSetting
+except:
+    from .file_formatter import is_table_name, normalise_kw
+    from .sqlite_store import get_store, read_table, table_key
+    from ...setting.db_json_settings import DBJsonSetting
 
 
 def normalise_path(f_path):
@@ -8,5 +19,82 @@ def normalise_path(f_path):
     return path.join(dirname, basename)
 
 
+def replace_file(tmp_path, f_path):
+    """Renames tmp_path to f_path, replacing f_path if it exists"""
+    try:
+        rename(tmp_path, f_path)
+    except OSError:
+        # Windows does not allow renaming over an existing file
+        remove(f_path)
+        rename(tmp_path, f_path)
+
+
+def write_file(f_path, content, mode='w'):
+    """Writes the content to f_path through a temporary file
+
+    Temporary file is written in the same folder and renamed to f_path,
+    so that readers in other threads or processes never see a partially
+    written file.
+    """
+    fd, tmp_path = mkstemp(dir=path.dirname(f_path), suffix='.tmp')
+    with fdopen(fd, mode) as f:
+        f.write(content)
+    replace_file(tmp_path, f_path)
+
+
+def file_md5(f_path):
+    """Returns md5 hex digest from the content of the f_path"""
+    md5sum = md5()
+    with open(f_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            md5sum.update(chunk)
+    return md5sum.hexdigest()
+
+
 def get_index_name(table_name):
     return 'index-{0}'.format(table_name)
+
+
+def get_table_keys(db_path, table_names):
+    """Returns list of table name and table key pairs"""
+    return [
+        [t_name, table_key(path.join(db_path, t_name))]
+        for t_name in table_names
+    ]
+
+
+def get_fingerprint(table_keys):
+    """Returns fingerprint of the table keys, see get_table_keys"""
+    return md5(json.dumps(table_keys).encode('utf-8')).hexdigest()
+
+
+def index_up_to_date(db_path, index_table_path):
+    """Returns True if none of the tables in the index has changed
+
+    Index contains the fingerprint of the modification time and size of
+    the tables, which were used to create the index. Index is up to date
+    when the tables have the same fingerprint now. Returns False if the
+    index does not exist or it is created without the fingerprint.
+    """
+    try:
+        data = read_table(index_table_path)
+    except (IOError, ValueError):
+        return False
+    if DBJsonSetting.fingerprint not in data:
+        return False
+    table_names = [table[0] for table in data[DBJsonSetting.tables]]
+    return data[DBJsonSetting.fingerprint] == get_fingerprint(
+        get_table_keys(db_path, table_names))
+
+
+def list_tables(db_path):
+    """Returns the table names found from the db_path
+
+    Other files in the db_path, like the scan manifest, are not tables
+    and are not returned. Tables saved in the SQLite store of the db_path
+    are also returned."""
+    tables = [f for f in listdir(db_path) if is_table_name(f)]
+    store = get_store(db_path)
+    if store:
+        tables.extend(set(store.names()) - set(tables))
+    return tables
@@ -1,13 +1,99 @@
 import os
 import fnmatch
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
 
+# Folders which do not contain Robot Framework data, but which may contain
+# a lot of files.
+DEFAULT_IGNORE = (
+    '.git',
+    '.hg',
+    '.svn',
+    'node_modules',
+    '__pycache__',
+    '.tox',
+    '.venv',
+    'venv',
+    '*.egg-info'
+)
+# Folder containing this file is a Python virtual environment.
+VIRTUALENV_MARKER = 'pyvenv.cfg'
 
-def finder(path, ext):
-    """Returns files from path by extension"""
-    l = []
+
+def finder(path, ext, ignore=None):
+    """Yields files from path by extension
+
+    Files are yielded while the folders are walked, so that the files can
+    be processed before the whole path is walked.
+
+    ``ignore`` -- List of glob patterns. Files and folders matching the
+    pattern are not yielded and folders are not walked. Pattern is matched
+    to the file or folder name and to the path relative to the ``path``,
+    where the path separator is ``/``. If None, DEFAULT_IGNORE is used.
+
+    Python virtual environments are not walked. Symbolic links to folders
+    are followed, but the same folder is walked only once, so symbolic
+    link loops are not walked forever.
+    """
     if not ext.startswith('*.'):
         ext = '*.{0}'.format(ext)
-    for path, dirs, files in os.walk(os.path.abspath(path)):
-        for f in fnmatch.filter(files, ext):
-            l.append(os.path.join(path, f))
-    return l
+    if ignore is None:
+        ignore = DEFAULT_IGNORE
+    root = os.path.abspath(path)
+    visited = set()
+    stack = [(root, '')]
+    while stack:
+        dir_path, rel_path = stack.pop()
+        dir_key = _dir_key(dir_path)
+        if dir_key is None or dir_key in visited:
+            continue
+        visited.add(dir_key)
+        entries = _entries(dir_path)
+        if rel_path and VIRTUALENV_MARKER in [e[0] for e in entries]:
+            continue
+        dirs = []
+        for name, is_dir in entries:
+            entry_rel_path = '{0}/{1}'.format(rel_path, name).lstrip('/')
+            if _is_ignored(name, entry_rel_path, ignore):
+                continue
+            entry_path = os.path.join(dir_path, name)
+            if is_dir:
+                dirs.append((entry_path, entry_rel_path))
+            elif fnmatch.fnmatch(name, ext):
+                yield entry_path
+        stack.extend(reversed(dirs))
+
+
+def _entries(dir_path):
+    """Returns list of name and is folder pairs in the dir_path"""
+    try:
+        if scandir is not None:
+            return [(e.name, e.is_dir()) for e in scandir(dir_path)]
+        return [(name, os.path.isdir(os.path.join(dir_path, name)))
+                for name in os.listdir(dir_path)]
+    except OSError:
+        return []
+
+
+def _dir_key(dir_path):
+    """Returns key identifying the folder, also when it is linked"""
+    try:
+        dir_stat = os.stat(dir_path)
+    except OSError:
+        return None
+    if dir_stat.st_ino:
+        return dir_stat.st_dev, dir_stat.st_ino
+    return os.path.normcase(os.path.realpath(dir_path))
+
+
+def _is_ignored(name, rel_path, ignore):
+    for pattern in ignore:
+        if (fnmatch.fnmatch(name, pattern) or
+                fnmatch.fnmatch(rel_path, pattern)):
+            return True
+    return False
@@ -0,0 +1,269 @@
+import json
+import logging
+from collections import deque
+from os import path, stat
+from parser_utils.file_formatter import rf_table_name, lib_table_name
+from parser_utils.util import file_md5
+from parser_utils.sqlite_store import table_exists
+from db_json_settings import DBJsonSetting
+
+MANIFEST_NAME = 'scan_manifest.json'
+MANIFEST_VERSION = 1
+LIBRARY_TABLES_NAME = 'library_tables.json'
+IMPORT_GRAPH_NAME = 'import_graph.json'
+
+
+class ScanManifest(object):
+    """Book keeping of the files scanned in to the database.
+
+    For each scanned file the manifest records the file size,
+    modification time, content hash, arguments used in parsing and
+    the name of the table which was created from the file. The manifest
+    is saved in the database folder and it is used to find out which
+    files must be parsed again when the workspace is scanned.
+
+    Libraries imported by name, like BuiltIn, are not files and are
+    therefore not recorded in the manifest.
+    """
+    def __init__(self, db_path):
+        self.manifest_path = path.join(db_path, MANIFEST_NAME)
+        self.files = {}
+
+    def load(self):
+        """Reads the manifest from the database folder.
+
+        If manifest does not exist, it is corrupted or it is created by
+        different version of the scanner, then all files are considered
+        as changed.
+        """
+        self.files = {}
+        if not path.isfile(self.manifest_path):
+            return
+        try:
+            with open(self.manifest_path) as f:
+                data = json.load(f)
+        except ValueError:
+            logging.warning('Ignoring corrupted manifest: %s',
+                            self.manifest_path)
+            return
+        if data.get('version') == MANIFEST_VERSION:
+            self.files = data['files']
+
+    def save(self):
+        with open(self.manifest_path, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.files}, f)
+
+    def fingerprint(self, f_path):
+        """Returns the size, mtime and md5 of the f_path.
+
+        Returns None if f_path is not a file.
+        """
+        if not path.isfile(f_path):
+            return None
+        f_stat = stat(f_path)
+        return {
+            'size': f_stat.st_size,
+            'mtime': f_stat.st_mtime,
+            'md5': file_md5(f_path)
+        }
+
+    def is_unchanged(self, f_path, args):
+        """Returns True if f_path is not changed after it was scanned.
+
+        File is considered unchanged if it is scanned with same arguments
+        and file size and modification time are same. If modification
+        time differs, content hash is used to detect the change.
+        """
+        entry = self.files.get(f_path)
+        if not entry or entry['args'] != self._args(args):
+            return False
+        try:
+            f_stat = stat(f_path)
+        except OSError:
+            return False
+        if entry['size'] != f_stat.st_size:
+            return False
+        elif entry['mtime'] == f_stat.st_mtime:
+            return True
+        elif entry['md5'] == file_md5(f_path):
+            entry['mtime'] = f_stat.st_mtime
+            return True
+        else:
+            return False
+
+    def table(self, f_path):
+        """Returns table name created from the f_path"""
+        return self.files[f_path]['table']
+
+    def add(self, f_path, fingerprint, table_name, args):
+        """Adds the f_path to the manifest
+
+        ``fingerprint`` -- Return value from the `fingerprint` method.
+        ``table_name``  -- Table created from the f_path.
+        ``args``        -- Arguments used when f_path was parsed.
+        """
+        if not fingerprint:
+            return
+        entry = dict(fingerprint)
+        entry['table'] = table_name
+        entry['args'] = self._args(args)
+        self.files[f_path] = entry
+
+    def get_entry(self, f_path):
+        """Returns the manifest entry of the f_path or None"""
+        return self.files.get(f_path)
+
+    def put_entry(self, f_path, entry):
+        """Sets entry, returned by `get_entry`, for the f_path"""
+        if entry:
+            self.files[f_path] = entry
+
+    def retain(self, tables):
+        """Removes files which did not produce any of the tables"""
+        for f_path in list(self.files):
+            if self.files[f_path]['table'] not in tables:
+                del self.files[f_path]
+
+    def _args(self, args):
+        return None if args is None else list(args)
+
+
+class LibraryTables(object):
+    """Mapping from the library imports to the library table names.
+
+    The scanner records the table, which was created from each library
+    import, and the index uses the mapping to find the library tables
+    without importing the libraries. Library import is the library
+    name or the path to the library file, as it is in the test data.
+    """
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.path = path.join(db_path, LIBRARY_TABLES_NAME)
+        self.libraries = {}
+
+    def load(self):
+        self.libraries = {}
+        if not path.isfile(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                self.libraries = json.load(f)
+        except ValueError:
+            logging.warning('Ignoring corrupted library tables: %s',
+                            self.path)
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump(self.libraries, f)
+
+    def add(self, library, table_name):
+        self.libraries[library] = table_name
+
+    def get(self, library):
+        """Returns the table name of the library import or None"""
+        return self.libraries.get(library)
+
+    def find(self, library):
+        """Returns the table name of the library import.
+
+        If the library is not found from the mapping, table name is
+        created from the library module name, if such table exists in
+        the database, as JSON file or in the SQLite store. Otherwise
+        returns None.
+        """
+        table_name = self.get(library)
+        if table_name:
+            return table_name
+        if library.endswith('.py'):
+            library_module = path.splitext(path.basename(library))[0]
+        else:
+            library_module = library
+        table_name = lib_table_name(library_module)
+        if table_exists(path.join(self.db_path, table_name)):
+            return table_name
+        return None
+
+
+def get_table_imports(data, library_tables):
+    """Returns the names of the tables imported by the table data.
+
+    ``data`` -- Table data or dictionary containing the import keys
+    of the table data.
+    ``library_tables`` -- LibraryTables used to find the library tables.
+    """
+    imports = []
+    for lib in data.get(DBJsonSetting.libraries, []):
+        if lib[DBJsonSetting.library_path]:
+            table_name = library_tables.find(lib[DBJsonSetting.library_path])
+        else:
+            table_name = library_tables.find(lib[DBJsonSetting.library_name])
+        if table_name:
+            imports.append(table_name)
+    for var_file in data.get(DBJsonSetting.variable_files, []):
+        imports.append(rf_table_name(list(var_file.keys())[0]))
+    for resource in data.get(DBJsonSetting.resources, []):
+        imports.append(rf_table_name(resource))
+    return imports
+
+
+class ImportGraph(object):
+    """Import graph of the database tables.
+
+    The graph records the tables imported by each table. It is created
+    by the scanner and used to find the tables which import a table
+    directly or through other imports. When a table changes, the
+    index of those tables must be created again.
+    """
+    def __init__(self, db_path):
+        self.path = path.join(db_path, IMPORT_GRAPH_NAME)
+        self.imports = {}
+        self._importers = None
+
+    def load(self):
+        self.imports = {}
+        self._importers = None
+        if not path.isfile(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                self.imports = json.load(f)
+        except ValueError:
+            logging.warning('Ignoring corrupted import graph: %s',
+                            self.path)
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump(self.imports, f)
+
+    def set_imports(self, table_name, imports):
+        """Sets the tables imported by the table_name"""
+        self.imports[table_name] = list(imports)
+        self._importers = None
+
+    def retain(self, tables):
+        """Removes tables which are not in the tables"""
+        for table_name in list(self.imports):
+            if table_name not in tables:
+                del self.imports[table_name]
+        self._importers = None
+
+    def importers(self, table_name):
+        """Returns the tables which directly import the table_name"""
+        if self._importers is None:
+            self._importers = {}
+            for importer, imports in self.imports.items():
+                for import_ in imports:
+                    self._importers.setdefault(import_, set()).add(importer)
+        return self._importers.get(table_name, set())
+
+    def dependents(self, table_name):
+        """Returns sorted list of tables which import the table_name
+        directly or through other imports."""
+        found = set()
+        to_visit = deque([table_name])
+        while to_visit:
+            for importer in self.importers(to_visit.popleft()):
+                if importer not in found and importer != table_name:
+                    found.add(importer)
+                    to_visit.append(importer)
+        return sorted(found)
@@ -1,12 +1,16 @@
-from collections import OrderedDict
-from copy import deepcopy
+from collections import OrderedDict, deque
 from db_json_settings import DBJsonSetting
 
 
 class ParsingQueue(object):
-    """This is queue for parsing test data and libraries"""
+    """This is queue for parsing test data and libraries
+
+    Items which are not yet taken from the queue are kept in a deque
+    and items taken from the queue are kept in the order they were taken.
+    The status of all items is kept in a dictionary, so adding, getting
+    and checking that item is in the queue are constant time operations.
+    """
     def __init__(self):
-        self.queue = OrderedDict({})
         self.rf_types = [
             DBJsonSetting.library,
             'test_suite',
@@ -14,9 +18,32 @@ class ParsingQueue(object):
             None,
             'variable_file'
             ]
+        self.clear_queue()
+
+    @property
+    def queue(self):
+        """Returns the queue items and their status as OrderedDict.
+
+        Items not yet taken from the queue are first, followed by items
+        which are taken from the queue. Creating the OrderedDict is
+        linear with the size of the queue, use only for inspection.
+        """
+        queue = OrderedDict()
+        for data in self._pending:
+            if data not in self._taken:
+                queue[data] = self._status[data]
+        for data in self._taken:
+            queue[data] = self._status[data]
+        return queue
+
+    def __contains__(self, data):
+        return data in self._status
+
+    def __len__(self):
+        return len(self._status)
 
     def add(self, data, rf_type, arg):
-        """Add item to the end of the queue.
+        """Add item to the start of the queue.
 
         Does not add duplicates in the queue. ``rf_type``
         defines the type of the added item. Possible values are:
@@ -25,37 +52,50 @@ class ParsingQueue(object):
         """
         if rf_type not in self.rf_types:
             raise ValueError('Invalid rf_type: {0}'.format(rf_type))
-        if data not in self.queue:
-            new = OrderedDict([(
-                data,
-                {'scanned': False, 'type': rf_type, 'args': arg})])
-            old = self.queue
-            self.queue = OrderedDict(list(new.items()) + list(old.items()))
+        if data not in self._status:
+            self._status[data] = {'scanned': False, 'type': rf_type,
+                                  'args': arg}
+            self._pending.appendleft(data)
 
     def get(self):
-        """Get item from start of the queue"""
-        try:
-            data = self.queue.popitem(last=False)
-            tmp = deepcopy(data)
-            tmp[1]['scanned'] = 'queued'
-            self.queue[tmp[0]] = tmp[1]
-            return data
-        except KeyError:
-            return {}
+        """Get item from start of the queue
+
+        The item is marked as queued and moved as last item of the queue.
+        If all items are already taken from the queue, the first taken
+        item is returned.
+        """
+        while self._pending:
+            data = self._pending.popleft()
+            if data not in self._taken:
+                return self._take(data)
+        if self._taken:
+            data = next(iter(self._taken))
+            del self._taken[data]
+            return self._take(data)
+        return {}
 
     def set(self, data):
-        """Set scanned to True and put item as last item in the queue"""
-        status = self.queue[data]
-        status['scanned'] = True
-        self.queue[data] = status
+        """Set scanned to True"""
+        self._status[data]['scanned'] = True
 
     def force_set(self, data):
         """Adds items to the end of the queue with scanned == True"""
-        status = {'scanned': True, 'type': None, 'args': None}
-        if data in self.queue:
-            del self.queue[data]
-        self.queue[data] = status
+        self._status[data] = {'scanned': True, 'type': None, 'args': None}
+        if data in self._taken:
+            del self._taken[data]
+        self._taken[data] = None
 
     def clear_queue(self):
         """Clears all items in the queue"""
-        self.queue = OrderedDict({})
+        self._status = {}
+        self._pending = deque()
+        self._taken = OrderedDict()
+
+    def _take(self, data):
+        status = self._status[data]
+        if status['scanned'] is not True:
+            queued = dict(status)
+            queued['scanned'] = 'queued'
+            self._status[data] = queued
+        self._taken[data] = None
+        return data, status
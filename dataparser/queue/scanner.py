@@ -1,20 +1,94 @@
-import shutil
+import sys
 import logging
 import json
+import threading
+import multiprocessing
 import xml.etree.ElementTree as ET
-from os import path, makedirs
+from os import path, makedirs, remove, listdir
 from robot.errors import DataError
 from finder import finder
 from data_parser.data_parser import DataParser
+from data_parser.libdoc_cache import LibdocCache
 from queue import ParsingQueue
+from manifest import ScanManifest, LibraryTables, ImportGraph
+from manifest import get_table_imports
 from parser_utils.file_formatter import rf_table_name, lib_table_name
-from parser_utils.util import normalise_path
+from parser_utils.util import normalise_path, list_tables
+from parser_utils.doc_store import split_documentation, doc_store_path
+from parser_utils.file_formatter import is_table_name
+from parser_utils.sqlite_store import SQLiteStore, SQLITE_DB_NAME
+from parser_utils.sqlite_store import JSON_BACKEND, SQLITE_BACKEND
+from parser_utils.profiler import Profiler, DISCOVERY, QUEUE
+from parser_utils.profiler import TABLE_READ, JSON_WRITE
+from parser_utils.import_catalog import ImportCatalog, get_catalog_entry
 from db_json_settings import DBJsonSetting
 
 logging.basicConfig(
     format='%(levelname)s:%(asctime)s: %(message)s',
     level=logging.DEBUG)
 
+IMPORT_KEYS = (
+    DBJsonSetting.libraries,
+    DBJsonSetting.variable_files,
+    DBJsonSetting.resources
+)
+_worker_scanner = None
+
+
+def init_scan_worker(xml_libraries, db_path, sys_path, backend,
+                     profile=False):
+    """Initializes the scanner in a multiprocessing.Pool worker process.
+
+    `sys_path` - The sys.path of the parent process, so that libraries
+    are found in the same way as in the parent process.
+    `profile` - Records the phases of the scan in the worker process.
+    """
+    global _worker_scanner
+    for path_ in sys_path:
+        if path_ not in sys.path:
+            sys.path.append(path_)
+    _worker_scanner = Scanner(
+        xml_libraries, backend=backend, profiler=Profiler(profile))
+    _worker_scanner.parser.libdoc_cache = LibdocCache(db_path)
+    _worker_scanner.manifest = ScanManifest(db_path)
+    _worker_scanner.manifest.load()
+
+
+def scan_an_item(params):
+    """Scan a queue item in a worker process.
+    `params` - Tuple of: queue item and db_path
+
+    This is a wrapper function for multiprocessing.Pool to create
+    tables in multiple processes. Returns tuple of: item name, table name,
+    imports found from the item, the scan manifest entry of the item, the
+    import catalog entry of the table and the profiler statistics of the
+    item. Table name is None if item could not be scanned. Statistics
+    are None if profiling is not used.
+    """
+    item, db_path = params
+    profiler = _worker_scanner.profiler
+    try:
+        data, table_name = _worker_scanner.scan_item(item, db_path)
+    except ValueError:
+        logging.warning('Error in: %s', item[0])
+        return item[0], None, {}, None, None, worker_stats(profiler)
+    except Exception:
+        logging.exception('Unexpected error in: %s', item[0])
+        return item[0], None, {}, None, None, worker_stats(profiler)
+    imports = {}
+    for key in IMPORT_KEYS:
+        if key in data:
+            imports[key] = data[key]
+    entry = _worker_scanner.manifest.get_entry(item[0])
+    return (item[0], table_name, imports, entry, get_catalog_entry(data),
+            worker_stats(profiler))
+
+
+def worker_stats(profiler):
+    if profiler.enabled:
+        return profiler.stats()
+    return None
+
 
 class Scanner(object):
     """Class to perform initial scanning of robot data.
@@ -24,19 +98,59 @@ class Scanner(object):
     when files are changed by version control, like with git pull command.
 
     The database is folder where robot data is saved as json files.
+    The scan is incremental: the scan manifest, saved in the database
+    folder, records the files which were scanned and only the files
+    changed after the previous scan are parsed again. Keywords of the
+    Python libraries are cached in the database folder and libraries are
+    imported only when they are changed. The tables created from the
+    library imports are recorded in the database folder, so that the
+    index does not need to import the libraries. Also the import graph
+    of the tables and the import catalog, which lists the libraries,
+    resources and variable files of the database, are saved in the
+    database folder. Keyword documentation
+    is not saved in the tables, it is saved in the doc store of the table.
+
+    If ``processes`` is greater than one, files are parsed and tables are
+    written in that many worker processes. Value zero uses one process per
+    CPU.
+
+    ``backend`` defines how the tables are saved: ``json`` saves each
+    table in its own JSON file and ``sqlite`` saves all tables in a single
+    SQLite file in the database folder.
+
+    ``ignore`` is list of glob patterns of the files and folders, which
+    are not scanned from the workspace, see ``finder``. Files are scanned
+    while the workspace is walked.
+
+    If ``profiler`` is given, wall time of the scan phases, like finding
+    the files, parsing and writing the tables, is recorded in the
+    profiler, see ``Profiler``.
     """
-    def __init__(self, xml_libraries=None):
+    def __init__(self, xml_libraries=None, processes=1,
+                 backend=JSON_BACKEND, ignore=None, profiler=None):
         self.queue = ParsingQueue()
-        self.parser = DataParser()
+        self.profiler = profiler or Profiler()
+        self.parser = DataParser(profiler=self.profiler)
         self.rf_data_type = [None, 'test_suite', 'resource']
         self.xml_libraries = xml_libraries
+        self.manifest = None
+        self.library_tables = None
+        self.table_imports = {}
+        self.catalog_entries = {}
+        self.processes = processes
+        self.backend = backend
+        self.ignore = ignore
+        self.store = None
 
     def scan(self, workspace, ext, db_path):
         """Scan and create the database
 
         ``workspace`` --root folder where robot data is scanned.
         ``ext`` --Extension for included files.
-        ``db_path`` --Directory where files are saved"""
+        ``db_path`` --Directory where files are saved
+
+        Tables of the files, which are not anymore found from the
+        workspace or from the imports, are removed from the database."""
         if not path.exists(workspace):
             raise EnvironmentError(
                 'Workspace does not exist: {0}'.format(str(workspace)))
@@ -45,28 +159,175 @@ class Scanner(object):
                 'Workspace must be folder: {0}'.format(str(workspace)))
         if not path.exists(db_path):
             makedirs(db_path)
-        else:
-            shutil.rmtree(db_path)
-            makedirs(db_path)
+        self.parser.libdoc_cache = LibdocCache(db_path)
+        self.remove_other_backend_tables(db_path)
+        self.manifest = ScanManifest(db_path)
+        self.manifest.load()
+        self.library_tables = LibraryTables(db_path)
+        self.table_imports = {}
+        self.catalog_entries = {}
+        self.queue.clear_queue()
         self.add_builtin()
         if self.xml_libraries:
             self.add_xml_libraries(self.xml_libraries)
-        for f in finder(workspace, ext):
+        files = self.profiler.iterate(
+            DISCOVERY, finder(workspace, ext, self.ignore))
+        if self.processes == 1:
+            tables = self.scan_queue(db_path, files)
+        else:
+            tables = self.scan_queue_in_processes(db_path, files)
+        self.remove_stale_tables(db_path, tables)
+        self.manifest.save()
+        self.library_tables.save()
+        self.save_import_graph(db_path)
+        self.save_import_catalog(db_path)
+
+    def scan_files(self, files, db_path):
+        """Scans the files and their imports and returns the table names
+
+        ``files`` -- Robot Framework data files which are scanned.
+        ``db_path`` -- Directory where files are saved.
+
+        Unlike the ``scan``, only the files and their imports are scanned
+        and other tables in the db_path are not removed. Imports, which
+        are not changed after the previous scan, are read from the
+        existing tables."""
+        if not path.exists(db_path):
+            makedirs(db_path)
+        self.parser.libdoc_cache = LibdocCache(db_path)
+        self.manifest = ScanManifest(db_path)
+        self.manifest.load()
+        self.library_tables = LibraryTables(db_path)
+        self.library_tables.load()
+        self.table_imports = {}
+        self.catalog_entries = {}
+        self.queue.clear_queue()
+        for f in files:
             self.queue.add(normalise_path(f), None, None)
+        if self.processes == 1:
+            tables = self.scan_queue(db_path)
+        else:
+            tables = self.scan_queue_in_processes(db_path)
+        self.manifest.save()
+        self.library_tables.save()
+        self.save_import_graph(db_path, update=True)
+        self.save_import_catalog(db_path, update=True)
+        return tables
+
+    def remove_files(self, files, db_path):
+        """Removes the tables created from the files and returns the
+        removed table names"""
+        self.manifest = ScanManifest(db_path)
+        self.manifest.load()
+        tables = set()
+        for f in files:
+            f = normalise_path(f)
+            entry = self.manifest.get_entry(f)
+            if entry:
+                tables.add(entry['table'])
+        for table_name in tables:
+            self.remove_table(db_path, table_name)
+        self.manifest.retain(
+            set(entry['table'] for entry in self.manifest.files.values()) -
+            tables)
+        self.manifest.save()
+        import_graph = ImportGraph(db_path)
+        import_graph.load()
+        import_graph.retain(set(import_graph.imports) - tables)
+        import_graph.save()
+        catalog = ImportCatalog(db_path)
+        catalog.load()
+        catalog.retain(set(catalog.tables) - tables)
+        catalog.save()
+        return tables
+
+    def scan_queue(self, db_path, files=()):
+        """Scans the items in queue and returns the created table names
+
+        ``files`` -- Iterable of files, which are added to the queue when
+        the queue does not contain any items which are not scanned.
+        """
+        files = iter(files)
+        tables = set()
         while True:
-            item = self.get_item()
+            item = self.get_item(files)
             if not item:
-                return
-            else:
-                logging.info('Creating table for: {0}'.format(item[0]))
-                try:
-                    data = self.parse_all(item)
+                return tables
+            try:
+                data, table_name = self.scan_item(item, db_path)
+                with self.profiler.phase(QUEUE):
                     self.add_to_queue(data)
-                    self.put_item_to_db(data, db_path)
-                except ValueError:
-                    logging.warning('Error in: %s', item[0])
-                finally:
-                    self.queue.set(item[0])
+                self.add_library_table(item, table_name)
+                self.add_table_imports(table_name, data)
+                self.catalog_entries[table_name] = get_catalog_entry(data)
+                tables.add(table_name)
+            except ValueError:
+                logging.warning('Error in: %s', item[0])
+            finally:
+                self.queue.set(item[0])
+
+    def scan_queue_in_processes(self, db_path, files=()):
+        """Scans the items in queue by using worker processes.
+
+        Items are given to the worker processes as soon as they are
+        available in the queue or found from the ``files``. The imports
+        found by the workers are added back to the queue and scanned,
+        until queue does not contain any items which are not scanned.
+        Returns the created table names.
+        """
+        files = iter(files)
+        processes = self.processes if self.processes else None
+        self.close_store()
+        pool = multiprocessing.Pool(
+            processes,
+            init_scan_worker,
+            (self.xml_libraries, db_path, list(sys.path), self.backend,
+             self.profiler.enabled)
+        )
+        finished = []
+        submitted = {}
+        condition = threading.Condition()
+
+        def on_result(result):
+            with condition:
+                finished.append(result)
+                condition.notify()
+        tables = set()
+        pending = 0
+        try:
+            while True:
+                item = self.get_item(files)
+                while item:
+                    submitted[item[0]] = item
+                    pool.apply_async(
+                        scan_an_item, ((item, db_path),), callback=on_result)
+                    pending += 1
+                    item = self.get_item(files)
+                if not pending:
+                    return tables
+                with condition:
+                    while not finished:
+                        condition.wait(1)
+                    results = finished[:]
+                    del finished[:]
+                for result in results:
+                    (item_name, table_name, imports, entry, catalog_entry,
+                     stats) = result
+                    pending -= 1
+                    self.profiler.merge(stats)
+                    item = submitted.pop(item_name)
+                    if table_name:
+                        tables.add(table_name)
+                        with self.profiler.phase(QUEUE):
+                            self.add_to_queue(imports)
+                        self.add_library_table(item, table_name)
+                        self.add_table_imports(table_name, imports)
+                        self.catalog_entries[table_name] = catalog_entry
+                        self.manifest.put_entry(item_name, entry)
+                    self.queue.set(item_name)
+        finally:
+            pool.close()
+            pool.join()
 
     def scan_single_file(self, file_path, db_path):
         """Scan a single file and create the database table for the file
@@ -76,16 +337,163 @@ class Scanner(object):
         """
         if not path.exists(db_path):
             makedirs(db_path)
+        self.parser.libdoc_cache = LibdocCache(db_path)
+        self.manifest = ScanManifest(db_path)
+        self.manifest.load()
         logging.info('Creating table for: {0}'.format(file_path))
         item = (file_path, {'scanned': False, 'type': None, 'args': None})
         try:
+            fingerprint = self.manifest.fingerprint(file_path)
             data = self.parse_all(item)
-            self.put_item_to_db(data, db_path)
+            table_name = self.put_item_to_db(data, db_path)
+            self.manifest.add(file_path, fingerprint, table_name, None)
+            self.manifest.save()
+            library_tables = LibraryTables(db_path)
+            library_tables.load()
+            import_graph = ImportGraph(db_path)
+            import_graph.load()
+            import_graph.set_imports(
+                table_name, get_table_imports(data, library_tables))
+            import_graph.save()
+            catalog = ImportCatalog(db_path)
+            catalog.load()
+            catalog.set_entry(table_name, get_catalog_entry(data))
+            catalog.save()
         except ValueError:
             logging.warning('Error in: %s', file_path)
 
-    def get_item(self):
-        item = self.queue.get()
+    def scan_item(self, item, db_path):
+        """Returns the data and the table name of the queue item.
+
+        If the item is a file which is not changed after the previous
+        scan, data is read from the existing table. Otherwise item is
+        parsed and the table is written to the db_path.
+        """
+        f_path = item[0]
+        args = item[1]['args']
+        if self.manifest.is_unchanged(f_path, args):
+            table_name = self.manifest.table(f_path)
+            with self.profiler.phase(TABLE_READ, f_path):
+                data = self.read_table(db_path, table_name)
+            if data:
+                logging.info('Table is up to date for: {0}'.format(f_path))
+                return data, table_name
+        logging.info('Creating table for: {0}'.format(f_path))
+        fingerprint = self.manifest.fingerprint(f_path)
+        data = self.parse_all(item)
+        with self.profiler.phase(JSON_WRITE, f_path):
+            table_name = self.put_item_to_db(data, db_path)
+        self.manifest.add(f_path, fingerprint, table_name, args)
+        return data, table_name
+
+    def add_library_table(self, item, table_name):
+        """Records the table name if the queue item is a library"""
+        if item[1]['type'] == DBJsonSetting.library:
+            self.library_tables.add(item[0], table_name)
+
+    def add_table_imports(self, table_name, data):
+        """Records the imports of the table for the import graph"""
+        imports = {}
+        for key in IMPORT_KEYS:
+            if key in data:
+                imports[key] = data[key]
+        self.table_imports[table_name] = imports
+
+    def save_import_graph(self, db_path, update=False):
+        """Saves the import graph of the tables scanned by the scan
+
+        With ``update`` the imports of the scanned tables are updated in
+        the existing import graph."""
+        import_graph = ImportGraph(db_path)
+        if update:
+            import_graph.load()
+        for table_name, imports in self.table_imports.items():
+            import_graph.set_imports(
+                table_name, get_table_imports(imports, self.library_tables))
+        import_graph.save()
+
+    def save_import_catalog(self, db_path, update=False):
+        """Saves the import catalog of the tables scanned by the scan
+
+        With ``update`` the entries of the scanned tables are updated in
+        the existing import catalog."""
+        catalog = ImportCatalog(db_path)
+        if update:
+            catalog.load()
+        for table_name, entry in self.catalog_entries.items():
+            catalog.set_entry(table_name, entry)
+        catalog.save()
+
+    def read_table(self, db_path, table_name):
+        """Returns table data from db_path or None if table is not valid"""
+        if self.backend == SQLITE_BACKEND:
+            return self.get_store(db_path).get(table_name)
+        try:
+            with open(path.join(db_path, table_name)) as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            logging.warning('Could not read table: %s', table_name)
+            return None
+
+    def remove_stale_tables(self, db_path, tables):
+        """Removes tables which are not in the tables from the db_path"""
+        for table_name in list_tables(db_path):
+            if table_name not in tables:
+                self.remove_table(db_path, table_name)
+        self.manifest.retain(tables)
+
+    def remove_table(self, db_path, table_name):
+        logging.info('Removing table: {0}'.format(table_name))
+        if self.backend == SQLITE_BACKEND:
+            self.get_store(db_path).remove(table_name)
+        elif path.exists(path.join(db_path, table_name)):
+            remove(path.join(db_path, table_name))
+        doc_path = doc_store_path(path.join(db_path, table_name))
+        if path.exists(doc_path):
+            remove(doc_path)
+
+    def remove_other_backend_tables(self, db_path):
+        """Removes the tables saved with the other backend from db_path
+
+        Tables are saved only with one backend at the time, so that the
+        tables saved before the backend was changed are not used.
+        """
+        if self.backend == SQLITE_BACKEND:
+            for f_name in listdir(db_path):
+                if is_table_name(f_name):
+                    remove(path.join(db_path, f_name))
+        else:
+            self.close_store()
+            for suffix in ('', '-wal', '-shm'):
+                db_file = path.join(db_path, SQLITE_DB_NAME + suffix)
+                if path.exists(db_file):
+                    remove(db_file)
+
+    def get_store(self, db_path):
+        """Returns the SQLite store of the db_path"""
+        if self.store is None or self.store.db_path != db_path:
+            self.close_store()
+            self.store = SQLiteStore(db_path)
+        return self.store
+
+    def close_store(self):
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def get_item(self, files=None):
+        """Returns item, which is not scanned, from the queue or {}
+
+        Before the item is taken from the queue, next file, which is not
+        in the queue, is added to the queue from the ``files`` iterator.
+        """
+        for f in files or ():
+            f = normalise_path(f)
+            if f not in self.queue:
+                self.queue.add(f, None, None)
+                break
+        with self.profiler.phase(QUEUE):
+            item = self.queue.get()
         if not item:
             return item
         elif not item[1]['scanned']:
@@ -103,14 +511,20 @@ class Scanner(object):
             self.add_resources_queue(data[DBJsonSetting.resources])
 
     def put_item_to_db(self, item, db_path):
-        """Creates the json file to self.db_path"""
+        """Creates the json file to db_path and returns the file name"""
         if DBJsonSetting.library_module in item:
             f_name = lib_table_name(item[DBJsonSetting.library_module])
         elif DBJsonSetting.file_path in item:
             f_name = rf_table_name(item[DBJsonSetting.file_path])
-        f = open(path.join(db_path, f_name), 'w')
+        table_path = path.join(db_path, f_name)
+        item = split_documentation(item, table_path)
+        if self.backend == SQLITE_BACKEND:
+            self.get_store(db_path).put(f_name, item)
+            return f_name
+        f = open(table_path, 'w')
         json.dump(item, f)
         f.close()
+        return f_name
 
     def parse_all(self, item):
         data_type = item[1]['type']
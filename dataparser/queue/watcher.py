@@ -0,0 +1,170 @@
+import logging
+import time
+from os import path, stat, makedirs, remove
+from finder import finder
+from scanner import Scanner
+from manifest import ScanManifest, ImportGraph
+from index.index import Index
+from parser_utils.util import normalise_path, get_index_name
+from parser_utils.sqlite_store import get_store, JSON_BACKEND
+
+
+class Watcher(object):
+    """Keeps the database up to date when files in the workspace change.
+
+    The workspace is polled for the files with the extension and the
+    modification time and size of the files are compared with the
+    previous poll. Polling is used because it works in the same way in
+    all platforms and also with network drives. When changes are found,
+    the workspace is polled again after ``settle`` seconds, until no more
+    changes are found, so that changes made at the same time, example by
+    git checkout, are handled in one batch.
+
+    Changed and new files, and their imports, are scanned with the
+    ``Scanner.scan_files`` and the tables of the removed files are
+    removed from the database. If ``index_path`` is given, index is
+    created for the changed tables and for the tables which import
+    them.
+
+    Files and folders matching to the ``ignore`` patterns are not
+    watched, see ``finder``.
+
+    When watching starts, files changed after the previous scan, which
+    are found by using the scan manifest, are handled in the first batch.
+    """
+    def __init__(self, workspace, ext, db_path, index_path=None,
+                 xml_libraries=None, backend=JSON_BACKEND, interval=1.0,
+                 settle=0.5, ignore=None):
+        self.workspace = workspace
+        self.ext = ext
+        self.db_path = db_path
+        self.index_path = index_path
+        self.xml_libraries = xml_libraries
+        self.interval = interval
+        self.settle = settle
+        self.ignore = ignore
+        self.scanner = Scanner(xml_libraries, backend=backend)
+        self.index = None
+        self.files = {}
+
+    def watch(self):
+        """Watches the workspace until interrupted"""
+        self.start()
+        while True:
+            time.sleep(self.interval)
+            self.check()
+
+    def start(self):
+        """Takes the first snapshot of the workspace and handles the files
+        changed or removed after the previous scan."""
+        if not path.exists(self.db_path):
+            makedirs(self.db_path)
+        self.files = self.snapshot()
+        manifest = ScanManifest(self.db_path)
+        manifest.load()
+        changed = set(
+            f_path for f_path in self.files
+            if not manifest.is_unchanged(f_path, None))
+        removed = set(
+            f_path for f_path in manifest.files
+            if f_path not in self.files and self.in_workspace(f_path))
+        self.update(changed, removed)
+        return changed, removed
+
+    def check(self):
+        """Polls the workspace and updates the database.
+
+        Returns tuple of changed and removed files.
+        """
+        changed, removed = self.poll()
+        if not changed and not removed:
+            return changed, removed
+        while True:
+            time.sleep(self.settle)
+            more_changed, more_removed = self.poll()
+            if not more_changed and not more_removed:
+                break
+            changed = (changed | more_changed) - more_removed
+            removed = (removed | more_removed) - more_changed
+        self.update(changed, removed)
+        return changed, removed
+
+    def poll(self):
+        """Returns the files changed and removed after the previous poll"""
+        files = self.snapshot()
+        changed = set(
+            f_path for f_path, key in files.items()
+            if self.files.get(f_path) != key)
+        removed = set(self.files) - set(files)
+        self.files = files
+        return changed, removed
+
+    def snapshot(self):
+        """Returns dictionary of file path to modification time and size"""
+        files = {}
+        for f_path in finder(self.workspace, self.ext, self.ignore):
+            try:
+                f_stat = stat(f_path)
+            except OSError:
+                continue
+            files[normalise_path(f_path)] = (f_stat.st_mtime, f_stat.st_size)
+        return files
+
+    def in_workspace(self, f_path):
+        workspace = normalise_path(path.join(self.workspace, ''))
+        return f_path.startswith(workspace) and f_path.endswith(self.ext)
+
+    def update(self, changed, removed):
+        """Scans the changed files, removes the tables of the removed files
+        and creates the index of the affected tables."""
+        if not changed and not removed:
+            return
+        logging.info('Changed files: %s, removed files: %s',
+                     sorted(changed), sorted(removed))
+        import_graph = ImportGraph(self.db_path)
+        import_graph.load()
+        removed_tables = set()
+        dependents = set()
+        if removed:
+            removed_tables = self.scanner.remove_files(removed, self.db_path)
+            for table_name in removed_tables:
+                dependents.update(import_graph.dependents(table_name))
+        changed_tables = set()
+        if changed:
+            self.scanner.scan_files(changed, self.db_path)
+            manifest = ScanManifest(self.db_path)
+            manifest.load()
+            for f_path in changed:
+                entry = manifest.get_entry(f_path)
+                if entry:
+                    changed_tables.add(entry['table'])
+            import_graph.load()
+            for table_name in changed_tables:
+                dependents.update(import_graph.dependents(table_name))
+        self.scanner.close_store()
+        if self.index_path:
+            self.remove_indexes(removed_tables)
+            self.create_indexes(
+                (changed_tables | dependents) - removed_tables)
+
+    def create_indexes(self, tables):
+        if not tables:
+            return
+        if not path.exists(self.index_path):
+            makedirs(self.index_path)
+        if self.index is None:
+            self.index = Index(self.db_path, self.index_path,
+                               self.xml_libraries)
+        self.index.library_tables.load()
+        for table_name in sorted(tables):
+            self.index.index_consturctor(table_name)
+
+    def remove_indexes(self, tables):
+        store = get_store(self.index_path)
+        for table_name in tables:
+            index_name = get_index_name(table_name)
+            index_table = path.join(self.index_path, index_name)
+            if path.isfile(index_table):
+                remove(index_table)
+            if store:
+                store.remove(index_name)
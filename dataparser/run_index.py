@@ -2,7 +2,7 @@ import argparse
 import sys
 import shutil
 import multiprocessing
-from os import path, listdir, makedirs
+from os import path, makedirs
 
 ROOT_DIR = path.dirname(path.abspath(__file__))
 SETTING_DIR = path.join(ROOT_DIR, '..', 'setting')
@@ -10,39 +10,86 @@ sys.path.append(SETTING_DIR)
 
 from index.index import index_a_table
 from index.index import Index
+from parser_utils.util import list_tables
+from parser_utils.profiler import Profiler
+from queue.manifest import ImportGraph
 
 
-def index_all(db_path, index_path, module_search_path, libs_in_xml):
+def index_all(db_path, index_path, module_search_path, libs_in_xml,
+              profiler=None):
     for path_ in module_search_path:
         sys.path.append(path_)
-    tables = listdir(db_path)
-    params = []
-    for table in tables:
-        params.append((db_path, table, index_path, libs_in_xml))
+    tables = list_tables(db_path)
     if path.exists(index_path):
         shutil.rmtree(index_path)
     makedirs(index_path)
+    index_tables(db_path, tables, index_path, libs_in_xml, profiler)
+
+
+def index_tables(db_path, tables, index_path, libs_in_xml, profiler=None):
+    """Creates index for the tables in multiple processes
+
+    If ``profiler`` is given, the phases recorded in the worker
+    processes are merged to the profiler."""
+    profile = bool(profiler and profiler.enabled)
+    params = []
+    for table in tables:
+        params.append((db_path, table, index_path, libs_in_xml, profile))
     pool = multiprocessing.Pool()
-    pool.map(index_a_table, params)
+    try:
+        results = pool.map(index_a_table, params)
+    finally:
+        pool.close()
+        pool.join()
+    if profile:
+        for stats in results:
+            profiler.merge(stats)
 
 
 def index_single(db_path, db_table, index_path, module_search_path,
-                 libs_in_xml):
+                 libs_in_xml, profiler=None):
     for path_ in module_search_path:
         sys.path.append(path_)
     if not path.exists(index_path):
         makedirs(index_path)
     index = Index(db_path=db_path, index_path=index_path,
-                  xml_libraries=libs_in_xml)
+                  xml_libraries=libs_in_xml, profiler=profiler)
     index.index_consturctor(table=db_table)
 
+
+def get_dependents(db_path, db_table):
+    """Returns the tables which import the db_table directly
+    or through other imports."""
+    import_graph = ImportGraph(db_path)
+    import_graph.load()
+    return import_graph.dependents(db_table)
+
+
+def index_dependents(db_path, db_table, index_path, module_search_path,
+                     libs_in_xml, profiler=None):
+    """Creates index for the db_table and for the tables which
+    import the db_table."""
+    dependents = get_dependents(db_path, db_table)
+    if not dependents:
+        index_single(db_path, db_table, index_path, module_search_path,
+                     libs_in_xml, profiler)
+        return
+    for path_ in module_search_path:
+        sys.path.append(path_)
+    if not path.exists(index_path):
+        makedirs(index_path)
+    index_tables(
+        db_path, [db_table] + dependents, index_path, libs_in_xml, profiler)
+
 if __name__ == '__main__':
     c_parser = argparse.ArgumentParser(
         description='Indexing Scanner results')
     c_parser.add_argument(
         'mode',
-        choices=['all', 'single'],
-        help='Index mode: all or single'
+        choices=['all', 'single', 'dependents'],
+        help=('Index mode: all, single or dependents. Dependents mode '
+              'creates index for the db_table and for the tables which '
+              'import it')
     )
     c_parser.add_argument(
         '--db_path',
@@ -65,16 +112,39 @@ if __name__ == '__main__':
     c_parser.add_argument(
         '--path_to_lib_in_xml',
         help='Path to libraries in XML format')
+    c_parser.add_argument(
+        '--profile',
+        action='store_true',
+        help=('Records wall time of the index phases and logs summary of '
+              'the phases and the slowest tables at the end of the run')
+    )
+    c_parser.add_argument(
+        '--profile_dump',
+        help=('File where cProfile statistics of the run are written. '
+              'Enables also --profile')
+    )
     args = c_parser.parse_args()
     module_search_path = []
     if args.module_search_path:
         module_search_path = args.module_search_path
+    profiler = Profiler(args.profile, args.profile_dump)
+    profiler.start()
     if args.mode == 'all':
         index_all(
             args.db_path,
             args.index_path,
             module_search_path,
-            args.path_to_lib_in_xml
+            args.path_to_lib_in_xml,
+            profiler
+        )
+    elif args.mode == 'dependents':
+        index_dependents(
+            args.db_path,
+            args.db_table,
+            args.index_path,
+            module_search_path,
+            args.path_to_lib_in_xml,
+            profiler
         )
     else:
         index_single(
@@ -82,5 +152,7 @@ if __name__ == '__main__':
             args.db_table,
             args.index_path,
             module_search_path,
-            args.path_to_lib_in_xml
+            args.path_to_lib_in_xml,
+            profiler
         )
+    profiler.finish()
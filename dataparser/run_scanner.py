@@ -7,13 +7,17 @@ SETTING_DIR = path.join(ROOT_DIR, '..', 'setting')
 sys.path.append(SETTING_DIR)
 
 from queue.scanner import Scanner
+from queue.watcher import Watcher
+from parser_utils.sqlite_store import JSON_BACKEND, SQLITE_BACKEND
+from parser_utils.profiler import Profiler
 
 
 def scan_all(workspace, extension, db_path,
-             module_search_path, libs_in_xml):
+             module_search_path, libs_in_xml, processes=1,
+             backend=JSON_BACKEND, ignore=None, profiler=None):
     for path_ in module_search_path:
         sys.path.append(path_)
-    scanner = Scanner(libs_in_xml)
+    scanner = Scanner(libs_in_xml, processes, backend, ignore, profiler)
     scanner.scan(
         workspace=workspace,
         ext=extension,
@@ -21,18 +25,34 @@ def scan_all(workspace, extension, db_path,
     )
 
 
-def scan_single(file_path, db_path, libs_in_xml):
-    scanner = Scanner(libs_in_xml)
+def scan_single(file_path, db_path, libs_in_xml, backend=JSON_BACKEND,
+                profiler=None):
+    scanner = Scanner(libs_in_xml, backend=backend, profiler=profiler)
     scanner.scan_single_file(file_path=file_path, db_path=db_path)
 
 
+def watch(workspace, extension, db_path, index_path, module_search_path,
+          libs_in_xml, backend=JSON_BACKEND, interval=1.0, ignore=None):
+    for path_ in module_search_path:
+        sys.path.append(path_)
+    watcher = Watcher(
+        workspace, extension, db_path, index_path, libs_in_xml, backend,
+        interval, ignore=ignore)
+    try:
+        watcher.watch()
+    except KeyboardInterrupt:
+        pass
+
+
 if __name__ == '__main__':
     c_parser = argparse.ArgumentParser(
         description='Scanning Robot data from system Python')
     c_parser.add_argument(
         'mode',
-        choices=['all', 'single'],
-        help='Scanning mode: all or single'
+        choices=['all', 'single', 'watch'],
+        help=('Scanning mode: all, single or watch. Watch mode keeps '
+              'scanning the changed files in the workspace until '
+              'interrupted')
     )
     c_parser.add_argument(
         '--workspace',
@@ -57,24 +77,84 @@ if __name__ == '__main__':
     c_parser.add_argument(
         '--path_to_lib_in_xml',
         help='Path to libraries in XML format')
+    c_parser.add_argument(
+        '--processes',
+        type=int,
+        default=1,
+        help=('Number of processes used when scanning with mode: all. '
+              'Zero uses one process per CPU')
+    )
+    c_parser.add_argument(
+        '--index_path',
+        help=('Folder where index is created for the changed files in '
+              'mode: watch. If not given, index is not created')
+    )
+    c_parser.add_argument(
+        '--interval',
+        type=float,
+        default=1.0,
+        help='Seconds between polling the workspace in mode: watch'
+    )
+    c_parser.add_argument(
+        '--ignore',
+        nargs='*',
+        help=('Glob patterns of the files and folders, which are not '
+              'scanned from the workspace. Default ignores version control '
+              'and virtual environment folders')
+    )
+    c_parser.add_argument(
+        '--backend',
+        choices=[JSON_BACKEND, SQLITE_BACKEND],
+        default=JSON_BACKEND,
+        help='How tables are saved: JSON file per table or SQLite file'
+    )
+    c_parser.add_argument(
+        '--profile',
+        action='store_true',
+        help=('Records wall time of the scan phases and logs summary of '
+              'the phases and the slowest files and libraries at the end '
+              'of the run in modes: all and single')
+    )
+    c_parser.add_argument(
+        '--profile_dump',
+        help=('File where cProfile statistics of the run are written. '
+              'Enables also --profile')
+    )
     args = c_parser.parse_args()
     module_search_path = []
     if args.module_search_path:
         module_search_path = args.module_search_path
-    if args.mode == 'all':
+    profiler = Profiler(args.profile, args.profile_dump)
+    profiler.start()
+    if args.mode in ('all', 'watch'):
         if not args.workspace:
             raise ValueError('--workspace is needed with mode: {0}'.format(
                 args.mode))
         elif not args.extension:
             raise ValueError('--extension is needed with mode: {0}'.format(
                 args.mode))
+        elif args.mode == 'watch':
+            watch(
+                args.workspace,
+                args.extension,
+                args.db_path,
+                args.index_path,
+                module_search_path,
+                args.path_to_lib_in_xml,
+                args.backend,
+                args.interval,
+                args.ignore)
         else:
             scan_all(
                 args.workspace,
                 args.extension,
                 args.db_path,
                 module_search_path,
-                args.path_to_lib_in_xml)
+                args.path_to_lib_in_xml,
+                args.processes,
+                args.backend,
+                args.ignore,
+                profiler)
     elif args.mode == 'single':
         if not args.path_to_file:
             raise ValueError(
@@ -86,5 +166,8 @@ if __name__ == '__main__':
             scan_single(
                 args.path_to_file,
                 args.db_path,
-                args.path_to_lib_in_xml
+                args.path_to_lib_in_xml,
+                args.backend,
+                profiler
             )
+    profiler.finish()
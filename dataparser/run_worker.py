@@ -0,0 +1,197 @@
+"""Long running worker process for scanning and indexing.
+
+The worker is started once by the plugin and it keeps the Robot Framework,
+the parsers and the imported libraries loaded between the requests.
+
+Requests are read from the stdin and responses are written to the stdout,
+one json object per line. The request contains the command and the same
+arguments as the run_scanner.py and run_index.py command line options.
+Example: {"command": "scan_single", "path_to_file": "/path/to/file.robot",
+"db_path": "/path/to/db"}. The response contains the result code: {"rc": 0}
+and in case of error also the error message.
+
+Everything else what is written to the stdout, example by the Robot
+Framework console logger, is redirected to the stderr. The worker exits
+when the stdin is closed or when the shutdown command is received.
+"""
+import json
+import logging
+import os
+import sys
+import traceback
+from os import path, makedirs
+
+ROOT_DIR = path.dirname(path.abspath(__file__))
+SETTING_DIR = path.join(ROOT_DIR, '..', 'setting')
+sys.path.append(SETTING_DIR)
+
+from queue.scanner import Scanner
+from index.index import Index
+from run_index import index_all, index_tables, get_dependents
+from parser_utils.sqlite_store import JSON_BACKEND
+from parser_utils.profiler import Profiler
+
+# When there are more tables to index, they are indexed in multiple
+# processes instead of the worker process.
+MAX_TABLES_IN_WORKER = 8
+
+
+class Worker(object):
+    """Handles the scan and index requests.
+
+    Scanner and Index objects are kept between the requests and are
+    only created again when the request arguments require it. When the
+    request contains "profile": true, the phases of the request are
+    recorded and the summary is logged after the request.
+    """
+    def __init__(self):
+        self.profiler = Profiler()
+        self.scanner = None
+        self.scanner_args = None
+        self.index = None
+        self.index_args = None
+        self.commands = {
+            'ping': self.ping,
+            'scan_all': self.scan_all,
+            'scan_single': self.scan_single,
+            'index_all': self.index_all,
+            'index_single': self.index_single,
+            'index_dependents': self.index_dependents
+        }
+
+    def handle(self, request):
+        """Runs the request and returns the response"""
+        command = request.get('command')
+        if command not in self.commands:
+            return {'rc': 1, 'error': 'Unknown command: {0}'.format(command)}
+        self.add_module_search_path(request.get('module_search_path'))
+        self.profiler.enabled = bool(request.get('profile'))
+        try:
+            self.commands[command](request)
+        except Exception:
+            error = traceback.format_exc()
+            logging.error(error)
+            return {'rc': 1, 'error': error}
+        finally:
+            self.profiler.finish()
+        return {'rc': 0}
+
+    def ping(self, request):
+        pass
+
+    def scan_all(self, request):
+        for option in ['workspace', 'extension']:
+            if not request.get(option):
+                raise ValueError(
+                    '{0} is needed with command: scan_all'.format(option))
+        scanner = self.get_scanner(
+            request.get('path_to_lib_in_xml'),
+            request.get('processes', 1),
+            request.get('backend', JSON_BACKEND),
+            request.get('ignore')
+        )
+        scanner.scan(
+            workspace=request['workspace'],
+            ext=request['extension'],
+            db_path=request['db_path']
+        )
+
+    def scan_single(self, request):
+        if not request.get('path_to_file'):
+            raise ValueError(
+                'path_to_file is needed with command: scan_single')
+        scanner = self.get_scanner(
+            request.get('path_to_lib_in_xml'),
+            1,
+            request.get('backend', JSON_BACKEND)
+        )
+        scanner.scan_single_file(
+            file_path=request['path_to_file'],
+            db_path=request['db_path']
+        )
+
+    def index_all(self, request):
+        index_all(
+            request['db_path'],
+            request['index_path'],
+            [],
+            request.get('path_to_lib_in_xml'),
+            self.profiler
+        )
+
+    def index_single(self, request):
+        index_path = request['index_path']
+        if not path.exists(index_path):
+            makedirs(index_path)
+        index = self.get_index(
+            request['db_path'],
+            index_path,
+            request.get('path_to_lib_in_xml')
+        )
+        index.index_consturctor(table=request['db_table'])
+
+    def index_dependents(self, request):
+        index_path = request['index_path']
+        if not path.exists(index_path):
+            makedirs(index_path)
+        db_path = request['db_path']
+        tables = [request['db_table']]
+        tables += get_dependents(db_path, request['db_table'])
+        xml_libraries = request.get('path_to_lib_in_xml')
+        if len(tables) > MAX_TABLES_IN_WORKER:
+            index_tables(
+                db_path, tables, index_path, xml_libraries, self.profiler)
+        else:
+            index = self.get_index(db_path, index_path, xml_libraries)
+            for table in tables:
+                index.index_consturctor(table=table)
+
+    def get_scanner(self, xml_libraries, processes, backend=JSON_BACKEND,
+                    ignore=None):
+        args = (xml_libraries, processes, backend, ignore)
+        if self.scanner_args != args:
+            self.scanner = Scanner(
+                xml_libraries, processes, backend, ignore, self.profiler)
+            self.scanner_args = args
+        return self.scanner
+
+    def get_index(self, db_path, index_path, xml_libraries):
+        args = (db_path, index_path, xml_libraries)
+        if self.index_args != args:
+            self.index = Index(
+                db_path, index_path, xml_libraries, self.profiler)
+            self.index_args = args
+        else:
+            self.index.library_tables.load()
+        return self.index
+
+    def add_module_search_path(self, module_search_path):
+        for path_ in module_search_path or []:
+            if path_ not in sys.path:
+                sys.path.append(path_)
+
+
+def serve(input_stream, output_stream):
+    """Reads requests from input_stream and writes responses to
+    output_stream until input_stream is closed or shutdown is requested.
+    """
+    worker = Worker()
+    for line in iter(input_stream.readline, ''):
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {'rc': 1, 'error': 'Invalid request: {0}'.format(line)}
+        else:
+            if request.get('command') == 'shutdown':
+                break
+            response = worker.handle(request)
+        output_stream.write(json.dumps(response) + '\n')
+        output_stream.flush()
+
+
+if __name__ == '__main__':
+    protocol_stream = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    serve(sys.stdin, protocol_stream)
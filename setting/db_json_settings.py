@@ -5,12 +5,15 @@ class DBJsonSetting(object):
     # table and index key configuration
     arguments = 'arguments'
     documentation = 'documentation'
+    documentation_offset = 'documentation_offset'
+    fingerprint = 'fingerprint'
     file_name = 'file_name'
     file_path = 'file_path'
     keyword = 'keyword'
     keyword_arguments = 'keyword_arguments'
     keyword_name = 'keyword_name'
     keyword_file = 'keyword_file'
+    keyword_lookup = 'keyword_lookup'
     keywords = 'keywords'
     libraries = 'libraries'
     library = 'library'
@@ -20,6 +23,7 @@ class DBJsonSetting(object):
     library_name = 'library_name'
     library_path = 'library_path'
     resources = 'resources'
+    tables = 'tables'
     tags = 'tags'
     variable = 'variable'
     variable_files = 'variable_files'
@@ -1,5 +1,8 @@
 from os import path
 from ..command_helper.current_view import VIEW_FILE_NAME
+from ..dataparser.parser_utils.sqlite_store import sqlite_available
+from ..dataparser.parser_utils.sqlite_store import JSON_BACKEND
+from ..dataparser.parser_utils.sqlite_store import SQLITE_BACKEND
 import sublime
 
 
@@ -49,6 +52,10 @@ class PathResolver(object):
     def index_runner(self):
         return path.join(self.datapraser_folder, 'run_index.py')
 
+    @property
+    def worker_runner(self):
+        return path.join(self.datapraser_folder, 'run_worker.py')
+
     @property
     def log_file(self):
         return path.join(self.default_db_dir, self.log_file_name)
@@ -60,9 +67,11 @@ class SettingObject(object):
     index_dir = 'index_dir'
     scanner_runner = 'scanner_runner'
     index_runner = 'index_runner'
+    worker_runner = 'worker_runner'
     log_file = 'log_file'
     python_binary = 'path_to_python'
     workspace = 'robot_framework_workspace'
+    workspace_ignore = 'robot_framework_workspace_ignore'
     extension = 'robot_framework_extension'
     builtin_variables = 'robot_framework_builtin_variables'
     module_search_path = 'robot_framework_module_search_path'
@@ -75,6 +84,14 @@ class SettingObject(object):
     log_commands = 'robot_framework_log_commands'
     automatic_table_creation = 'robot_framework_automatic_database_table'
     automatic_index_creation = 'robot_framework_automatic_indexing'
+    scanner_processes = 'robot_framework_scanner_processes'
+    persistent_worker = 'robot_framework_persistent_worker'
+    job_delay = 'robot_framework_job_delay'
+    completion_limit = 'robot_framework_completion_limit'
+    database_backend = 'robot_framework_database_backend'
+    binary_view = 'robot_framework_binary_view'
+    profile = 'robot_framework_profile'
+    metrics_interval = 'robot_framework_metrics_interval'
 
 
 def get_scanner_dir():
@@ -120,6 +137,27 @@ def get_view_path():
         return path.join(project_setting, PathResolver().view_folder)
 
 
+_backend_warned = False
+
+
+def get_database_backend():
+    """Returns the database backend or json if sqlite3 is not available.
+
+    Plugin could not read the tables from the SQLite store when the
+    sqlite3 module is missing from the Sublime Text Python, therefore
+    tables are then saved as JSON files and a warning is printed.
+    """
+    global _backend_warned
+    backend = get_sublime_setting(SettingObject.database_backend)
+    if backend == SQLITE_BACKEND and not sqlite_available():
+        if not _backend_warned:
+            print('The sqlite3 module is not available in the Sublime Text '
+                  'Python, using the json database backend instead.')
+            _backend_warned = True
+        return JSON_BACKEND
+    return backend
+
+
 def get_setting(setting):
     if setting.lower() == SettingObject.table_dir:
         return get_scanner_dir()
@@ -129,12 +167,16 @@ def get_setting(setting):
         return PathResolver().scanner_runner
     elif setting.lower() == SettingObject.index_runner:
         return PathResolver().index_runner
+    elif setting.lower() == SettingObject.worker_runner:
+        return PathResolver().worker_runner
     elif setting.lower() == SettingObject.log_file:
         return get_log_file()
     elif setting.lower() == SettingObject.view_completions:
         return get_view_file()
     elif setting.lower() == SettingObject.view_path:
         return get_view_path()
+    elif setting.lower() == SettingObject.database_backend:
+        return get_database_backend()
     else:
         return get_sublime_setting(setting)
 
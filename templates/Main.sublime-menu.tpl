@@ -60,6 +60,10 @@
                                 "command": "log_commands",
                                 "caption": "Command Logging"
                             },
+                            {
+                                "command": "show_performance_metrics",
+                                "caption": "Show Performance Metrics"
+                            },
                         ]
                     }
                 ]
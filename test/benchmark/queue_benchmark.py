@@ -0,0 +1,108 @@
+"""Micro-benchmark for the ParsingQueue
+
+Compares the ParsingQueue against the previous OrderedDict based
+implementation, which rebuilt the whole queue on every add. The
+benchmark simulates a scan: every item is added to the queue two times,
+like an import found from two files, and all items are taken from the
+queue and marked as scanned.
+
+Usage: python queue_benchmark.py [--sizes 10000 50000 100000]
+                                 [--legacy_max 10000]
+"""
+import argparse
+import sys
+import timeit
+from collections import OrderedDict
+from copy import deepcopy
+from os import path
+
+ROOT_DIR = path.dirname(path.abspath(__file__))
+sys.path.insert(0, path.normpath(path.join(ROOT_DIR, '..', '..', 'setting')))
+sys.path.insert(
+    0, path.normpath(path.join(ROOT_DIR, '..', '..', 'dataparser')))
+
+from queue.queue import ParsingQueue
+
+
+class LegacyParsingQueue(object):
+    """The OrderedDict based ParsingQueue before the deque rewrite"""
+
+    def __init__(self):
+        self.queue = OrderedDict({})
+
+    def add(self, data, rf_type, arg):
+        if data not in self.queue:
+            new = OrderedDict([(
+                data,
+                {'scanned': False, 'type': rf_type, 'args': arg})])
+            old = self.queue
+            self.queue = OrderedDict(list(new.items()) + list(old.items()))
+
+    def get(self):
+        try:
+            data = self.queue.popitem(last=False)
+            tmp = deepcopy(data)
+            tmp[1]['scanned'] = 'queued'
+            self.queue[tmp[0]] = tmp[1]
+            return data
+        except KeyError:
+            return {}
+
+    def set(self, data):
+        status = self.queue[data]
+        status['scanned'] = True
+        self.queue[data] = status
+
+
+def simulate_scan(queue_class, size):
+    queue = queue_class()
+    for round_ in range(2):
+        for index in range(size):
+            queue.add('/path/to/resource_{0}.robot'.format(index),
+                      'resource', None)
+    while True:
+        item = queue.get()
+        if not item or item[1]['scanned']:
+            break
+        queue.set(item[0])
+
+
+def measure(queue_class, size):
+    timer = timeit.Timer(lambda: simulate_scan(queue_class, size))
+    return timer.timeit(number=1)
+
+
+def main(sizes, legacy_max):
+    row = '{0:>10} {1:>14} {2:>14} {3:>10}'
+    print(row.format('items', 'legacy (s)', 'current (s)', 'speedup'))
+    for size in sizes:
+        current = measure(ParsingQueue, size)
+        if size <= legacy_max:
+            legacy = measure(LegacyParsingQueue, size)
+            print(row.format(
+                size,
+                '{0:.3f}'.format(legacy),
+                '{0:.3f}'.format(current),
+                '{0:.0f}x'.format(legacy / current)))
+        else:
+            print(row.format(
+                size, 'skipped', '{0:.3f}'.format(current), '-'))
+
+
+if __name__ == '__main__':
+    c_parser = argparse.ArgumentParser(
+        description='Micro-benchmark for the ParsingQueue')
+    c_parser.add_argument(
+        '--sizes',
+        nargs='*',
+        type=int,
+        default=[10000, 50000, 100000],
+        help='Number of unique items added to the queue')
+    c_parser.add_argument(
+        '--legacy_max',
+        type=int,
+        default=10000,
+        help=('Largest size measured with the legacy queue, which is '
+              'quadratic and very slow with large sizes'))
+    args = c_parser.parse_args()
+    main(args.sizes, args.legacy_max)
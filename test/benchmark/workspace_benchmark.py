@@ -0,0 +1,184 @@
+"""Benchmark for scanning, indexing, completions and documentation
+
+Generates synthetic workspace with the workspace_generator and measures:
+scanning the workspace, scanning the workspace again when nothing has
+changed, indexing all tables, creating the current view, keyword and
+variable completions and keyword documentation. Results are written as
+JSON, so that they can be compared between the versions.
+
+Usage: python workspace_benchmark.py [--output results.json]
+           [--suites 100] [--resources 50] [--depth 5] [--keywords 20]
+           [--libraries 5] [--xml_libraries 2] [--repeat 10]
+           [--processes 1] [--backend json] [--binary_view]
+"""
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+from os import path, makedirs
+from timeit import default_timer
+
+ROOT_DIR = path.dirname(path.abspath(__file__))
+sys.path.insert(0, path.normpath(path.join(ROOT_DIR, '..', '..', 'setting')))
+sys.path.insert(
+    0, path.normpath(path.join(ROOT_DIR, '..', '..', 'dataparser')))
+sys.path.insert(
+    0, path.normpath(path.join(ROOT_DIR, '..', '..', 'command_helper')))
+
+from robot.version import VERSION as RF_VERSION
+from queue.scanner import Scanner
+from run_index import index_all
+from parser_utils.sqlite_store import JSON_BACKEND, SQLITE_BACKEND
+from current_view import CurrentView, VIEW_FILE_NAME
+from completions import get_completion_list
+from get_documentation import GetKeywordDocumentation
+from workspace_generator import generate_workspace, keyword_name
+from workspace_generator import resource_import
+
+RF_CELL = '    '
+COMPLETION_PREFIXES = ['Op', 'verkey', 'Resource 0 Keyword', '${RES']
+
+
+def timed(function, repeat=1):
+    """Runs the function repeat times and returns the timing statistics"""
+    times = []
+    for _ in range(repeat):
+        start = default_timer()
+        function()
+        times.append(default_timer() - start)
+    times.sort()
+    return {
+        'repeat': repeat,
+        'min': times[0],
+        'median': times[len(times) // 2],
+        'max': times[-1],
+        'total': sum(times)
+    }
+
+
+def deepest_resource(resources, depth):
+    """Returns index of the last resource imported by the first suite"""
+    index = 0
+    while resource_import(index, resources, depth) is not None:
+        index = resource_import(index, resources, depth)
+    return index
+
+
+def run(work_dir, suites=100, resources=50, depth=5, keywords=20,
+        libraries=5, xml_libraries=2, repeat=10, processes=1,
+        backend=JSON_BACKEND, binary_view=False):
+    """Generates the workspace to work_dir and returns the results"""
+    workspace, xml_dir = generate_workspace(
+        work_dir, suites, resources, depth, keywords, libraries,
+        xml_libraries)
+    db_dir = path.join(work_dir, 'db')
+    index_dir = path.join(work_dir, 'index')
+    view_dir = path.join(work_dir, 'view')
+    makedirs(db_dir)
+    open_tab = path.join(workspace, 'suites', 'suite_0.robot')
+    results = {}
+
+    def scan():
+        scanner = Scanner(xml_dir, processes, backend)
+        scanner.scan(workspace, 'robot', db_dir)
+        scanner.close_store()
+    results['scan'] = timed(scan)
+    results['scan_unchanged'] = timed(scan)
+    results['index_all'] = timed(
+        lambda: index_all(db_dir, index_dir, [], xml_dir))
+    current_view = CurrentView()
+    results['create_view'] = timed(
+        lambda: current_view.create_view(
+            open_tab, view_dir, index_dir, binary_view),
+        repeat)
+    view_path = path.join(view_dir, VIEW_FILE_NAME)
+    completions = {}
+    for prefix in COMPLETION_PREFIXES:
+        completions[prefix] = timed(
+            lambda: get_completion_list(
+                view_path, prefix, '', RF_CELL, None, False),
+            repeat)
+        completions[prefix]['matches'] = len(get_completion_list(
+            view_path, prefix, '', RF_CELL, None, False))
+    results['get_completion_list'] = completions
+    get_doc = GetKeywordDocumentation(db_dir, index_dir, open_tab)
+    if resources:
+        resource = deepest_resource(resources, depth)
+        object_name = 'resource_{0}'.format(resource)
+        keyword = keyword_name('Resource {0}'.format(resource), 0)
+    else:
+        object_name = 'BuiltIn'
+        keyword = 'Log'
+    results['return_documentation'] = timed(
+        lambda: get_doc.return_documentation(object_name, keyword),
+        repeat)
+    return {
+        'parameters': {
+            'suites': suites,
+            'resources': resources,
+            'depth': depth,
+            'keywords': keywords,
+            'libraries': libraries,
+            'xml_libraries': xml_libraries,
+            'repeat': repeat,
+            'processes': processes,
+            'backend': backend,
+            'binary_view': binary_view
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'robot_framework': RF_VERSION
+        },
+        'results': results
+    }
+
+
+def main(args):
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix='rf_benchmark_')
+    try:
+        result = run(
+            work_dir, args.suites, args.resources, args.depth,
+            args.keywords, args.libraries, args.xml_libraries, args.repeat,
+            args.processes, args.backend, args.binary_view)
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=4, sort_keys=True)
+    else:
+        print(json.dumps(result, indent=4, sort_keys=True))
+
+
+if __name__ == '__main__':
+    c_parser = argparse.ArgumentParser(
+        description='Benchmark for scanning, indexing and completions')
+    c_parser.add_argument('--output', help='File where results are saved')
+    c_parser.add_argument(
+        '--work_dir',
+        help=('Empty folder where workspace and database are created and '
+              'kept. By default temporary folder is used and removed'))
+    c_parser.add_argument('--suites', type=int, default=100)
+    c_parser.add_argument('--resources', type=int, default=50)
+    c_parser.add_argument('--depth', type=int, default=5)
+    c_parser.add_argument('--keywords', type=int, default=20)
+    c_parser.add_argument('--libraries', type=int, default=5)
+    c_parser.add_argument('--xml_libraries', type=int, default=2)
+    c_parser.add_argument(
+        '--repeat',
+        type=int,
+        default=10,
+        help='How many times fast operations are repeated')
+    c_parser.add_argument('--processes', type=int, default=1)
+    c_parser.add_argument(
+        '--backend',
+        choices=[JSON_BACKEND, SQLITE_BACKEND],
+        default=JSON_BACKEND)
+    c_parser.add_argument(
+        '--binary_view',
+        action='store_true',
+        help='Create the current view in binary format')
+    main(c_parser.parse_args())
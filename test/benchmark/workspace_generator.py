@@ -0,0 +1,199 @@
+"""Generates synthetic Robot Framework workspace for the benchmarks
+
+The workspace contains test suites, resource files, Python libraries and
+libraries in libdoc XML format. Resource files are divided in ``depth``
+levels: each resource imports one resource from the next level, so that
+the import chain of a suite is ``depth`` resources deep. Every suite
+imports one resource from the first level, one Python library and
+BuiltIn. Every file and library contains ``keywords`` keywords.
+
+Usage: python workspace_generator.py output_dir [--suites 100]
+           [--resources 50] [--depth 5] [--keywords 20] [--libraries 5]
+           [--xml_libraries 2]
+"""
+import argparse
+from os import path, makedirs
+
+WORKSPACE_DIR = 'workspace'
+LIBRARY_DIR = 'libraries'
+XML_LIBRARY_DIR = 'xml_libraries'
+KEYWORD_WORDS = [
+    'Open', 'Close', 'Verify', 'Click', 'Select', 'Wait For', 'Get',
+    'Set', 'Input', 'Submit', 'Check', 'Clear'
+]
+
+
+def keyword_name(prefix, index):
+    return '{0} {1} Keyword {2}'.format(
+        KEYWORD_WORDS[index % len(KEYWORD_WORDS)], prefix, index)
+
+
+def resource_name(index):
+    return 'resource_{0}.robot'.format(index)
+
+
+def library_name(index):
+    return 'BenchmarkLibrary{0}'.format(index)
+
+
+def resource_level(index, resources, depth):
+    """Returns the import level, from 0 to depth - 1, of the resource"""
+    per_level = max(resources // depth, 1)
+    return min(index // per_level, depth - 1)
+
+
+def resource_import(index, resources, depth):
+    """Returns index of the resource imported by the resource or None"""
+    level = resource_level(index, resources, depth)
+    if level == depth - 1:
+        return None
+    per_level = max(resources // depth, 1)
+    next_level = (level + 1) * per_level
+    if next_level >= resources:
+        return None
+    return next_level + index % per_level
+
+
+def write_file(f_path, lines):
+    if not path.exists(path.dirname(f_path)):
+        makedirs(path.dirname(f_path))
+    with open(f_path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def keyword_lines(prefix, keywords):
+    lines = ['*** Keywords ***']
+    for index in range(keywords):
+        lines.extend([
+            keyword_name(prefix, index),
+            '    [Documentation]    Documentation of the keyword '
+            '{0} in {1}.'.format(index, prefix),
+            '    [Arguments]    ${arg}    ${other}=default',
+            '    Log    ${arg}',
+            ''
+        ])
+    return lines
+
+
+def resource_lines(index, resources, depth, libraries, keywords):
+    lines = ['*** Settings ***']
+    imported = resource_import(index, resources, depth)
+    if imported is not None:
+        lines.append('Resource    {0}'.format(resource_name(imported)))
+    if libraries:
+        lines.append('Library    ../{0}/{1}.py'.format(
+            LIBRARY_DIR, library_name(index % libraries)))
+    lines.extend([
+        '',
+        '*** Variables ***',
+        '${{RESOURCE_{0}}}    value {0}'.format(index),
+        ''
+    ])
+    return lines + keyword_lines('Resource {0}'.format(index), keywords)
+
+
+def suite_lines(index, resources, depth, libraries, keywords):
+    lines = ['*** Settings ***']
+    if resources:
+        first_level = min(max(resources // depth, 1), resources)
+        lines.append('Resource    ../resources/{0}'.format(
+            resource_name(index % first_level)))
+    if libraries:
+        lines.append('Library    ../{0}/{1}.py'.format(
+            LIBRARY_DIR, library_name(index % libraries)))
+    prefix = 'Suite {0}'.format(index)
+    lines.extend([
+        '',
+        '*** Test Cases ***',
+        'Test Case {0}'.format(index),
+        '    {0}    value'.format(keyword_name(prefix, 0)),
+        ''
+    ])
+    return lines + keyword_lines(prefix, keywords)
+
+
+def library_lines(index, keywords):
+    lines = []
+    for kw_index in range(keywords):
+        lines.extend([
+            '',
+            'def {0}(arg, other=None):'.format(
+                keyword_name('Library', kw_index).lower().replace(' ', '_')),
+            '    """Documentation of the keyword {0} in {1}."""'.format(
+                kw_index, library_name(index)),
+            '    return arg',
+            ''
+        ])
+    return lines
+
+
+def xml_library_lines(index, keywords):
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<keywordspec generated="20160101 00:00:00" type="library" '
+        'name="BenchmarkXmlLibrary{0}" format="ROBOT">'.format(index),
+        '<version></version>',
+        '<scope>global</scope>',
+        '<namedargs>yes</namedargs>',
+        '<doc>Benchmark XML library {0}.</doc>'.format(index)
+    ]
+    for kw_index in range(keywords):
+        lines.extend([
+            '<kw name="{0}">'.format(keyword_name('Xml', kw_index)),
+            '<arguments>',
+            '<arg>arg</arg>',
+            '</arguments>',
+            '<doc>Documentation of the keyword {0}.</doc>'.format(kw_index),
+            '<tags>',
+            '</tags>',
+            '</kw>'
+        ])
+    lines.append('</keywordspec>')
+    return lines
+
+
+def generate_workspace(output_dir, suites=100, resources=50, depth=5,
+                       keywords=20, libraries=5, xml_libraries=2):
+    """Generates the workspace to the output_dir.
+
+    Returns tuple of: workspace folder and XML library folder.
+    """
+    depth = max(depth, 1)
+    workspace = path.join(output_dir, WORKSPACE_DIR)
+    xml_dir = path.join(output_dir, XML_LIBRARY_DIR)
+    for index in range(suites):
+        write_file(
+            path.join(workspace, 'suites', 'suite_{0}.robot'.format(index)),
+            suite_lines(index, resources, depth, libraries, keywords))
+    for index in range(resources):
+        write_file(
+            path.join(workspace, 'resources', resource_name(index)),
+            resource_lines(index, resources, depth, libraries, keywords))
+    for index in range(libraries):
+        write_file(
+            path.join(workspace, LIBRARY_DIR,
+                      '{0}.py'.format(library_name(index))),
+            library_lines(index, keywords))
+    if not path.exists(xml_dir):
+        makedirs(xml_dir)
+    for index in range(xml_libraries):
+        write_file(
+            path.join(xml_dir, 'BenchmarkXmlLibrary{0}.xml'.format(index)),
+            xml_library_lines(index, keywords))
+    return workspace, xml_dir
+
+
+if __name__ == '__main__':
+    c_parser = argparse.ArgumentParser(
+        description='Generates synthetic Robot Framework workspace')
+    c_parser.add_argument('output_dir', help='Where workspace is created')
+    c_parser.add_argument('--suites', type=int, default=100)
+    c_parser.add_argument('--resources', type=int, default=50)
+    c_parser.add_argument('--depth', type=int, default=5)
+    c_parser.add_argument('--keywords', type=int, default=20)
+    c_parser.add_argument('--libraries', type=int, default=5)
+    c_parser.add_argument('--xml_libraries', type=int, default=2)
+    args = c_parser.parse_args()
+    generate_workspace(
+        args.output_dir, args.suites, args.resources, args.depth,
+        args.keywords, args.libraries, args.xml_libraries)
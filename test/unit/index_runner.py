@@ -1,11 +1,12 @@
 import shutil
 import multiprocessing
-from os import path, listdir, makedirs
+from os import path, makedirs
 from index.index import index_a_table
+from parser_utils.util import list_tables
 
 
 def index_all(db_path, index_path):
-    tables = listdir(db_path)
+    tables = list_tables(db_path)
     params = []
     for table in tables:
         params.append((db_path, table, index_path, None))
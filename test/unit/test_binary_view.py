@@ -0,0 +1,128 @@
+import unittest
+import env
+import json
+import shutil
+from os import path, makedirs, listdir
+from index_runner import index_all
+from queue.scanner import Scanner
+from binary_view import BinaryView, write_binary_view, get_binary_view
+from binary_view import binary_view_path, close_binary_view
+from current_view import CurrentView, get_view_data, get_view_keywords
+from current_view import KW_COMPLETION
+from completions import get_kw_completion_list
+from keyword_search import create_search_index, search_keywords
+
+RF_CELL = '    '
+
+
+class TestBinaryView(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.view_dir = path.join(env.RESULTS_DIR, 'binary_view')
+        if path.exists(cls.view_dir):
+            shutil.rmtree(cls.view_dir)
+        makedirs(cls.view_dir)
+        with open(path.join(env.RESOURCES_DIR, 'current_view.json')) as f:
+            cls.data = json.load(f)
+        cls.keywords = cls.data[KW_COMPLETION]
+        cls.json_view = path.join(env.RESOURCES_DIR, 'current_view.json')
+        cls.view_path = path.join(cls.view_dir, 'current_view.json')
+        data = dict(cls.data)
+        del data[KW_COMPLETION]
+        data.pop('search_index', None)
+        with open(cls.view_path, 'w') as f:
+            json.dump(data, f)
+        cls.bin_path = binary_view_path(cls.view_path)
+        write_binary_view(cls.bin_path, cls.keywords)
+
+    @classmethod
+    def tearDownClass(cls):
+        close_binary_view(cls.bin_path)
+
+    def test_read(self):
+        view = get_binary_view(self.view_path)
+        self.assertIs(get_binary_view(self.view_path), view)
+        self.assertEqual(len(view), len(self.keywords))
+        self.assertEqual(view[0], self.keywords[0])
+        self.assertEqual(view.keywords(), self.keywords)
+        self.assertRaises(IndexError, view.__getitem__, len(self.keywords))
+        self.assertIs(get_view_keywords(self.view_path), view)
+
+    def test_search(self):
+        view = get_binary_view(self.view_path)
+        search_index = create_search_index(self.keywords)
+        for prefix in ['', 'Run', 'RunKeY', 'bui', 'log', 'xyzzy', '_']:
+            self.assertEqual(
+                view.search(prefix),
+                search_keywords(self.keywords, search_index, prefix))
+        self.assertIsNone(view.search('Run.Key'))
+
+    def test_completions(self):
+        for prefix in ['Run', 'RunKeY', 'BUI', 'Run.Key']:
+            for limit in [None, 5]:
+                self.assertEqual(
+                    get_kw_completion_list(
+                        self.view_path, prefix, RF_CELL, None, False, limit),
+                    get_kw_completion_list(
+                        self.json_view, prefix, RF_CELL, None, False, limit))
+        self.assertEqual(
+            get_kw_completion_list(
+                self.view_path, 'Log', RF_CELL, 'BuiltIn', False),
+            get_kw_completion_list(
+                self.json_view, 'Log', RF_CELL, 'BuiltIn', False))
+
+    def test_rewrite_does_not_close_view_in_use(self):
+        view_path = path.join(self.view_dir, 'rewrite', 'current_view.json')
+        makedirs(path.dirname(view_path))
+        bin_path = binary_view_path(view_path)
+        write_binary_view(bin_path, self.keywords[:2])
+        view = get_binary_view(view_path)
+        write_binary_view(bin_path, self.keywords[:3])
+        self.assertEqual(view[1], self.keywords[1])
+        new_view = get_binary_view(view_path)
+        self.assertIsNot(new_view, view)
+        self.assertEqual(len(new_view), 3)
+        self.assertEqual(
+            [f for f in listdir(path.dirname(bin_path))
+             if f.endswith('.tmp')], [])
+        close_binary_view(bin_path)
+
+    def test_invalid_file(self):
+        invalid = path.join(self.view_dir, 'invalid.bin')
+        with open(invalid, 'wb') as f:
+            f.write(b'\x00' * 64)
+        self.assertRaises(ValueError, BinaryView, invalid)
+
+
+class TestCreateBinaryView(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        db_base = path.join(env.RESULTS_DIR, 'binary_view_db')
+        cls.db_dir = path.join(db_base, 'db_dir')
+        cls.index_dir = path.join(db_base, 'index_dir')
+        cls.view_db = path.join(db_base, 'view')
+        if path.exists(db_base):
+            shutil.rmtree(db_base)
+        makedirs(cls.db_dir)
+        cls.workspace = path.join(env.TEST_DATA_DIR, 'suite_tree')
+        Scanner().scan(cls.workspace, 'robot', cls.db_dir)
+        index_all(cls.db_dir, cls.index_dir)
+        cls.open_tab = path.join(cls.workspace, 'test_a.robot')
+        cls.view_path = path.join(cls.view_db, 'current_view.json')
+
+    def test_create_view(self):
+        cv = CurrentView()
+        cv.create_view(self.open_tab, self.view_db, self.index_dir)
+        json_keywords = get_view_keywords(self.view_path)
+        self.assertFalse(path.exists(binary_view_path(self.view_path)))
+        cv.create_view(self.open_tab, self.view_db, self.index_dir, True)
+        self.assertTrue(path.exists(binary_view_path(self.view_path)))
+        self.assertNotIn(KW_COMPLETION, get_view_data(self.view_path))
+        self.assertEqual(
+            get_view_keywords(self.view_path).keywords(), json_keywords)
+        self.assertTrue(cv.view_same(self.open_tab, self.view_db))
+        cv.create_view(self.open_tab, self.view_db, self.index_dir)
+        self.assertFalse(path.exists(binary_view_path(self.view_path)))
+        self.assertEqual(get_view_keywords(self.view_path), json_keywords)
@@ -53,6 +53,22 @@ class TestCompletions(unittest.TestCase):
                                           RF_CELL, None, False)
         self.assertEqual(len(kw_tuple), 24)
 
+    def test_get_kw_completion_list_limit(self):
+        prefix = 'Run'
+        kw_tuple = get_kw_completion_list(self.test_a_index, prefix,
+                                          RF_CELL, None, False, 5)
+        self.assertEqual(len(kw_tuple), 5)
+        for trigger, _ in kw_tuple:
+            self.assertTrue(trigger.startswith('Run '), trigger)
+        all_kw = get_kw_completion_list(self.test_a_index, prefix,
+                                        RF_CELL, None, False, 1000)
+        self.assertEqual(len(all_kw), 70)
+        self.assertEqual(all_kw[:5], kw_tuple)
+        kw_tuple = get_kw_completion_list(self.test_a_index, 'librarykeyword',
+                                          RF_CELL, 'LibNoClass', False, 1)
+        self.assertEqual(len(kw_tuple), 1)
+        self.assertTrue(kw_tuple[0][0].startswith('Library Keyword 1'))
+
     def test_get_kw_completion_list_structure(self):
         prefix = 'Run'
         kw_tuple = get_kw_completion_list(self.test_a_index, prefix,
@@ -7,7 +7,7 @@ from os import path, makedirs, remove
 from time import sleep
 from index_runner import index_all
 from queue.scanner import Scanner
-from current_view import CurrentView
+from current_view import CurrentView, get_view_data
 
 
 class TestCurrentView(unittest.TestCase):
@@ -94,10 +94,58 @@ class TestCurrentView(unittest.TestCase):
         ]
         expected['completion'] = self.completions()
         self.assertEqual(data['variable'], expected['variable'])
+        self.assertEqual(
+            data['search_index']['k'],
+            [i for i, kw in enumerate(data['completion'])
+             if 'k' in kw[0].lower()])
+        self.assertEqual(data['object_rank']['test_a'], 0)
+        self.assertEqual(data['object_rank']['resource_a'], 1)
+        self.assertEqual(data['object_rank']['BuiltIn'], 2)
         self.assertEqual(
             data['completion'].sort(), expected['completion'].sort()
         )
 
+    def test_view_up_to_date(self):
+        view_db = path.dirname(self.current_view)
+        self.assertFalse(
+            self.cv.view_up_to_date(self.open_tab, view_db, self.index_dir))
+        self.cv.create_view(self.open_tab, view_db, self.index_dir)
+        self.assertTrue(
+            self.cv.view_up_to_date(self.open_tab, view_db, self.index_dir))
+        self.assertFalse(
+            self.cv.view_up_to_date(self.other_tab, view_db, self.index_dir))
+        data = get_view_data(self.current_view)
+        data['fingerprint'] = 'old'
+        with open(self.current_view, 'w') as f:
+            json.dump(data, f)
+        self.assertFalse(
+            self.cv.view_up_to_date(self.open_tab, view_db, self.index_dir))
+
+    def test_get_view_data(self):
+        view_db = path.dirname(self.current_view)
+        self.cv.create_view(self.open_tab, view_db, self.index_dir)
+        reads = []
+        get_data = CurrentView.get_data
+
+        def read_counter(view_path):
+            reads.append(view_path)
+            return get_data(view_path)
+        CurrentView.get_data = staticmethod(read_counter)
+        try:
+            data = get_view_data(self.current_view)
+            self.assertIn('${TEST_A}', data['variable'])
+            self.assertIs(get_view_data(self.current_view), data)
+            self.assertEqual(reads, [])
+            with open(self.current_view, 'w') as f:
+                json.dump({'variable': ['${CHANGED}'], 'completion': []}, f)
+            data = get_view_data(self.current_view)
+            self.assertEqual(data['variable'], ['${CHANGED}'])
+            self.assertEqual(reads, [self.current_view])
+            get_view_data(self.current_view)
+            self.assertEqual(reads, [self.current_view])
+        finally:
+            CurrentView.get_data = staticmethod(get_data)
+
     def test_view_in_db(self):
         ext = 'robot'
         self.assertEqual(
@@ -0,0 +1,69 @@
+import unittest
+import env
+import os
+import shutil
+from parser_utils.doc_store import split_documentation, get_documentation
+from parser_utils.doc_store import doc_store_path, DOC_STORE_DIR
+
+
+class TestDocStore(unittest.TestCase):
+
+    def setUp(self):
+        self.db_dir = os.path.join(env.RESULTS_DIR, 'doc_store', 'db_dir')
+        if os.path.exists(self.db_dir):
+            shutil.rmtree(self.db_dir)
+        os.makedirs(self.db_dir)
+        self.table_path = os.path.join(
+            self.db_dir, 'MyLib-ca8f2e8d70641ce17b9b304086c19657.json')
+        self.data = {
+            'library_module': 'MyLib',
+            'keywords': {
+                'keyword_1': {
+                    'keyword_name': 'Keyword 1',
+                    'documentation': u'First keyword \xe4.'
+                },
+                'keyword_2': {
+                    'keyword_name': 'Keyword 2',
+                    'documentation': 'Second keyword.\nIn multi line'
+                },
+                'keyword_3': {'keyword_name': 'Keyword 3'}
+            }
+        }
+
+    def test_doc_store_path(self):
+        self.assertEqual(
+            doc_store_path(self.table_path),
+            os.path.join(
+                self.db_dir,
+                DOC_STORE_DIR,
+                'MyLib-ca8f2e8d70641ce17b9b304086c19657.docs'))
+
+    def test_split_documentation(self):
+        data = split_documentation(self.data, self.table_path)
+        self.assertIn('documentation', self.data['keywords']['keyword_1'])
+        for kw in data['keywords'].values():
+            self.assertNotIn('documentation', kw)
+            self.assertIn('documentation_offset', kw)
+        self.assertEqual(data['library_module'], 'MyLib')
+        self.assertTrue(os.path.isfile(doc_store_path(self.table_path)))
+        keywords = data['keywords']
+        self.assertEqual(
+            get_documentation(self.table_path, keywords['keyword_1']),
+            u'First keyword \xe4.')
+        self.assertEqual(
+            get_documentation(self.table_path, keywords['keyword_2']),
+            'Second keyword.\nIn multi line')
+        self.assertEqual(
+            get_documentation(self.table_path, keywords['keyword_3']), '')
+
+    def test_table_without_keywords(self):
+        split_documentation(self.data, self.table_path)
+        data = {'library_module': 'MyLib', 'keywords': {}}
+        self.assertIs(split_documentation(data, self.table_path), data)
+        self.assertFalse(os.path.exists(doc_store_path(self.table_path)))
+
+    def test_documentation_in_table(self):
+        self.assertEqual(
+            get_documentation(
+                self.table_path, self.data['keywords']['keyword_2']),
+            'Second keyword.\nIn multi line')
@@ -0,0 +1,67 @@
+import unittest
+import env
+import os
+import shutil
+import types
+from queue.finder import finder, DEFAULT_IGNORE
+
+
+class TestFinder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.workspace = os.path.join(env.RESULTS_DIR, 'finder', 'workspace')
+        if os.path.exists(cls.workspace):
+            shutil.rmtree(cls.workspace)
+        files = [
+            'a.robot',
+            'a.txt',
+            os.path.join('.git', 'git.robot'),
+            os.path.join('node_modules', 'module.robot'),
+            os.path.join('env', 'pyvenv.cfg'),
+            os.path.join('env', 'env.robot'),
+            os.path.join('sub', 'b.robot'),
+            os.path.join('sub', 'results', 'c.robot'),
+            os.path.join('results', 'd.robot')
+        ]
+        for f_path in files:
+            f_path = os.path.join(cls.workspace, f_path)
+            if not os.path.exists(os.path.dirname(f_path)):
+                os.makedirs(os.path.dirname(f_path))
+            open(f_path, 'w').close()
+        if hasattr(os, 'symlink'):
+            os.symlink(
+                cls.workspace, os.path.join(cls.workspace, 'sub', 'loop'))
+
+    def find(self, ext='robot', ignore=None):
+        return sorted(
+            os.path.relpath(f_path, self.workspace).replace(os.sep, '/')
+            for f_path in finder(self.workspace, ext, ignore))
+
+    def test_finder_is_generator(self):
+        self.assertIsInstance(
+            finder(self.workspace, 'robot'), types.GeneratorType)
+
+    def test_default_ignore(self):
+        self.assertEqual(
+            self.find(),
+            ['a.robot', 'results/d.robot', 'sub/b.robot',
+             'sub/results/c.robot'])
+        self.assertEqual(self.find('*.txt'), ['a.txt'])
+
+    def test_ignore_patterns(self):
+        self.assertEqual(
+            self.find(ignore=DEFAULT_IGNORE + ('results',)),
+            ['a.robot', 'sub/b.robot'])
+        self.assertEqual(
+            self.find(ignore=DEFAULT_IGNORE + ('sub/res*', 'a.*')),
+            ['results/d.robot', 'sub/b.robot'])
+        self.assertEqual(
+            self.find(ignore=[]),
+            ['.git/git.robot', 'a.robot', 'node_modules/module.robot',
+             'results/d.robot', 'sub/b.robot', 'sub/results/c.robot'])
+
+    def test_missing_path(self):
+        self.assertEqual(
+            list(finder(os.path.join(self.workspace, 'missing'), 'robot')),
+            [])
@@ -6,6 +6,8 @@ from index_runner import index_all
 from queue.scanner import Scanner
 from parser_utils.file_formatter import rf_table_name, lib_table_name
 from get_documentation import GetKeywordDocumentation
+from get_documentation import get_keyword_lookup, create_keyword_lookup
+from parser_utils.symbol_table import read_index
 
 
 class GetDocumentation(unittest.TestCase):
@@ -112,6 +114,29 @@ class GetDocumentation(unittest.TestCase):
         table_name = self.get_doc.get_table_name_from_index(object_name, cell)
         self.assertEqual(table_name, self.resource_a_table_name)
 
+    def test_get_keyword_location(self):
+        location = self.get_doc.get_keyword_location('BuiltIn', 'noOperation')
+        self.assertEqual(
+            location, ['BuiltIn', self.builtin_table_name, 'No Operation'])
+        location = self.get_doc.get_keyword_location(None, 'test_a_keyword')
+        self.assertEqual(
+            location, ['test_a', self.test_a_table_name, 'Test A Keyword'])
+        self.assertIsNone(
+            self.get_doc.get_keyword_location('BuiltIn', 'Test A Keyword'))
+        self.assertIsNone(
+            self.get_doc.get_keyword_location(None, 'Not Existing'))
+
+    def test_get_keyword_lookup(self):
+        index_path = path.join(self.index_dir, self.test_a_index_name)
+        lookup = get_keyword_lookup(index_path)
+        self.assertIs(get_keyword_lookup(index_path), lookup)
+        index_data = read_index(index_path)
+        self.assertEqual(
+            create_keyword_lookup(index_data['keyword']), lookup)
+        self.assertEqual(
+            lookup['runkeyword'],
+            [['BuiltIn', self.builtin_table_name, 'Run Keyword']])
+
     def test_get_keyword_documentation(self):
         cell = 'No Operation'
         object_name = 'BuiltIn'
@@ -8,6 +8,9 @@ from collections import namedtuple
 from queue.scanner import Scanner
 from queue.scanner import rf_table_name, lib_table_name
 from index.index import Index
+from parser_utils.util import list_tables, index_up_to_date
+from parser_utils.symbol_table import read_index, read_symbols
+from parser_utils.symbol_table import SYMBOLS_DIR
 
 
 class TestIndexing(unittest.TestCase):
@@ -111,6 +114,66 @@ class TestIndexing(unittest.TestCase):
         data = self.get_s2l()
         self.assertEqual(self.index.get_imports(data), [])
 
+    def test_get_library_table_name(self):
+        self.assertEqual(
+            self.index.get_library_table_name('Process'),
+            self.process_table_name)
+        self.index.library_tables.libraries = {}
+        self.assertEqual(
+            self.index.get_library_table_name('Process'),
+            self.process_table_name)
+        lib_no_class = os.path.join(self.suite_dir, 'LibNoClass.py')
+        self.assertEqual(
+            self.index.get_library_table_name(lib_no_class),
+            self.libnoclass_table_name)
+        self.assertIsNone(
+            self.index.get_library_table_name('NotScannedLibrary'))
+        self.index.library_tables.add('Process', 'Process-from-map.json')
+        self.assertEqual(
+            self.index.get_library_table_name('Process'),
+            'Process-from-map.json')
+
+    def test_reused_index_is_same_as_new_index(self):
+        for table in list_tables(self.db_dir):
+            new_index = Index(self.db_dir, self.index_dir)
+            expected = new_index.create_index_for_table(self.db_dir, table)
+            result = self.index.create_index_for_table(self.db_dir, table)
+            self.assertEqual(result, expected)
+            self.assertEqual(self.index.library_alias,
+                             new_index.library_alias)
+            self.index.library_alias = []
+
+    def test_table_cache(self):
+        db_dir = os.path.join(env.RESULTS_DIR, 'db_dir_table_cache')
+        if os.path.exists(db_dir):
+            shutil.rmtree(db_dir)
+        shutil.copytree(self.db_dir, db_dir)
+        index = Index(db_dir, self.index_dir)
+        index.create_index_for_table(db_dir, self.test_a_table_name)
+        common_variables = os.path.join(
+            db_dir,
+            rf_table_name(os.path.normcase(
+                os.path.join(self.suite_dir, 'common_variables.py')))
+        )
+        self.assertIn(common_variables, index.table_cache)
+        with open(common_variables) as f:
+            data = json.load(f)
+        data['variables'].append('${NEW_COMMON_VARIABLE}')
+        with open(common_variables, 'w') as f:
+            json.dump(data, f)
+        result = index.create_index_for_table(db_dir, self.test_a_table_name)
+        self.assertIn('${NEW_COMMON_VARIABLE}', result['variable'])
+
+    def test_table_cache_resolves_changed_libraries(self):
+        index = Index(self.db_dir, self.index_dir)
+        t_path = os.path.join(self.db_dir, self.resource_b_table_name)
+        table_data, _ = index.read_table_data(t_path)
+        self.assertIn(self.process_table_name, table_data.imports)
+        index.library_tables.add('Process', 'Process-from-map.json')
+        table_data, _ = index.read_table_data(t_path)
+        self.assertIn('Process-from-map.json', table_data.imports)
+        self.assertNotIn(self.process_table_name, table_data.imports)
+
     def test_get_variables(self):
         data = self.get_resource_b()
         var = ['${RESOURCE_B}']
@@ -208,10 +271,9 @@ class TestIndexing(unittest.TestCase):
 
     def test_index_consturctor(self):
         self.index.index_consturctor(self.resource_a_table_name)
-        files = os.listdir(self.index_dir)
+        files = list_tables(self.index_dir)
         self.assertEqual(len(files), 1)
-        with open(os.path.join(self.index_dir, files[0])) as f:
-            data = json.load(f)
+        data = read_index(os.path.join(self.index_dir, files[0]))
         self.assertIn('variable', data)
         self.assertIn('keyword', data)
         self.assertFalse(
@@ -221,6 +283,46 @@ class TestIndexing(unittest.TestCase):
             any(kw[0] == 'Resource A Keyword 1' for kw in data['keyword'])
         )
 
+    def test_symbol_tables(self):
+        self.index.index_consturctor(self.resource_a_table_name)
+        self.index.index_consturctor(self.test_a_table_name)
+        self.assertEqual(len(list_tables(self.index_dir)), 2)
+        builtin = lib_table_name('BuiltIn')
+        symbols = read_symbols(self.index_dir, builtin)
+        self.assertIn(
+            ['No Operation', [], 'nooperation'], symbols['keyword'])
+        builtin_symbols = os.path.join(self.index_dir, SYMBOLS_DIR, builtin)
+        mtime = os.stat(builtin_symbols).st_mtime
+        sleep(0.01)
+        self.index.index_consturctor(self.resource_a_table_name)
+        self.assertEqual(os.stat(builtin_symbols).st_mtime, mtime)
+        index_path = os.path.join(
+            self.index_dir, 'index-{0}'.format(self.test_a_table_name))
+        with open(index_path) as f:
+            self.assertEqual(
+                sorted(json.load(f).keys()), ['fingerprint', 'tables'])
+        data = read_index(index_path)
+        expected = Index(self.db_dir, self.index_dir).create_index_for_table(
+            self.db_dir, self.test_a_table_name)
+        self.assertEqual(
+            data['keyword'], [list(kw) for kw in expected['keyword']])
+        self.assertEqual(data['variable'], expected['variable'])
+        self.assertEqual(data['keyword_lookup'], expected['keyword_lookup'])
+
+    def test_fingerprint(self):
+        index_path = os.path.join(
+            self.index_dir, 'index-{0}'.format(self.test_a_table_name))
+        self.assertFalse(index_up_to_date(self.db_dir, index_path))
+        self.index.index_consturctor(self.test_a_table_name)
+        self.assertTrue(index_up_to_date(self.db_dir, index_path))
+        resource_a = os.path.join(
+            self.db_dir, self.resource_a_table_name)
+        t_stat = os.stat(resource_a)
+        os.utime(resource_a, (t_stat.st_atime, t_stat.st_mtime + 1))
+        self.assertFalse(index_up_to_date(self.db_dir, index_path))
+        self.index.index_consturctor(self.test_a_table_name)
+        self.assertTrue(index_up_to_date(self.db_dir, index_path))
+
     def test_get_kw_arguments(self):
         kw_args = [u'item', u'msg=None']
         result = self.index.get_kw_arguments(kw_args)
@@ -262,10 +364,9 @@ class TestIndexing(unittest.TestCase):
         )
         index = Index(db_dir_with_xml, self.index_dir, self.xml_libs)
         index.index_consturctor(self.resource_a_table_name)
-        files = os.listdir(self.index_dir)
+        files = list_tables(self.index_dir)
         self.assertEqual(len(files), 1)
-        with open(os.path.join(self.index_dir, files[0])) as f:
-            data = json.load(f)
+        data = read_index(os.path.join(self.index_dir, files[0]))
         self.assertTrue(
             any(kw[2] == 'SwingLibrary' for kw in data['keyword'])
         )
@@ -0,0 +1,79 @@
+import unittest
+import env
+import threading
+from job_scheduler import JobScheduler
+
+
+class TestJobScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = JobScheduler(delay=0.05)
+        self.done = []
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def job(self, name):
+        return lambda: self.done.append(name)
+
+    def test_jobs_run_in_order(self):
+        self.scheduler.schedule('scan', self.job('scan'))
+        self.scheduler.schedule('index', self.job('index'))
+        self.assertTrue(self.scheduler.wait(5))
+        self.assertEqual(self.done, ['scan', 'index'])
+        self.assertTrue(self.scheduler.is_idle())
+
+    def test_same_key_is_coalesced(self):
+        for name in ['first', 'second', 'third']:
+            self.scheduler.schedule('a.robot', self.job(name))
+        self.assertTrue(self.scheduler.wait(5))
+        self.assertEqual(self.done, ['third'])
+
+    def test_group_cancels_superseded_jobs(self):
+        first = self.scheduler.schedule('a.robot', self.job('a'), group='tab')
+        self.scheduler.schedule('save', self.job('save'))
+        self.scheduler.schedule('b.robot', self.job('b'), group='tab')
+        self.assertTrue(first.cancelled)
+        self.assertTrue(self.scheduler.wait(5))
+        self.assertEqual(self.done, ['save', 'b'])
+
+    def test_schedule_does_not_block(self):
+        release = threading.Event()
+        self.scheduler.schedule('slow', release.wait, delay=0)
+        self.scheduler.schedule('next', self.job('next'), delay=0)
+        self.assertFalse(self.scheduler.wait(0.1))
+        self.assertEqual(self.done, [])
+        release.set()
+        self.assertTrue(self.scheduler.wait(5))
+        self.assertEqual(self.done, ['next'])
+
+    def test_running_key_is_run_again(self):
+        release = threading.Event()
+
+        def slow():
+            release.wait()
+            self.done.append('slow')
+        self.scheduler.schedule('a.robot', slow, delay=0)
+        while self.scheduler.running is None:
+            release.wait(0.01)
+        self.scheduler.schedule('a.robot', self.job('again'), delay=0)
+        release.set()
+        self.assertTrue(self.scheduler.wait(5))
+        self.assertEqual(self.done, ['slow', 'again'])
+
+    def test_error_does_not_stop_scheduler(self):
+        self.scheduler.schedule('error', lambda: 1 / 0)
+        self.scheduler.schedule('ok', self.job('ok'))
+        self.assertTrue(self.scheduler.wait(5))
+        self.assertEqual(self.done, ['ok'])
+
+    def test_cancel_and_stop(self):
+        self.scheduler.schedule('a.robot', self.job('a'))
+        self.scheduler.cancel('a.robot')
+        self.scheduler.schedule('b.robot', self.job('b'), delay=10)
+        self.scheduler.stop()
+        self.assertTrue(self.scheduler.is_idle())
+        self.assertEqual(self.done, [])
+        self.scheduler.schedule('c.robot', self.job('c'))
+        self.assertTrue(self.scheduler.wait(5))
+        self.assertEqual(self.done, ['c'])
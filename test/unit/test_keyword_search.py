@@ -0,0 +1,111 @@
+import unittest
+import env
+import json
+import re
+from os import path
+from completions import get_kw_re_string
+from keyword_search import create_search_index, search_keywords
+from keyword_search import is_subsequence, get_object_rank
+from keyword_search import score_keyword, rank_keywords
+from keyword_search import OWN_FILE, RESOURCE, LIBRARY
+
+
+class TestKeywordSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(path.join(env.RESOURCES_DIR, 'current_view.json')) as f:
+            cls.keywords = json.load(f)['completion']
+        cls.search_index = create_search_index(cls.keywords)
+
+    def test_create_search_index(self):
+        keywords = [['Run Keyword', [], 'BuiltIn'], ['Log', [], 'BuiltIn']]
+        search_index = create_search_index(keywords)
+        self.assertEqual(search_index['r'], [0])
+        self.assertEqual(search_index['o'], [0, 1])
+        self.assertEqual(search_index[' '], [0])
+        self.assertNotIn('R', search_index)
+
+    def test_same_matches_as_regex(self):
+        prefixes = ['Run', 'RunKeY', 'BUI', 'rk', 'r k', 'shbe', 'zzz',
+                    'Get Table', '1', 'a_b', 'ekwwa', 'x', 'sle']
+        for prefix in prefixes:
+            pattern = re.compile(get_kw_re_string(prefix))
+            expected = [kw_id for kw_id, keyword in enumerate(self.keywords)
+                        if pattern.search(keyword[0])]
+            self.assertEqual(
+                search_keywords(self.keywords, self.search_index, prefix),
+                expected,
+                prefix)
+
+    def test_empty_prefix(self):
+        self.assertEqual(
+            search_keywords(self.keywords, self.search_index, ''),
+            list(range(len(self.keywords))))
+
+    def test_regex_prefix_is_not_searched(self):
+        for prefix in ['Run.', 'a*', 'Get[', u'\xe4']:
+            self.assertIsNone(
+                search_keywords(self.keywords, self.search_index, prefix))
+
+    def test_is_subsequence(self):
+        self.assertTrue(is_subsequence('rkw', 'run keyword'))
+        self.assertTrue(is_subsequence('', 'run keyword'))
+        self.assertFalse(is_subsequence('wkr', 'run keyword'))
+        self.assertFalse(is_subsequence('runn', 'run keyword'))
+
+    def test_get_object_rank(self):
+        own_table = 'test_a.robot-c6b0faa0427a2cf861a1acad630765ea.json'
+        self.assertEqual(get_object_rank(own_table, own_table), OWN_FILE)
+        self.assertEqual(
+            get_object_rank(
+                'common.robot-a7d2a5ba3d4b1f1bb0bbb1d3a7bad5f6.json',
+                own_table),
+            RESOURCE)
+        self.assertEqual(
+            get_object_rank(
+                'BuiltIn-ca8f2e8d70641ce17b9b304086c19657.json', own_table),
+            LIBRARY)
+        self.assertEqual(
+            get_object_rank(
+                'com.company.library.DoLibrary-'
+                'ca8f2e8d70641ce17b9b304086c19657.json', own_table),
+            LIBRARY)
+
+    def test_score_keyword(self):
+        self.assertGreater(
+            score_keyword('run', 'run keyword', LIBRARY),
+            score_keyword('run', 'return from keyword', LIBRARY))
+        self.assertGreater(
+            score_keyword('rk', 'run keyword', LIBRARY),
+            score_keyword('rk', 'wait until keyword succeeds', LIBRARY))
+        self.assertGreater(
+            score_keyword('rk', 'run keyword', LIBRARY),
+            score_keyword('rk', 'rmkeyword', LIBRARY))
+        self.assertGreater(
+            score_keyword('log', 'log', OWN_FILE),
+            score_keyword('log', 'log', RESOURCE))
+        self.assertGreater(
+            score_keyword('log', 'log', RESOURCE),
+            score_keyword('log', 'log', LIBRARY))
+
+    def test_rank_keywords(self):
+        keywords = [
+            ['Return From Keyword', [], 'BuiltIn'],
+            ['Run Keyword', [], 'BuiltIn'],
+            ['Run Keyword If', [], 'BuiltIn'],
+            ['Run My Keyword', [], 'resource_a'],
+            ['Run Keyword', [], 'test_a']
+        ]
+        object_ranks = {'BuiltIn': LIBRARY, 'resource_a': RESOURCE,
+                        'test_a': OWN_FILE}
+        kw_ids = search_keywords(
+            keywords, create_search_index(keywords), 'RunK')
+        self.assertEqual(
+            rank_keywords(keywords, kw_ids, 'RunK', object_ranks, 3),
+            [4, 3, 1])
+        self.assertEqual(
+            rank_keywords(keywords, kw_ids, 'RunK', object_ranks, 10),
+            [4, 3, 1, 2, 0])
+        self.assertEqual(
+            rank_keywords(keywords, kw_ids, 'RunK', {}, 2), [1, 2])
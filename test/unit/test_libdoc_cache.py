@@ -0,0 +1,85 @@
+import unittest
+import env
+import os
+import shutil
+from robot.libraries import BuiltIn
+from data_parser.data_parser import DataParser
+from data_parser.libdoc_cache import LibdocCache, library_sources
+from data_parser.libdoc_cache import LIBDOC_CACHE_DIR
+
+
+class TestLibdocCache(unittest.TestCase):
+
+    def setUp(self):
+        self.db_dir = os.path.join(env.RESULTS_DIR, 'libdoc_cache', 'db_dir')
+        if os.path.exists(self.db_dir):
+            shutil.rmtree(self.db_dir)
+        os.makedirs(self.db_dir)
+        self.library = os.path.join(
+            env.RESULTS_DIR, 'libdoc_cache', 'CacheLibrary.py')
+        self.write_library('def keyword_one():\n    pass\n')
+        self.cache = LibdocCache(self.db_dir)
+
+    def test_library_sources(self):
+        self.assertEqual(library_sources(self.library), [self.library])
+        builtin = library_sources('BuiltIn')
+        self.assertEqual(len(builtin), 1)
+        self.assertEqual(
+            os.path.splitext(builtin[0])[0],
+            os.path.splitext(BuiltIn.__file__)[0])
+        self.assertTrue(len(library_sources('robot.libraries')) > 1)
+        self.assertEqual(library_sources('NotExistingLibrary'), [])
+
+    def test_get_and_put(self):
+        self.assertIsNone(self.cache.get(self.library, None))
+        self.cache.put(self.library, None, {'keyword_one': {}})
+        self.assertEqual(
+            self.cache.get(self.library, None), {'keyword_one': {}})
+        self.assertEqual(
+            self.cache.get(self.library, []), {'keyword_one': {}})
+        self.assertIsNone(self.cache.get(self.library, ['arg']))
+        self.assertEqual(
+            len(os.listdir(os.path.join(self.db_dir, LIBDOC_CACHE_DIR))), 1)
+
+    def test_library_change(self):
+        self.cache.put(self.library, None, {'keyword_one': {}})
+        self.write_library('def keyword_two():\n    pass\n')
+        self.assertIsNone(self.cache.get(self.library, None))
+
+    def test_rf_version_change(self):
+        self.cache.put(self.library, None, {'keyword_one': {}})
+        self.cache.rf_version = '0.0.1'
+        self.assertIsNone(self.cache.get(self.library, None))
+
+    def test_library_without_source(self):
+        self.cache.put('NotExistingLibrary', None, {'keyword_one': {}})
+        self.assertIsNone(self.cache.get('NotExistingLibrary', None))
+
+    def test_data_parser_uses_cache(self):
+        parser = DataParser(self.cache)
+        data = parser.parse_library(self.library)
+        self.assertIn('keyword_one', data['keywords'])
+
+        def build(library):
+            raise AssertionError('Library should be read from the cache')
+        parser.libdoc.build = build
+        self.assertEqual(parser.parse_library(self.library), data)
+        builtin = DataParser(self.cache).parse_library('BuiltIn')
+        parser = DataParser(self.cache)
+        parser.libdoc.build = build
+        self.assertEqual(parser.parse_library('BuiltIn'), builtin)
+
+    def test_changed_library_is_imported_again(self):
+        data = DataParser(self.cache).parse_library(self.library)
+        self.assertEqual(list(data['keywords']), ['keyword_one'])
+        self.write_library('def keyword_two():\n    pass\n')
+        data = DataParser(self.cache).parse_library(self.library)
+        self.assertEqual(list(data['keywords']), ['keyword_two'])
+        self.assertEqual(
+            list(self.cache.get(self.library, None)), ['keyword_two'])
+
+    def write_library(self, content):
+        with open(self.library, 'w') as f:
+            f.write(content)
+        f_stat = os.stat(self.library)
+        os.utime(self.library, (f_stat.st_atime, f_stat.st_mtime + 10))
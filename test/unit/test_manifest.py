@@ -0,0 +1,165 @@
+import unittest
+import env
+import os
+import shutil
+from queue.manifest import ScanManifest, MANIFEST_NAME
+from queue.manifest import ImportGraph, LibraryTables, get_table_imports
+from parser_utils.file_formatter import rf_table_name, lib_table_name
+from parser_utils.sqlite_store import SQLiteStore
+
+
+class TestScanManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.db_dir = os.path.join(env.RESULTS_DIR, 'manifest', 'db_dir')
+        if os.path.exists(self.db_dir):
+            shutil.rmtree(self.db_dir)
+        os.makedirs(self.db_dir)
+        self.robot_file = os.path.join(
+            env.RESULTS_DIR, 'manifest', 'some.robot')
+        self.write_robot_file('*** Variables ***\n${A}    1\n')
+        self.manifest = ScanManifest(self.db_dir)
+
+    def test_unknown_file_is_changed(self):
+        self.assertFalse(self.manifest.is_unchanged(self.robot_file, None))
+
+    def test_added_file_is_unchanged(self):
+        self.add_robot_file()
+        self.assertTrue(self.manifest.is_unchanged(self.robot_file, None))
+        self.assertEqual(self.manifest.table(self.robot_file), 'table.json')
+
+    def test_args_change(self):
+        self.add_robot_file(args=['arg1'])
+        self.assertTrue(
+            self.manifest.is_unchanged(self.robot_file, ('arg1',)))
+        self.assertFalse(
+            self.manifest.is_unchanged(self.robot_file, ['arg2']))
+        self.assertFalse(self.manifest.is_unchanged(self.robot_file, None))
+
+    def test_content_change(self):
+        self.add_robot_file()
+        self.write_robot_file('*** Variables ***\n${B}    1\n')
+        self.assertFalse(self.manifest.is_unchanged(self.robot_file, None))
+
+    def test_mtime_change_without_content_change(self):
+        self.add_robot_file()
+        f_stat = os.stat(self.robot_file)
+        os.utime(self.robot_file, (f_stat.st_atime, f_stat.st_mtime + 10))
+        self.assertTrue(self.manifest.is_unchanged(self.robot_file, None))
+
+    def test_removed_file_is_changed(self):
+        self.add_robot_file()
+        os.remove(self.robot_file)
+        self.assertFalse(self.manifest.is_unchanged(self.robot_file, None))
+
+    def test_library_name_is_not_added(self):
+        fingerprint = self.manifest.fingerprint('BuiltIn')
+        self.assertIsNone(fingerprint)
+        self.manifest.add('BuiltIn', fingerprint, 'BuiltIn.json', [])
+        self.assertFalse(self.manifest.is_unchanged('BuiltIn', []))
+
+    def test_save_and_load(self):
+        self.add_robot_file()
+        self.manifest.save()
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.db_dir, MANIFEST_NAME)))
+        manifest = ScanManifest(self.db_dir)
+        manifest.load()
+        self.assertTrue(manifest.is_unchanged(self.robot_file, None))
+
+    def test_load_corrupted_manifest(self):
+        with open(os.path.join(self.db_dir, MANIFEST_NAME), 'w') as f:
+            f.write('{not json')
+        self.manifest.load()
+        self.assertEqual(self.manifest.files, {})
+
+    def test_retain(self):
+        self.add_robot_file()
+        self.manifest.retain(set(['other.json']))
+        self.assertFalse(self.manifest.is_unchanged(self.robot_file, None))
+
+    def add_robot_file(self, args=None):
+        fingerprint = self.manifest.fingerprint(self.robot_file)
+        self.manifest.add(self.robot_file, fingerprint, 'table.json', args)
+
+    def write_robot_file(self, content):
+        with open(self.robot_file, 'w') as f:
+            f.write(content)
+
+
+class TestImportGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.db_dir = os.path.join(env.RESULTS_DIR, 'manifest', 'db_dir')
+        if os.path.exists(self.db_dir):
+            shutil.rmtree(self.db_dir)
+        os.makedirs(self.db_dir)
+        self.graph = ImportGraph(self.db_dir)
+        self.graph.set_imports('suite_a', ['resource_a', 'common'])
+        self.graph.set_imports('suite_b', ['resource_b', 'common'])
+        self.graph.set_imports('resource_a', ['common', 'BuiltIn'])
+        self.graph.set_imports('common', ['Library'])
+
+    def test_dependents(self):
+        self.assertEqual(self.graph.dependents('suite_a'), [])
+        self.assertEqual(self.graph.dependents('resource_a'), ['suite_a'])
+        self.assertEqual(
+            self.graph.dependents('common'),
+            ['resource_a', 'suite_a', 'suite_b'])
+        self.assertEqual(
+            self.graph.dependents('Library'),
+            ['common', 'resource_a', 'suite_a', 'suite_b'])
+        self.assertEqual(self.graph.dependents('not_imported'), [])
+
+    def test_dependents_with_import_cycle(self):
+        self.graph.set_imports('common', ['resource_a'])
+        self.assertEqual(
+            self.graph.dependents('common'),
+            ['resource_a', 'suite_a', 'suite_b'])
+
+    def test_set_imports_updates_importers(self):
+        self.assertEqual(self.graph.importers('resource_b'), set(['suite_b']))
+        self.graph.set_imports('suite_b', ['common'])
+        self.assertEqual(self.graph.importers('resource_b'), set())
+        self.graph.retain(set(['suite_a', 'resource_a']))
+        self.assertEqual(self.graph.dependents('common'),
+                         ['resource_a', 'suite_a'])
+
+    def test_save_and_load(self):
+        self.graph.save()
+        graph = ImportGraph(self.db_dir)
+        graph.load()
+        self.assertEqual(graph.imports, self.graph.imports)
+        self.assertEqual(graph.dependents('resource_b'), ['suite_b'])
+
+    def test_get_table_imports(self):
+        library_tables = LibraryTables(self.db_dir)
+        library_tables.add('Mapped', 'Mapped-table.json')
+        with open(os.path.join(self.db_dir, lib_table_name('Found')), 'w'):
+            pass
+        data = {
+            'libraries': [
+                {'library_name': 'Mapped', 'library_path': None},
+                {'library_name': 'Found.py',
+                 'library_path': '/path/to/Found.py'},
+                {'library_name': 'NotFound', 'library_path': None}
+            ],
+            'variable_files': [{'/path/vars.py': {}}],
+            'resources': ['/path/resource.robot']
+        }
+        self.assertEqual(
+            get_table_imports(data, library_tables),
+            ['Mapped-table.json',
+             lib_table_name('Found'),
+             rf_table_name('/path/vars.py'),
+             rf_table_name('/path/resource.robot')])
+
+    def test_library_table_found_from_store(self):
+        library_tables = LibraryTables(self.db_dir)
+        self.assertIsNone(library_tables.find('Stored'))
+        store = SQLiteStore(self.db_dir)
+        store.put(lib_table_name('Stored'), {'library_module': 'Stored'})
+        store.close()
+        self.assertEqual(
+            library_tables.find('/path/to/Stored.py'),
+            lib_table_name('Stored'))
@@ -0,0 +1,78 @@
+import unittest
+import env
+import json
+import os
+import shutil
+from metrics import Metrics, Histogram, get_metrics, METRICS_FILE_NAME
+from current_view import get_view_data
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics_dir = os.path.join(env.RESULTS_DIR, 'metrics')
+        if os.path.exists(self.metrics_dir):
+            shutil.rmtree(self.metrics_dir)
+        self.snapshot_path = os.path.join(self.metrics_dir, METRICS_FILE_NAME)
+        self.metrics = Metrics()
+
+    def test_histogram(self):
+        histogram = Histogram(max_samples=100)
+        self.assertIsNone(histogram.percentile(50))
+        for value in range(1, 201):
+            histogram.add(float(value))
+        self.assertEqual(histogram.count, 200)
+        self.assertEqual(histogram.max, 200.0)
+        self.assertEqual(len(histogram.samples), 100)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot['p50'], 151.0)
+        self.assertEqual(snapshot['p95'], 195.0)
+        self.assertEqual(snapshot['p99'], 199.0)
+        self.assertEqual(snapshot['mean'], 100.5)
+
+    def test_timer_and_cache(self):
+        with self.metrics.timer('completions'):
+            pass
+        self.metrics.record('completions', 10.0)
+        self.metrics.hit('view_data')
+        self.metrics.hit('view_data')
+        self.metrics.hit('view_data', False)
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['latency_ms']['completions']['count'], 2)
+        self.assertEqual(snapshot['latency_ms']['completions']['max'], 10.0)
+        self.assertEqual(
+            snapshot['cache']['view_data'],
+            {'hits': 2, 'misses': 1, 'hit_rate': 2 / 3.0})
+        report = self.metrics.report()
+        self.assertTrue(report[0].startswith('Latency (ms)'))
+        self.assertTrue(report[1].startswith('completions'))
+        self.assertTrue(report[-1].startswith('view_data'))
+        self.assertTrue(report[-1].endswith('67%'))
+
+    def test_snapshot_interval(self):
+        self.metrics.record('completions', 1.0)
+        self.metrics.configure(self.snapshot_path, 0)
+        self.metrics.record('completions', 1.0)
+        self.assertFalse(os.path.exists(self.snapshot_path))
+        self.metrics.configure(self.snapshot_path, 60)
+        self.metrics.saved -= 61
+        self.metrics.record('completions', 1.0)
+        with open(self.snapshot_path) as f:
+            snapshot = json.load(f)
+        self.assertEqual(snapshot['latency_ms']['completions']['count'], 3)
+        os.remove(self.snapshot_path)
+        self.metrics.record('completions', 1.0)
+        self.assertFalse(os.path.exists(self.snapshot_path))
+
+    def test_view_data_cache_hits(self):
+        os.makedirs(self.metrics_dir)
+        view_path = os.path.join(self.metrics_dir, 'current_view.json')
+        with open(view_path, 'w') as f:
+            json.dump({'variable': []}, f)
+        get_metrics().reset()
+        get_view_data(view_path)
+        get_view_data(view_path)
+        self.assertEqual(
+            get_metrics().snapshot()['cache']['view_data']['hits'], 1)
+        self.assertEqual(
+            get_metrics().snapshot()['cache']['view_data']['misses'], 1)
@@ -0,0 +1,93 @@
+import unittest
+import env
+import os
+import pstats
+import shutil
+from index_runner import index_all
+from queue.scanner import Scanner
+from index.index import Index
+from parser_utils.profiler import Profiler, NULL_TIMER, DISCOVERY
+from parser_utils.profiler import RF_PARSE, LIBDOC, JSON_WRITE
+from parser_utils.profiler import INDEX_RESOLVE, INDEX_WRITE
+from parser_utils.file_formatter import rf_table_name
+from parser_utils.util import normalise_path
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.base = os.path.join(env.RESULTS_DIR, 'profiler')
+        if os.path.exists(self.base):
+            shutil.rmtree(self.base)
+        self.workspace = os.path.join(env.TEST_DATA_DIR, 'suite_tree')
+        self.db_dir = os.path.join(self.base, 'db_dir')
+        self.index_dir = os.path.join(self.base, 'index_dir')
+        self.test_a = normalise_path(
+            os.path.join(self.workspace, 'test_a.robot'))
+
+    def test_disabled_profiler(self):
+        profiler = Profiler()
+        self.assertIs(profiler.phase(RF_PARSE, 'file'), NULL_TIMER)
+        with profiler.phase(RF_PARSE, 'file'):
+            pass
+        files = ['a', 'b']
+        self.assertIs(profiler.iterate(DISCOVERY, files), files)
+        self.assertEqual(profiler.phases, {})
+        self.assertEqual(profiler.items, {})
+
+    def test_phases_and_items(self):
+        profiler = Profiler(enabled=True)
+        for item in ['a', 'b', 'a']:
+            with profiler.phase(RF_PARSE, item):
+                pass
+        self.assertEqual(list(profiler.iterate(DISCOVERY, 'ab')), ['a', 'b'])
+        self.assertEqual(profiler.phases[RF_PARSE][0], 3)
+        self.assertEqual(profiler.phases[DISCOVERY][0], 3)
+        self.assertEqual(
+            sorted(profiler.items), [(RF_PARSE, 'a'), (RF_PARSE, 'b')])
+        summary = profiler.summary(1)
+        self.assertEqual(summary[0], 'Profile summary:')
+        self.assertIn('Slowest in rf_parse:', summary)
+        self.assertEqual(summary[-2], 'Slowest in rf_parse:')
+
+    def test_stats_and_merge(self):
+        worker = Profiler(enabled=True)
+        worker.add(LIBDOC, 1.0, 'BuiltIn')
+        worker.add(LIBDOC, 0.5, 'Collections')
+        profiler = Profiler(enabled=True)
+        profiler.add(LIBDOC, 1.0, 'BuiltIn')
+        profiler.merge(worker.stats())
+        profiler.merge(None)
+        self.assertEqual(worker.phases, {})
+        self.assertEqual(profiler.phases[LIBDOC], (3, 2.5))
+        self.assertEqual(profiler.items[(LIBDOC, 'BuiltIn')], 2.0)
+
+    def test_scan_and_index_phases(self):
+        for processes in [1, 2]:
+            profiler = Profiler(enabled=True)
+            scanner = Scanner(processes=processes, profiler=profiler)
+            scanner.scan(self.workspace, 'robot', self.db_dir)
+            for phase in [DISCOVERY, RF_PARSE, LIBDOC, JSON_WRITE]:
+                self.assertIn(phase, profiler.phases)
+            self.assertIn((RF_PARSE, self.test_a), profiler.items)
+            self.assertIn((LIBDOC, 'BuiltIn'), profiler.items)
+            shutil.rmtree(self.db_dir)
+        Scanner().scan(self.workspace, 'robot', self.db_dir)
+        index_all(self.db_dir, self.index_dir)
+        profiler = Profiler(enabled=True)
+        index = Index(self.db_dir, self.index_dir, profiler=profiler)
+        table_name = rf_table_name(self.test_a)
+        index.index_consturctor(table_name)
+        self.assertIn((INDEX_RESOLVE, table_name), profiler.items)
+        self.assertIn((INDEX_WRITE, table_name), profiler.items)
+
+    def test_profile_dump(self):
+        profile_dump = os.path.join(self.base, 'scan.prof')
+        profiler = Profiler(profile_dump=profile_dump)
+        self.assertTrue(profiler.enabled)
+        profiler.start()
+        Scanner(profiler=profiler).scan(self.workspace, 'robot', self.db_dir)
+        profiler.finish()
+        self.assertTrue(os.path.isfile(profile_dump))
+        self.assertTrue(pstats.Stats(profile_dump).total_calls > 0)
+        self.assertEqual(profiler.phases, {})
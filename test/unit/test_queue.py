@@ -136,6 +136,40 @@ class TestLibraryParsingQueue(unittest.TestCase):
                 self.assertEqual(self.queue.queue[key], status)
                 self.assertEqual(index, 5)
 
+    def test_contains_and_len(self):
+        self.add_builtin()
+        self.add_test_data()
+        self.assertEqual(len(self.queue), 2)
+        self.assertIn('BuiltIn', self.queue)
+        self.assertNotIn('resource.robot', self.queue)
+        self.queue.get()
+        self.assertIn('some.robot', self.queue)
+        self.assertEqual(len(self.queue), 2)
+
+    def test_get_when_all_items_are_taken(self):
+        self.add_builtin()
+        self.add_test_data()
+        first = self.queue.get()
+        second = self.queue.get()
+        self.assertEqual(first[0], 'some.robot')
+        self.assertEqual(second[0], 'BuiltIn')
+        self.queue.set('some.robot')
+        self.queue.set('BuiltIn')
+        data = self.queue.get()
+        self.assertEqual(data[0], 'some.robot')
+        self.assertTrue(data[1]['scanned'])
+        self.assertEqual(list(self.queue.queue), ['BuiltIn', 'some.robot'])
+
+    def test_force_set_item_not_yet_taken(self):
+        self.add_builtin()
+        self.add_test_data()
+        self.queue.force_set('BuiltIn')
+        data = self.queue.get()
+        self.assertEqual(data[0], 'some.robot')
+        self.queue.set('some.robot')
+        self.assertEqual(list(self.queue.queue), ['BuiltIn', 'some.robot'])
+        self.assertTrue(self.queue.get()[1]['scanned'])
+
     def add_builtin(self):
         tmp = OrderedDict({})
         tmp['BuiltIn'] = self.join_dict(
@@ -6,6 +6,7 @@ import re
 from time import sleep
 from queue.scanner import Scanner
 from test_runner_for_scanner import run_process
+from parser_utils.util import list_tables
 
 
 class TestRunner(unittest.TestCase):
@@ -52,11 +53,11 @@ class TestRunner(unittest.TestCase):
         log_file = run_process(p_args)
         lines = self.clean_info_messages(log_file)
         self.assertFalse(lines)
-        files = os.listdir(self.index_path)
+        files = list_tables(self.index_path)
         self.assertEqual(len(files), 12)
 
     def test_index_single(self):
-        db_files = os.listdir(self.db_dir)
+        db_files = list_tables(self.db_dir)
         p_args = [
             'python',
             self.runner,
@@ -68,15 +69,15 @@ class TestRunner(unittest.TestCase):
             '--index_path',
             self.index_path
         ]
-        self.assertEqual(len(os.listdir(self.index_path)), 0)
+        self.assertEqual(len(list_tables(self.index_path)), 0)
         log_file = run_process(p_args)
         lines = self.clean_info_messages(log_file)
         self.assertFalse(lines)
-        self.assertEqual(len(os.listdir(self.index_path)), 1)
+        self.assertEqual(len(list_tables(self.index_path)), 1)
         log_file = run_process(p_args)
         lines = self.clean_info_messages(log_file)
         self.assertFalse(lines)
-        self.assertEqual(len(os.listdir(self.index_path)), 1)
+        self.assertEqual(len(list_tables(self.index_path)), 1)
         p_args = [
             'python',
             self.runner,
@@ -91,7 +92,28 @@ class TestRunner(unittest.TestCase):
         log_file = run_process(p_args)
         lines = self.clean_info_messages(log_file)
         self.assertFalse(lines)
-        self.assertEqual(len(os.listdir(self.index_path)), 2)
+        self.assertEqual(len(list_tables(self.index_path)), 2)
+
+    def test_index_dependents(self):
+        common = [t for t in list_tables(self.db_dir)
+                  if t.startswith('common.robot')][0]
+        p_args = [
+            'python',
+            self.runner,
+            'dependents',
+            '--db_path',
+            self.db_dir,
+            '--db_table',
+            common,
+            '--index_path',
+            self.index_path
+        ]
+        log_file = run_process(p_args)
+        lines = self.clean_info_messages(log_file)
+        self.assertFalse(lines)
+        files = list_tables(self.index_path)
+        self.assertEqual(len(files), 3)
+        self.assertIn('index-{0}'.format(common), files)
 
     def clean_info_messages(self, log_file):
         f = open(log_file)
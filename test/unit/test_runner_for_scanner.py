@@ -4,6 +4,7 @@ import os
 import shutil
 import subprocess
 from time import sleep
+from parser_utils.util import list_tables
 
 
 def run_process(p_args):
@@ -50,7 +51,24 @@ class TestRunnerForScanner(unittest.TestCase):
             '--db_path',
             self.db_dir]
         run_process(p_args)
-        files = os.listdir(self.db_dir)
+        files = list_tables(self.db_dir)
+        self.assertEqual(len(files), 12)
+
+    def test_scan_all_runner_in_processes(self):
+        p_args = [
+            'python',
+            self.runner,
+            'all',
+            '--workspace',
+            self.workspace,
+            '--extension',
+            'robot',
+            '--db_path',
+            self.db_dir,
+            '--processes',
+            '2']
+        run_process(p_args)
+        files = list_tables(self.db_dir)
         self.assertEqual(len(files), 12)
 
     def test_scan_errors(self):
@@ -88,7 +106,7 @@ class TestRunnerForScanner(unittest.TestCase):
             '--db_path',
             self.db_dir]
         run_process(p_args)
-        files = os.listdir(self.db_dir)
+        files = list_tables(self.db_dir)
         self.assertEqual(len(files), 1)
 
     @property
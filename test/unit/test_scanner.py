@@ -6,6 +6,9 @@ import hashlib
 from time import sleep
 import json
 from queue.scanner import Scanner
+from queue.manifest import LibraryTables, ImportGraph
+from parser_utils.file_formatter import rf_table_name
+from parser_utils.util import list_tables
 
 
 class TestScanner(unittest.TestCase):
@@ -122,7 +125,7 @@ class TestScanner(unittest.TestCase):
             'robot',
             self.db_dir
             )
-        self.assertEqual(len(os.listdir(self.db_dir)), 8)
+        self.assertEqual(len(list_tables(self.db_dir)), 8)
 
     def test_parse_all_rf(self):
         test_suite = os.path.join(
@@ -217,7 +220,7 @@ class TestScanner(unittest.TestCase):
     def test_parse_suite_structure(self):
         workspace = self.suite_folder()
         self.scanner.scan(workspace, 'robot', self.db_dir)
-        files = os.listdir(self.db_dir)
+        files = list_tables(self.db_dir)
         builtin = '{0}-{1}.json'.format(
             'BuiltIn',
             hashlib.md5('BuiltIn').hexdigest())
@@ -255,7 +258,7 @@ class TestScanner(unittest.TestCase):
             workspace,
             'robot',
             self.db_dir)
-        files = os.listdir(self.db_dir)
+        files = list_tables(self.db_dir)
         builtin = '{0}-{1}.json'.format(
             'BuiltIn',
             hashlib.md5('BuiltIn').hexdigest())
@@ -267,16 +270,16 @@ class TestScanner(unittest.TestCase):
         self.assertEqual(len(files), 12)
 
     def test_single_file_scan(self):
-        self.assertEqual(len(os.listdir(self.db_dir)), 0)
+        self.assertEqual(len(list_tables(self.db_dir)), 0)
         self.scanner.scan_single_file(self.real_suite_robot_path, self.db_dir)
-        self.assertEqual(len(os.listdir(self.db_dir)), 1)
+        self.assertEqual(len(list_tables(self.db_dir)), 1)
         self.scanner.scan_single_file(self.real_suite_robot_path, self.db_dir)
-        self.assertEqual(len(os.listdir(self.db_dir)), 1)
+        self.assertEqual(len(list_tables(self.db_dir)), 1)
         self.scanner.scan_single_file(
             self.real_suite_resource_robot_path,
             self.db_dir
         )
-        self.assertEqual(len(os.listdir(self.db_dir)), 2)
+        self.assertEqual(len(list_tables(self.db_dir)), 2)
 
     def test_add_xml_library(self):
         self.assertEqual(len(self.scanner.queue.queue), 0)
@@ -290,7 +293,150 @@ class TestScanner(unittest.TestCase):
             'robot',
             self.db_dir
         )
-        self.assertEqual(len(os.listdir(self.db_dir)), 10)
+        self.assertEqual(len(list_tables(self.db_dir)), 10)
+
+    def test_rescan_parses_only_changed_files(self):
+        workspace = self.copy_suite_tree()
+        self.scanner.scan(workspace, 'robot', self.db_dir)
+        tables = sorted(list_tables(self.db_dir))
+        parsed = self.record_parsed_items()
+        self.scanner.scan(workspace, 'robot', self.db_dir)
+        self.assertEqual(sorted(list_tables(self.db_dir)), tables)
+        self.assertTrue(parsed)
+        for item in parsed:
+            self.assertFalse(os.path.isfile(item))
+        test_b = os.path.join(workspace, 'test_b.robot')
+        with open(test_b, 'a') as f:
+            f.write('\n*** Variables ***\n${TEST_B_NEW}    1\n')
+        del parsed[:]
+        self.scanner.scan(workspace, 'robot', self.db_dir)
+        self.assertIn(os.path.normcase(test_b), parsed)
+        f_name = self.f_name({'file_path': os.path.normcase(test_b)},
+                             self.db_dir)
+        with open(f_name) as f:
+            self.assertIn('${TEST_B_NEW}', json.load(f)['variables'])
+
+    def test_rescan_removes_tables_of_deleted_files(self):
+        workspace = self.copy_suite_tree()
+        self.scanner.scan(workspace, 'robot', self.db_dir)
+        test_b = os.path.join(workspace, 'test_b.robot')
+        f_name = self.f_name({'file_path': os.path.normcase(test_b)},
+                             self.db_dir)
+        self.assertTrue(os.path.isfile(f_name))
+        os.remove(test_b)
+        self.scanner.scan(workspace, 'robot', self.db_dir)
+        self.assertFalse(os.path.isfile(f_name))
+        self.assertEqual(len(list_tables(self.db_dir)), 11)
+
+    def test_rescan_recreates_removed_table(self):
+        workspace = self.copy_suite_tree()
+        self.scanner.scan(workspace, 'robot', self.db_dir)
+        tables = sorted(list_tables(self.db_dir))
+        test_a = os.path.join(workspace, 'test_a.robot')
+        f_name = self.f_name({'file_path': os.path.normcase(test_a)},
+                             self.db_dir)
+        os.remove(f_name)
+        self.scanner.scan(workspace, 'robot', self.db_dir)
+        self.assertEqual(sorted(list_tables(self.db_dir)), tables)
+
+    def test_scan_in_processes(self):
+        workspace = os.path.join(env.TEST_DATA_DIR, 'suite_tree')
+        self.scanner.scan(workspace, 'robot', self.db_dir)
+        expected = {}
+        for table in list_tables(self.db_dir):
+            with open(os.path.join(self.db_dir, table)) as f:
+                expected[table] = json.load(f)
+        shutil.rmtree(self.db_dir)
+        scanner = Scanner(processes=2)
+        scanner.scan(workspace, 'robot', self.db_dir)
+        tables = list_tables(self.db_dir)
+        self.assertEqual(sorted(tables), sorted(expected))
+        for table in tables:
+            with open(os.path.join(self.db_dir, table)) as f:
+                self.assertEqual(json.load(f), expected[table])
+        for status in scanner.queue.queue.values():
+            self.assertTrue(status['scanned'])
+
+    def test_rescan_in_processes(self):
+        workspace = self.copy_suite_tree()
+        scanner = Scanner(self.xml_libs, processes=2)
+        scanner.scan(workspace, 'robot', self.db_dir)
+        tables = sorted(list_tables(self.db_dir))
+        self.assertEqual(len(tables), 14)
+        os.remove(os.path.join(workspace, 'test_b.robot'))
+        scanner.scan(workspace, 'robot', self.db_dir)
+        self.assertEqual(len(list_tables(self.db_dir)), 13)
+
+    def test_library_tables(self):
+        workspace = os.path.join(env.TEST_DATA_DIR, 'suite_tree')
+        for scanner in [self.scanner, Scanner(processes=2)]:
+            scanner.scan(workspace, 'robot', self.db_dir)
+            library_tables = LibraryTables(self.db_dir)
+            library_tables.load()
+            self.assertEqual(
+                library_tables.get('OperatingSystem'),
+                'OperatingSystem-{0}.json'.format(
+                    hashlib.md5('OperatingSystem').hexdigest()))
+            lib_no_class = os.path.normcase(
+                os.path.join(workspace, 'LibNoClass.py'))
+            self.assertEqual(
+                library_tables.get(lib_no_class),
+                'LibNoClass-{0}.json'.format(
+                    hashlib.md5('LibNoClass').hexdigest()))
+            self.assertIsNone(library_tables.get('common.robot'))
+            for table in library_tables.libraries.values():
+                self.assertTrue(
+                    os.path.isfile(os.path.join(self.db_dir, table)))
+
+    def test_import_graph(self):
+        workspace = self.copy_suite_tree()
+        self.scanner.scan(workspace, 'robot', self.db_dir)
+        tables = dict(
+            (name, rf_table_name(os.path.normcase(
+                os.path.join(workspace, name))))
+            for name in ['test_a.robot', 'test_b.robot', 'common.robot',
+                         'resource_a.robot']
+        )
+        graph = ImportGraph(self.db_dir)
+        graph.load()
+        self.assertEqual(
+            graph.dependents(tables['common.robot']),
+            sorted([tables['test_a.robot'], tables['test_b.robot']]))
+        self.assertEqual(
+            graph.dependents(tables['resource_a.robot']),
+            [tables['test_a.robot']])
+        lib_no_class = [t for t in list_tables(self.db_dir)
+                        if t.startswith('LibNoClass')][0]
+        self.assertEqual(
+            graph.dependents(lib_no_class),
+            sorted([tables['resource_a.robot'], tables['test_a.robot']]))
+        test_b = os.path.join(workspace, 'test_b.robot')
+        with open(test_b, 'w') as f:
+            f.write('*** Test Cases ***\nTest B\n    No Operation\n')
+        self.scanner.scan_single_file(
+            os.path.normcase(test_b), self.db_dir)
+        graph.load()
+        self.assertEqual(
+            graph.dependents(tables['common.robot']),
+            [tables['test_a.robot']])
+
+    def copy_suite_tree(self):
+        workspace = os.path.join(env.RESULTS_DIR, 'scanner', 'workspace')
+        if os.path.exists(workspace):
+            shutil.rmtree(workspace)
+        shutil.copytree(
+            os.path.join(env.TEST_DATA_DIR, 'suite_tree'), workspace)
+        return workspace
+
+    def record_parsed_items(self):
+        parsed = []
+        parse_all = self.scanner.parse_all
+
+        def recorder(item):
+            parsed.append(item[0])
+            return parse_all(item)
+        self.scanner.parse_all = recorder
+        return parsed
 
     @property
     def real_suite_robot_path(self):
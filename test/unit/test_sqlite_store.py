@@ -0,0 +1,226 @@
+import unittest
+import env
+import json
+import os
+import shutil
+from index_runner import index_all
+from queue.scanner import Scanner
+from parser_utils.file_formatter import rf_table_name, lib_table_name
+from parser_utils.util import list_tables, get_index_name
+from parser_utils.sqlite_store import SQLiteStore, SQLITE_DB_NAME
+from parser_utils.sqlite_store import get_store, read_table, table_exists
+from parser_utils.sqlite_store import table_key, SQLITE_BACKEND
+from parser_utils.sqlite_store import find_keywords
+from get_documentation import GetKeywordDocumentation
+from get_keyword import GetKeyword
+
+
+class TestSQLiteStore(unittest.TestCase):
+
+    def setUp(self):
+        self.db_dir = os.path.join(env.RESULTS_DIR, 'sqlite_store', 'db_dir')
+        if os.path.exists(self.db_dir):
+            shutil.rmtree(self.db_dir)
+        os.makedirs(self.db_dir)
+        self.store = SQLiteStore(self.db_dir)
+        self.table_name = lib_table_name('MyLib')
+        self.data = {
+            'library_module': 'MyLib',
+            'keywords': {
+                'run_my_keyword': {'keyword_name': 'Run My Keyword'}
+            },
+            'variables': ['${MY_VAR}'],
+            'libraries': [{'library_name': 'OperatingSystem'}],
+            'resources': ['/path/to/common.robot']
+        }
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_put_and_get(self):
+        self.assertIsNone(get_store(self.db_dir))
+        self.assertIsNone(self.store.get(self.table_name))
+        self.store.put(self.table_name, self.data)
+        self.assertIsNotNone(get_store(self.db_dir))
+        self.assertEqual(self.store.get(self.table_name), self.data)
+        self.assertEqual(self.store.names(), [self.table_name])
+        self.store.remove(self.table_name)
+        self.assertEqual(self.store.names(), [])
+
+    def test_revision(self):
+        self.assertIsNone(self.store.revision(self.table_name))
+        self.store.put(self.table_name, self.data)
+        revision = self.store.revision(self.table_name)
+        self.store.put(self.table_name, self.data)
+        self.assertGreater(self.store.revision(self.table_name), revision)
+        t_path = os.path.join(self.db_dir, self.table_name)
+        self.assertEqual(
+            table_key(t_path),
+            (SQLITE_BACKEND, self.store.revision(self.table_name)))
+        self.assertIsNone(table_key(os.path.join(self.db_dir, 'a.json')))
+
+    def test_find_keywords(self):
+        self.assertIsNone(self.store.find_keywords(self.table_name, 'Log'))
+        self.store.put(self.table_name, self.data)
+        index = {
+            'keyword': [
+                ['Run My Keyword', [], 'MyAlias', self.table_name],
+                ['Log', ['message'], 'BuiltIn', lib_table_name('BuiltIn')]
+            ],
+            'variable': []
+        }
+        self.store.put('index-suite.robot', index)
+        self.assertEqual(
+            self.store.find_keywords(self.table_name, 'run_my keyword'),
+            [('Run My Keyword', 'MyLib', self.table_name,
+              {'keyword_name': 'Run My Keyword'})])
+        self.assertEqual(
+            self.store.find_keywords('index-suite.robot', 'LOG'),
+            [('Log', 'BuiltIn', lib_table_name('BuiltIn'), None)])
+        self.assertEqual(self.store.find_keywords(self.table_name, 'Log'), [])
+        self.assertIsNone(
+            self.store.find_keywords('index-other.robot', 'Log'))
+        self.store.remove(self.table_name)
+        self.assertIsNone(
+            self.store.find_keywords(self.table_name, 'Run My Keyword'))
+        self.assertEqual(
+            find_keywords(
+                os.path.join(self.db_dir, 'index-suite.robot'), 'log'),
+            [('Log', 'BuiltIn', lib_table_name('BuiltIn'), None)])
+
+    def test_records_are_added_to_old_store(self):
+        self.store.put(self.table_name, self.data)
+        connection = self.store.connection
+        with connection:
+            connection.execute('DELETE FROM keywords')
+            connection.execute('PRAGMA user_version = 0')
+        self.store.close()
+        self.assertIsNone(
+            self.store.find_keywords(self.table_name, 'Run My Keyword'))
+        self.store.put('index-suite.robot', {'keyword': [], 'variable': []})
+        self.assertEqual(
+            len(self.store.find_keywords(self.table_name, 'Run My Keyword')),
+            1)
+
+    def test_store_is_shared_until_replaced(self):
+        self.assertIsNone(get_store(self.db_dir))
+        self.store.put(self.table_name, self.data)
+        store = get_store(self.db_dir)
+        self.assertIs(get_store(self.db_dir), store)
+        self.assertEqual(store.get(self.table_name), self.data)
+        self.store.put(self.table_name, {'library_module': 'Updated'})
+        self.assertEqual(
+            store.get(self.table_name), {'library_module': 'Updated'})
+        self.store.close()
+        store.close()
+        replaced = os.path.join(self.db_dir, 'replaced')
+        os.makedirs(replaced)
+        new_store = SQLiteStore(replaced)
+        new_store.put(self.table_name, self.data)
+        new_store.close()
+        os.rename(os.path.join(replaced, SQLITE_DB_NAME),
+                  os.path.join(self.db_dir, SQLITE_DB_NAME))
+        new_store = get_store(self.db_dir)
+        self.assertIsNot(new_store, store)
+        self.assertEqual(new_store.get(self.table_name), self.data)
+        os.remove(os.path.join(self.db_dir, SQLITE_DB_NAME))
+        self.assertIsNone(get_store(self.db_dir))
+
+    def test_read_does_not_create_store(self):
+        self.assertIsNone(self.store.get(self.table_name))
+        self.assertEqual(self.store.names(), [])
+        self.assertFalse(
+            os.path.exists(os.path.join(self.db_dir, SQLITE_DB_NAME)))
+
+    def test_read_table(self):
+        t_path = os.path.join(self.db_dir, self.table_name)
+        self.assertFalse(table_exists(t_path))
+        self.assertRaises(IOError, read_table, t_path)
+        self.store.put(self.table_name, self.data)
+        self.assertTrue(table_exists(t_path))
+        self.assertEqual(read_table(t_path), self.data)
+        self.assertEqual(list_tables(self.db_dir), [self.table_name])
+        with open(t_path, 'w') as f:
+            json.dump({'library_module': 'FromFile'}, f)
+        self.assertEqual(read_table(t_path), {'library_module': 'FromFile'})
+        self.assertEqual(list_tables(self.db_dir), [self.table_name])
+
+
+class TestSQLiteBackend(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        db_base = os.path.join(env.RESULTS_DIR, 'sqlite_backend')
+        cls.db_dir = os.path.join(db_base, 'db_dir')
+        cls.index_dir = os.path.join(db_base, 'index_dir')
+        cls.workspace = os.path.join(env.TEST_DATA_DIR, 'suite_tree')
+        if os.path.exists(db_base):
+            shutil.rmtree(db_base)
+        os.makedirs(cls.db_dir)
+        scanner = Scanner(backend=SQLITE_BACKEND)
+        scanner.scan(cls.workspace, 'robot', cls.db_dir)
+        scanner.close_store()
+        index_all(cls.db_dir, cls.index_dir)
+
+    def test_tables_in_store(self):
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.db_dir, SQLITE_DB_NAME)))
+        tables = list_tables(self.db_dir)
+        self.assertIn(lib_table_name('BuiltIn'), tables)
+        self.assertFalse(
+            [f for f in os.listdir(self.db_dir) if f in tables])
+        self.assertEqual(
+            [f for f in os.listdir(self.index_dir)
+             if not f.startswith(SQLITE_DB_NAME)], [])
+        index_store = get_store(self.index_dir)
+        self.assertEqual(len(index_store.names()), len(tables))
+
+    def test_index_from_store(self):
+        test_a = os.path.normcase(os.path.join(self.workspace, 'test_a.robot'))
+        index_table = get_index_name(rf_table_name(test_a))
+        index = read_table(os.path.join(self.index_dir, index_table))
+        self.assertTrue(
+            any(kw[0] == 'Test A Keyword' for kw in index['keyword']))
+        self.assertTrue(
+            any(kw[0] == 'Resource A Keyword 1' for kw in index['keyword']))
+        get_doc = GetKeywordDocumentation(self.db_dir, self.index_dir, test_a)
+        self.assertEqual(
+            get_doc.return_documentation('BuiltIn', 'No Operation'),
+            'Does absolutely nothing.')
+
+    def test_keywords_are_read_from_records(self):
+        test_a = os.path.normcase(
+            os.path.join(self.workspace, 'test_a.robot'))
+        index_path = os.path.join(
+            self.index_dir, get_index_name(rf_table_name(test_a)))
+        builtin = lib_table_name('BuiltIn')
+        self.assertEqual(
+            find_keywords(index_path, 'no_operation'),
+            [('No Operation', 'BuiltIn', builtin, None)])
+        records = find_keywords(
+            os.path.join(self.db_dir, builtin), 'No Operation')
+        self.assertEqual(records[0][:3], ('No Operation', 'BuiltIn', builtin))
+        get_doc = GetKeywordDocumentation(self.db_dir, self.index_dir, test_a)
+        self.assertEqual(
+            get_doc.get_keyword_location(None, 'NO OPERATION'),
+            ['BuiltIn', builtin, 'No Operation'])
+        get_kw = GetKeyword(self.db_dir, self.index_dir, test_a, 'robot')
+        regex, file_path = get_kw.return_file_and_patter(
+            'LibNoClass', 'Library Keyword 1')
+        self.assertEqual(
+            file_path,
+            os.path.normcase(os.path.join(self.workspace, 'LibNoClass.py')))
+
+    def test_json_backend_removes_store(self):
+        db_dir = os.path.join(env.RESULTS_DIR, 'sqlite_backend', 'switch')
+        shutil.copytree(self.db_dir, db_dir)
+        tables = list_tables(db_dir)
+        Scanner().scan(self.workspace, 'robot', db_dir)
+        self.assertFalse(os.path.exists(os.path.join(db_dir, SQLITE_DB_NAME)))
+        self.assertEqual(sorted(list_tables(db_dir)), sorted(tables))
+        self.assertEqual(
+            sorted(f for f in os.listdir(db_dir) if f in tables),
+            sorted(tables))
+        Scanner(backend=SQLITE_BACKEND).scan(self.workspace, 'robot', db_dir)
+        self.assertFalse([f for f in os.listdir(db_dir) if f in tables])
+        self.assertEqual(sorted(list_tables(db_dir)), sorted(tables))
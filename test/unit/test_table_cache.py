@@ -0,0 +1,65 @@
+import unittest
+import env
+import json
+import os
+import shutil
+from utils.util import TableCache, get_data_from_json, get_table_cache
+
+
+class TestTableCache(unittest.TestCase):
+
+    def setUp(self):
+        self.db_dir = os.path.join(env.RESULTS_DIR, 'table_cache')
+        if os.path.exists(self.db_dir):
+            shutil.rmtree(self.db_dir)
+        os.makedirs(self.db_dir)
+        self.table_a = self.write_table('a.json', {'keywords': {'a': 1}})
+        self.table_b = self.write_table('b.json', {'keywords': {'b': 2}})
+
+    def write_table(self, name, data, mtime=None):
+        t_path = os.path.join(self.db_dir, name)
+        with open(t_path, 'w') as f:
+            json.dump(data, f)
+        if mtime:
+            os.utime(t_path, (mtime, mtime))
+        return t_path
+
+    def test_cached_until_changed(self):
+        cache = TableCache()
+        data = cache.get(self.table_a)
+        self.assertEqual(data, {'keywords': {'a': 1}})
+        self.assertIs(cache.get(self.table_a), data)
+        self.assertEqual(cache.size, os.path.getsize(self.table_a))
+        mtime = os.path.getmtime(self.table_a) + 2
+        self.write_table('a.json', {'keywords': {'a': 3}}, mtime)
+        self.assertEqual(cache.get(self.table_a), {'keywords': {'a': 3}})
+        self.assertEqual(cache.size, os.path.getsize(self.table_a))
+
+    def test_least_recently_used_is_removed(self):
+        size_a = os.path.getsize(self.table_a)
+        size_b = os.path.getsize(self.table_b)
+        cache = TableCache(max(size_a, size_b) + min(size_a, size_b) - 1)
+        cache.get(self.table_a)
+        cache.get(self.table_b)
+        self.assertEqual(list(cache.tables), [self.table_b])
+        cache.get(self.table_a)
+        self.assertEqual(list(cache.tables), [self.table_a])
+        self.assertEqual(cache.size, size_a)
+        cache = TableCache(size_a - 1)
+        cache.get(self.table_a)
+        self.assertEqual(len(cache.tables), 0)
+        self.assertEqual(cache.size, 0)
+
+    def test_missing_table(self):
+        cache = TableCache()
+        cache.get(self.table_a)
+        os.remove(self.table_a)
+        with self.assertRaises(IOError):
+            cache.get(self.table_a)
+        self.assertNotIn(self.table_a, cache.tables)
+
+    def test_get_data_from_json_uses_shared_cache(self):
+        get_table_cache().clear()
+        data = get_data_from_json(self.table_b)
+        self.assertIs(get_data_from_json(self.table_b), data)
+        self.assertIn(self.table_b, get_table_cache().tables)
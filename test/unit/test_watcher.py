@@ -0,0 +1,92 @@
+import unittest
+import env
+import os
+import shutil
+from time import sleep
+from index_runner import index_all
+from queue.scanner import Scanner
+from queue.watcher import Watcher
+from parser_utils.file_formatter import rf_table_name
+from parser_utils.util import list_tables, normalise_path, get_index_name
+from parser_utils.symbol_table import read_index
+
+NEW_KEYWORD = '\nResource A Keyword 3\n    No Operation\n'
+
+
+class TestWatcher(unittest.TestCase):
+
+    def setUp(self):
+        base = os.path.join(env.RESULTS_DIR, 'watcher')
+        if os.path.exists(base):
+            shutil.rmtree(base)
+        self.workspace = os.path.join(base, 'workspace')
+        shutil.copytree(
+            os.path.join(env.TEST_DATA_DIR, 'suite_tree'), self.workspace)
+        self.db_dir = os.path.join(base, 'db_dir')
+        self.index_dir = os.path.join(base, 'index_dir')
+        os.makedirs(self.db_dir)
+        Scanner().scan(self.workspace, 'robot', self.db_dir)
+        index_all(self.db_dir, self.index_dir)
+        self.watcher = Watcher(
+            self.workspace, 'robot', self.db_dir, self.index_dir, settle=0)
+        self.test_a = normalise_path(
+            os.path.join(self.workspace, 'test_a.robot'))
+        self.resource_a = normalise_path(
+            os.path.join(self.workspace, 'resource_a.robot'))
+
+    def index_keywords(self, f_path):
+        index_table = os.path.join(
+            self.index_dir, get_index_name(rf_table_name(f_path)))
+        return [kw[0] for kw in read_index(index_table)['keyword']]
+
+    def write(self, f_path, text, mode='a'):
+        # Modification time must change also in file systems where
+        # the resolution is one second.
+        sleep(0.01)
+        with open(f_path, mode) as f:
+            f.write(text)
+        f_stat = os.stat(f_path)
+        os.utime(f_path, (f_stat.st_atime, f_stat.st_mtime + 2))
+
+    def test_nothing_changed(self):
+        self.assertEqual(self.watcher.start(), (set(), set()))
+        self.assertEqual(self.watcher.check(), (set(), set()))
+
+    def test_changed_file_updates_dependents(self):
+        self.watcher.start()
+        self.write(self.resource_a, NEW_KEYWORD)
+        self.assertEqual(self.watcher.check(), (set([self.resource_a]), set()))
+        self.assertIn('Resource A Keyword 3', self.index_keywords(self.test_a))
+        self.assertIn(
+            'Resource A Keyword 3', self.index_keywords(self.resource_a))
+
+    def test_new_and_removed_file(self):
+        self.watcher.start()
+        new_resource = normalise_path(
+            os.path.join(self.workspace, 'resource_c.robot'))
+        self.write(
+            new_resource,
+            '*** Keywords ***\nResource C Keyword\n    No Operation\n', 'w')
+        self.write(
+            self.test_a, '\n*** Settings ***\nResource    resource_c.robot\n')
+        changed, removed = self.watcher.check()
+        self.assertEqual(changed, set([new_resource, self.test_a]))
+        self.assertIn(rf_table_name(new_resource), list_tables(self.db_dir))
+        self.assertIn('Resource C Keyword', self.index_keywords(self.test_a))
+        os.remove(new_resource)
+        self.assertEqual(self.watcher.check(), (set(), set([new_resource])))
+        self.assertNotIn(rf_table_name(new_resource), list_tables(self.db_dir))
+        self.assertNotIn(
+            get_index_name(rf_table_name(new_resource)),
+            list_tables(self.index_dir))
+        self.assertNotIn(
+            'Resource C Keyword', self.index_keywords(self.test_a))
+
+    def test_changes_before_start(self):
+        self.write(self.resource_a, NEW_KEYWORD)
+        os.remove(os.path.join(self.workspace, 'test_b.robot'))
+        test_b = normalise_path(os.path.join(self.workspace, 'test_b.robot'))
+        self.assertEqual(
+            self.watcher.start(), (set([self.resource_a]), set([test_b])))
+        self.assertNotIn(rf_table_name(test_b), list_tables(self.db_dir))
+        self.assertIn('Resource A Keyword 3', self.index_keywords(self.test_a))
@@ -0,0 +1,121 @@
+import unittest
+import env
+import os
+import shutil
+import sys
+from time import sleep
+from worker_client import WorkerClient
+from parser_utils.util import list_tables
+
+
+class TestWorker(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db_dir = os.path.join(
+            env.RESULTS_DIR,
+            'worker',
+            'db_dir'
+        )
+        cls.index_dir = os.path.join(
+            env.RESULTS_DIR,
+            'worker',
+            'index_dir'
+        )
+        for dir_ in [cls.db_dir, cls.index_dir]:
+            while os.path.exists(dir_):
+                shutil.rmtree(dir_)
+                sleep(0.1)
+            os.makedirs(dir_)
+        cls.workspace = os.path.join(env.TEST_DATA_DIR, 'suite_tree')
+        cls.log_file = os.path.join(env.RESULTS_DIR, 'worker', 'worker.log')
+        cls.client = WorkerClient(
+            sys.executable,
+            os.path.join(env.SRC_DIR, 'run_worker.py'),
+            cls.log_file
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.stop()
+
+    def test_ping(self):
+        self.assertEqual(self.client.request('ping'), {'rc': 0})
+        process = self.client.process
+        self.assertEqual(self.client.request('ping'), {'rc': 0})
+        self.assertIs(self.client.process, process)
+
+    def test_scan_and_index(self):
+        response = self.client.request(
+            'scan_all',
+            {
+                'workspace': self.workspace,
+                'extension': 'robot',
+                'db_path': self.db_dir
+            }
+        )
+        self.assertEqual(response, {'rc': 0})
+        tables = list_tables(self.db_dir)
+        self.assertEqual(len(tables), 12)
+        response = self.client.request(
+            'index_all',
+            {'db_path': self.db_dir, 'index_path': self.index_dir}
+        )
+        self.assertEqual(response, {'rc': 0})
+        self.assertEqual(len(list_tables(self.index_dir)), 12)
+        response = self.client.request(
+            'scan_single',
+            {
+                'path_to_file': os.path.join(self.workspace, 'test_a.robot'),
+                'db_path': self.db_dir
+            }
+        )
+        self.assertEqual(response, {'rc': 0})
+        table = [t for t in tables if t.startswith('test_a.robot')][0]
+        response = self.client.request(
+            'index_single',
+            {
+                'db_path': self.db_dir,
+                'db_table': table,
+                'index_path': self.index_dir
+            }
+        )
+        self.assertEqual(response, {'rc': 0})
+        response = self.client.request(
+            'index_dependents',
+            {
+                'db_path': self.db_dir,
+                'db_table': table,
+                'index_path': self.index_dir
+            }
+        )
+        self.assertEqual(response, {'rc': 0})
+
+    def test_errors(self):
+        response = self.client.request('scan_all', {'db_path': self.db_dir})
+        self.assertEqual(response['rc'], 1)
+        self.assertIn('ValueError', response['error'])
+        response = self.client.request('not_a_command')
+        self.assertEqual(response['rc'], 1)
+        self.assertEqual(self.client.request('ping'), {'rc': 0})
+
+    def test_restart_after_worker_died(self):
+        self.assertEqual(self.client.request('ping'), {'rc': 0})
+        self.client.process.kill()
+        self.client.process.wait()
+        self.assertEqual(self.client.request('ping'), {'rc': 0})
+
+    def test_stop(self):
+        self.assertEqual(self.client.request('ping'), {'rc': 0})
+        process = self.client.process
+        self.client.stop()
+        self.assertIsNotNone(process.poll())
+        self.assertIsNone(self.client.process)
+
+    def test_restart(self):
+        self.assertEqual(self.client.request('ping'), {'rc': 0})
+        process = self.client.process
+        self.assertEqual(
+            self.client.request('ping', restart=True), {'rc': 0})
+        self.assertIsNotNone(process.poll())
+        self.assertIsNot(self.client.process, process)
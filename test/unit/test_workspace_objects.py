@@ -5,6 +5,9 @@ import shutil
 from time import sleep
 from queue.scanner import Scanner
 from workspace_objects import WorkSpaceObjects
+from parser_utils.import_catalog import ImportCatalog, IMPORT_CATALOG_NAME
+from parser_utils.file_formatter import rf_table_name
+from parser_utils.util import normalise_path
 
 
 class TestWorspaceObjects(unittest.TestCase):
@@ -50,6 +53,36 @@ class TestWorspaceObjects(unittest.TestCase):
         self.assertTrue(vars_[0][0].endswith('variables.py'))
         self.assertTrue(vars_[0][1].endswith('variables.py'))
 
+    def test_imports_without_catalog(self):
+        db_dir = os.path.join(env.RESULTS_DIR, 'workspace_objects', 'db_dir')
+        if os.path.exists(db_dir):
+            shutil.rmtree(db_dir)
+        shutil.copytree(self.db_dir, db_dir)
+        os.remove(os.path.join(db_dir, IMPORT_CATALOG_NAME))
+        objects = WorkSpaceObjects(db_dir)
+        self.assertIsNone(objects.get_catalog())
+        for import_type in ['library', 'variable_file', 'resource_file']:
+            self.assertEqual(
+                sorted(objects.get_imports(import_type)),
+                self.objects.get_imports(import_type))
+
+    def test_catalog_updated_by_scan_files(self):
+        db_dir = os.path.join(env.RESULTS_DIR, 'workspace_objects', 'scan')
+        if os.path.exists(db_dir):
+            shutil.rmtree(db_dir)
+        resource = normalise_path(os.path.join(
+            self.real_suite, 'resource', 'resource1',
+            'real_suite_resource.robot'))
+        scanner = Scanner()
+        scanner.scan_files([resource], db_dir)
+        catalog = ImportCatalog(db_dir)
+        catalog.load()
+        self.assertEqual(
+            catalog.tables[rf_table_name(resource)][0], 'resource_file')
+        scanner.remove_files([resource], db_dir)
+        catalog.load()
+        self.assertNotIn(rf_table_name(resource), catalog.tables)
+
     def test_get_imports(self):
         imports = self.objects.get_imports('library')
         self.assertEqual(len(imports), 3)